@@ -0,0 +1,90 @@
+from Engine.Algorithm.Decimal import power_of_ten
+from Engine.Algorithm.Exponentiation import power
+
+
+class InsufficientPrecision(ArithmeticError):
+    pass
+
+
+def ceiling_division(x: int, y: int) -> int:
+    return -(-x // y)
+
+
+class Ball:
+    # The interval [midpoint - radius, midpoint + radius] * 10 ** -precision.
+    # Operands of an operation share their precision, and every result
+    # encloses all values reachable from its operands
+    __slots__ = ("midpoint", "radius", "precision")
+
+    def __init__(self, midpoint: int, radius: int, precision: int):
+        self.midpoint = midpoint
+        self.radius = radius
+        self.precision = precision
+
+    def __str__(self) -> str:
+        return f"{self.midpoint}e{-self.precision} +/- {self.radius}e{-self.precision}"
+
+    @classmethod
+    def from_fraction(cls, numerator: int, denominator: int, precision: int) -> "Ball":
+        midpoint, remainder = divmod(numerator * power_of_ten(precision), denominator)
+        return cls(midpoint, 0 if remainder == 0 else 1, precision)
+
+    @classmethod
+    def from_decimal(cls, mantissa: int, exponent: int, precision: int) -> "Ball":
+        if exponent + precision >= 0:
+            return cls(mantissa * power_of_ten(exponent + precision), 0, precision)
+        return cls.from_fraction(mantissa, power_of_ten(-exponent), precision)
+
+    @property
+    def contains_zero(self) -> bool:
+        return abs(self.midpoint) <= self.radius
+
+    def round(self, precision: int) -> "Ball":
+        # The same ball at a lower precision
+        if precision == self.precision:
+            return self
+        scale = power_of_ten(self.precision - precision)
+        midpoint, remainder = divmod(self.midpoint, scale)
+        return Ball(midpoint, ceiling_division(self.radius, scale) + (remainder != 0), precision)
+
+    def add(self, other: "Ball") -> "Ball":
+        return Ball(self.midpoint + other.midpoint, self.radius + other.radius, self.precision)
+
+    def negate(self) -> "Ball":
+        return Ball(-self.midpoint, self.radius, self.precision)
+
+    def subtract(self, other: "Ball") -> "Ball":
+        return self.add(other.negate())
+
+    def absolute(self) -> "Ball":
+        if not self.contains_zero:
+            return Ball(abs(self.midpoint), self.radius, self.precision)
+        # [0, |midpoint| + radius]
+        half = ceiling_division(abs(self.midpoint) + self.radius, 2)
+        return Ball(half, half, self.precision)
+
+    def multiply(self, other: "Ball") -> "Ball":
+        scale = power_of_ten(self.precision)
+        midpoint, remainder = divmod(self.midpoint * other.midpoint, scale)
+        error = abs(self.midpoint) * other.radius + abs(other.midpoint) * self.radius + self.radius * other.radius
+        return Ball(midpoint, ceiling_division(error, scale) + (remainder != 0), self.precision)
+
+    __mul__ = multiply
+
+    def divide(self, other: "Ball") -> "Ball":
+        # |x / y - a / b| <= (|a| s + |b| r) / (|b| (|b| - s)) for x within r
+        # of a and y within s of b, while the divisor excludes zero
+        if other.contains_zero:
+            raise InsufficientPrecision
+        scale = power_of_ten(self.precision)
+        divisor = abs(other.midpoint)
+        midpoint, remainder = divmod(self.midpoint * scale, other.midpoint)
+        error = (abs(self.midpoint) * other.radius + divisor * self.radius) * scale
+        radius = ceiling_division(error, divisor * (divisor - other.radius)) + (remainder != 0)
+        return Ball(midpoint, radius, self.precision)
+
+    def power(self, n: int) -> "Ball":
+        one = Ball(power_of_ten(self.precision), 0, self.precision)
+        if n < 0:
+            return one.divide(power(self, -n, one))
+        return power(self, n, one)
@@ -0,0 +1,53 @@
+from operator import truediv
+from typing import Callable
+
+# Complex arithmetic on (real, imaginary) component pairs. Components only
+# need +, -, * and a division, so the same code serves Number, Real and
+# NumberArray
+
+
+def schoolbook_multiply(a, b, c, d) -> tuple:
+    # (a + bi)(c + di) with four multiplications
+    return a * c - b * d, a * d + b * c
+
+
+def gauss_multiply(a, b, c, d) -> tuple:
+    # (a + bi)(c + di) with three multiplications and five additions, which
+    # wins as soon as a component multiplication costs more than an addition
+    k1 = c * (a + b)
+    k2 = a * (d - c)
+    k3 = b * (c + d)
+    return k1 - k3, k1 + k2
+
+
+def gauss_square(a, b) -> tuple:
+    # (a + bi) ** 2 with two multiplications
+    ab = a * b
+    return (a + b) * (a - b), ab + ab
+
+
+def schoolbook_divide(a, b, c, d, divide: Callable = truediv) -> tuple:
+    # (a + bi) / (c + di) through c ** 2 + d ** 2
+    t = c * c + d * d
+    return divide(a * c + b * d, t), divide(b * c - a * d, t)
+
+
+def smith_divide_real_major(a, b, c, d, divide: Callable = truediv) -> tuple:
+    # Smith's division for |c| >= |d|: scaling by r = d / c, which is at most
+    # one in magnitude, never forms c ** 2 + d ** 2
+    r = divide(d, c)
+    t = c + d * r
+    return divide(a + b * r, t), divide(b - a * r, t)
+
+
+def smith_divide_imaginary_major(a, b, c, d, divide: Callable = truediv) -> tuple:
+    # Smith's division for |c| < |d|
+    r = divide(c, d)
+    t = c * r + d
+    return divide(a * r + b, t), divide(b * r - a, t)
+
+
+def smith_divide(a, b, c, d, divide: Callable = truediv) -> tuple:
+    if abs(c) >= abs(d):
+        return smith_divide_real_major(a, b, c, d, divide)
+    return smith_divide_imaginary_major(a, b, c, d, divide)
@@ -0,0 +1,131 @@
+from Engine.Algorithm.Decimal import power_of_ten
+from Engine.Algorithm.Multiplication import multiply
+
+import os
+from typing import Optional
+
+CONSTANT_GUARD_BITS = 16
+
+# A constant computed past the precision it already has grows by at least
+# half, so that slowly rising requests recompute it a logarithmic number of
+# times
+CONSTANT_GROWTH_SHIFT = 1
+
+# Path of the on disk store shared by every process, none by default
+CONSTANT_STORE_VARIABLE = "ENGINE_CONSTANT_STORE"
+
+# name -> (bits, floor(constant * 2 ** bits)) at the highest precision computed
+CONSTANTS: dict[str, tuple[int, int]] = {}
+
+
+def arctangent_inverse(m: int, bits: int) -> int:
+    # atan(1 / m) * 2 ** bits
+    m2 = m * m
+    x = (1 << bits) // m
+    y = x
+    k = 1
+    sign = 1
+    while x:
+        x //= m2
+        k += 2
+        sign = -sign
+        y += sign * (x // k)
+    return y
+
+
+def hyperbolic_arctangent_inverse(m: int, bits: int) -> int:
+    # atanh(1 / m) * 2 ** bits
+    m2 = m * m
+    x = (1 << bits) // m
+    y = x
+    k = 1
+    while x:
+        x //= m2
+        k += 2
+        y += x // k
+    return y
+
+
+def compute_pi(bits: int) -> int:
+    # Machin: pi = 16 atan(1/5) - 4 atan(1/239)
+    return 16 * arctangent_inverse(5, bits) - 4 * arctangent_inverse(239, bits)
+
+
+def compute_ln2(bits: int) -> int:
+    # ln 2 = 2 atanh(1/3)
+    return 2 * hyperbolic_arctangent_inverse(3, bits)
+
+
+COMPUTATIONS = {
+    "pi": compute_pi,
+    "ln2": compute_ln2,
+}
+
+
+class Store:
+    # The ConstantStore named by CONSTANT_STORE_VARIABLE, opened on the first
+    # constant that is not in memory
+    __slots__ = ("store", "loaded")
+
+    def __init__(self):
+        self.store = None
+        self.loaded = False
+
+    def load(self) -> Optional["ConstantStore"]:
+        if not self.loaded:
+            self.loaded = True
+            path = os.environ.get(CONSTANT_STORE_VARIABLE)
+            if path:
+                self.use(path)
+        return self.store
+
+    def use(self, path: Optional[str]) -> None:
+        from Engine.Algorithm.ConstantStore import ConstantStore
+        self.loaded = True
+        self.store = ConstantStore(path) if path else None
+
+
+STORE = Store()
+
+
+def use_constant_store(path: Optional[str]) -> None:
+    # Reads and extends constants in the file at path, or only in memory
+    # for None
+    STORE.use(path)
+
+
+def constant(name: str, bits: int) -> int:
+    # A constant computed once at some precision serves every lower one,
+    # in this process through CONSTANTS and in every other through the store
+    cached = CONSTANTS.get(name)
+    if cached is None or cached[0] < bits:
+        store = STORE.load()
+        # Only a few guard bits past the request are read from the store,
+        # however precise its record
+        stored = store.get(name, bits, bits + CONSTANT_GUARD_BITS) if store is not None else None
+        if stored is None:
+            known = max(cached[0] if cached is not None else 0, store.bits(name) if store is not None else 0)
+            working = max(bits + CONSTANT_GUARD_BITS, known + (known >> CONSTANT_GROWTH_SHIFT))
+            stored = (working, COMPUTATIONS[name](working))
+            if store is not None:
+                store.put(name, *stored)
+        cached = stored
+        CONSTANTS[name] = cached
+    return cached[1] >> (cached[0] - bits)
+
+
+def constant_number(name: str, n: int) -> "Number":
+    # The constant to n decimal digits after the point, truncated or one
+    # unit in the last place below
+    from Engine.Algorithm.Series import digits_to_bits
+    from Engine.Number import Number
+    bits = digits_to_bits(n) + CONSTANT_GUARD_BITS
+    return Number(multiply(constant(name, bits), power_of_ten(n)) >> bits, -n)
+
+
+def pi(bits: int) -> int:
+    return constant("pi", bits)
+
+
+def ln2(bits: int) -> int:
+    return constant("ln2", bits)
@@ -0,0 +1,137 @@
+import mmap
+import os
+import struct
+import zlib
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# An append only file of records (name, bits, floor(constant * 2 ** bits)),
+# mapped read only so that every process reading it shares the same pages.
+# A constant is extended by appending a record at a higher precision, the
+# older records stay valid for readers that mapped the file before. Each
+# record is written by a single write under the lock, and ends with its
+# length and a checksum, so that a record cut short by a writer that died
+# is recognized and cut off by the next process taking the lock
+CONSTANT_STORE_MAGIC = b"ECST"
+CONSTANT_STORE_VERSION = 2
+CONSTANT_STORE_HEADER = struct.Struct("<4sI")
+CONSTANT_STORE_RECORD = struct.Struct("<HQQ")
+CONSTANT_STORE_TRAILER = struct.Struct("<QI")
+
+
+class ConstantStore:
+
+    def __init__(self, path: str):
+        self.path = path
+        self._map: Optional[mmap.mmap] = None
+        self._scanned = CONSTANT_STORE_HEADER.size
+        # name -> (bits, offset, length) of the most precise record
+        self._index: dict[str, tuple[int, int, int]] = {}
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        descriptor = self._open_locked()
+        try:
+            if os.fstat(descriptor).st_size == 0:
+                os.write(descriptor, CONSTANT_STORE_HEADER.pack(CONSTANT_STORE_MAGIC, CONSTANT_STORE_VERSION))
+            else:
+                self._repair(descriptor)
+        finally:
+            os.close(descriptor)
+        self.refresh()
+
+    def _open_locked(self) -> int:
+        # The lock is released when the descriptor is closed
+        descriptor = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            fcntl.flock(descriptor, fcntl.LOCK_EX)
+        return descriptor
+
+    def _repair(self, descriptor: int) -> None:
+        # Under the lock no record is being written, so bytes past the last
+        # valid record are left by a writer that died, and are cut off so
+        # that the records appended next can be read
+        self.refresh()
+        if os.fstat(descriptor).st_size > self._scanned:
+            os.ftruncate(descriptor, self._scanned)
+
+    def refresh(self) -> None:
+        # Maps the file again when it changed size, and indexes the valid
+        # records past the ones already seen. Scanning stops at a record
+        # that is incomplete or does not match its trailer
+        size = os.path.getsize(self.path)
+        if self._map is not None and size == len(self._map):
+            return
+        with open(self.path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version = CONSTANT_STORE_HEADER.unpack_from(self._map)
+        if magic != CONSTANT_STORE_MAGIC or version != CONSTANT_STORE_VERSION:
+            raise ValueError("unsupported constant store")
+
+        size = len(self._map)
+        position = self._scanned
+        while position + CONSTANT_STORE_RECORD.size <= size:
+            name_length, bits, length = CONSTANT_STORE_RECORD.unpack_from(self._map, position)
+            offset = position + CONSTANT_STORE_RECORD.size + name_length
+            end = offset + length + CONSTANT_STORE_TRAILER.size
+            if end > size:
+                break
+            record_length, checksum = CONSTANT_STORE_TRAILER.unpack_from(self._map, offset + length)
+            if record_length != end - position or zlib.crc32(memoryview(self._map)[position:offset + length]) != checksum:
+                break
+            name = self._map[position + CONSTANT_STORE_RECORD.size:offset].decode()
+            known = self._index.get(name)
+            if known is None or known[0] < bits:
+                self._index[name] = (bits, offset, length)
+            position = end
+        self._scanned = position
+
+    def bits(self, name: str) -> int:
+        known = self._index.get(name)
+        return known[0] if known is not None else 0
+
+    def view(self, name: str, bits: int) -> Optional[tuple[int, memoryview]]:
+        # (stored bits, little endian bytes) of a record at bits or more,
+        # without copying out of the mapping
+        known = self._index.get(name)
+        if known is None or known[0] < bits:
+            self.refresh()
+            known = self._index.get(name)
+            if known is None or known[0] < bits:
+                return None
+        stored, offset, length = known
+        return stored, memoryview(self._map)[offset:offset + length]
+
+    def get(self, name: str, bits: int, wanted: Optional[int] = None) -> Optional[tuple[int, int]]:
+        # (b, floor(constant * 2 ** b)) from a record of at least bits, with
+        # b at least wanted when the record has that many. Only the most
+        # significant bytes are converted, not the whole record
+        found = self.view(name, bits)
+        if found is None:
+            return None
+        stored, data = found
+        dropped = max(stored - max(bits, wanted or 0), 0) >> 3
+        return stored - 8 * dropped, int.from_bytes(data[dropped:], "little")
+
+    def put(self, name: str, bits: int, value: int) -> None:
+        assert value >= 0
+        encoded = name.encode()
+        data = value.to_bytes((value.bit_length() + 7) >> 3, "little")
+        record = bytearray(CONSTANT_STORE_RECORD.pack(len(encoded), bits, len(data)))
+        record += encoded
+        record += data
+        record += CONSTANT_STORE_TRAILER.pack(len(record) + CONSTANT_STORE_TRAILER.size, zlib.crc32(record))
+
+        descriptor = self._open_locked()
+        try:
+            self._repair(descriptor)
+            if os.write(descriptor, record) != len(record):
+                raise OSError(f"short write to {self.path}")
+        finally:
+            os.close(descriptor)
+        self.refresh()
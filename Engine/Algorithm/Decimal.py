@@ -0,0 +1,184 @@
+from functools import lru_cache
+
+POWER_OF_TEN_CACHE_SIZE = 512
+POWER_OF_TEN_CACHE_LIMIT = 4096
+
+# floor(log10(2) * 2 ** 128)
+LOG10_2_NUMERATOR = 102435199438739363750012109250103232700
+LOG10_2_SHIFT = 128
+
+BINARY_TO_DECIMAL_GUARD_BITS = 64
+
+DIGIT_COUNT_TABLE: tuple[int, ...] = tuple(pow(10, i) for i in range(64))
+
+SQUARED_POWERS_OF_TEN: list[int] = [10]
+
+
+def squared_power_of_ten(j: int) -> int:
+    # 10 ** (2 ** j)
+    while len(SQUARED_POWERS_OF_TEN) <= j:
+        SQUARED_POWERS_OF_TEN.append(SQUARED_POWERS_OF_TEN[-1] ** 2)
+    return SQUARED_POWERS_OF_TEN[j]
+
+
+def strip_trailing_zeros(x: int) -> tuple[int, int]:
+    # Returns (y, k) such that x == y * 10 ** k and y has no trailing zeros
+    if x == 0 or x % 10 != 0:
+        return x, 0
+
+    # 10 ** k divides x only if 2 ** k does, so the trailing binary zeros
+    # bound k and give the largest square power of ten worth trying
+    bound = ((x & -x).bit_length() - 1).bit_length() - 1
+
+    k = 0
+    for j in range(bound, -1, -1):
+        y, r = divmod(x, squared_power_of_ten(j))
+        if r == 0:
+            x = y
+            k += 1 << j
+
+    return x, k
+
+
+@lru_cache(maxsize=POWER_OF_TEN_CACHE_SIZE)
+def cached_power_of_ten(k: int) -> int:
+    return pow(10, k)
+
+
+def power_of_ten(k: int) -> int:
+    # Only small powers are cached so that the cache stays bounded in memory
+    if k <= POWER_OF_TEN_CACHE_LIMIT:
+        return cached_power_of_ten(k)
+    return pow(10, k)
+
+
+@lru_cache(maxsize=POWER_OF_TEN_CACHE_SIZE)
+def cached_power_of_five(k: int) -> int:
+    return pow(5, k)
+
+
+def power_of_five(k: int) -> int:
+    if k <= POWER_OF_TEN_CACHE_LIMIT:
+        return cached_power_of_five(k)
+    return pow(5, k)
+
+
+def strip_trailing_bits(x: int) -> tuple[int, int]:
+    # Returns (y, k) such that x == y * 2 ** k and y is odd, or (0, 0)
+    if x == 0:
+        return 0, 0
+    k = (x & -x).bit_length() - 1
+    return x >> k, k
+
+
+def aligned_add(x_mantissa: int, x_exponent: int, y_mantissa: int, y_exponent: int) -> tuple[int, int]:
+    # Only the operand with the larger exponent is rescaled
+    if x_exponent == y_exponent:
+        return x_mantissa + y_mantissa, x_exponent
+    if x_mantissa == 0:
+        return y_mantissa, y_exponent
+    if y_mantissa == 0:
+        return x_mantissa, x_exponent
+    if x_exponent > y_exponent:
+        return x_mantissa * power_of_ten(x_exponent - y_exponent) + y_mantissa, y_exponent
+    return x_mantissa + y_mantissa * power_of_ten(y_exponent - x_exponent), x_exponent
+
+
+def aligned_sum(terms: list[tuple[int, int]]) -> tuple[int, int]:
+    # Terms sharing an exponent are summed first so each exponent is
+    # aligned to the minimum exactly once
+    buckets: dict[int, int] = {}
+    for mantissa, exponent in terms:
+        if mantissa:
+            buckets[exponent] = buckets.get(exponent, 0) + mantissa
+
+    if not buckets:
+        return 0, 0
+
+    minimum_exponent = min(buckets)
+    total = 0
+    for exponent, mantissa in buckets.items():
+        total += mantissa * power_of_ten(exponent - minimum_exponent)
+
+    return total, minimum_exponent
+
+
+def N(x: int) -> int:
+    # Number of decimal digits of x, exact for integers of any size
+    x = abs(x)
+    b = x.bit_length()
+    if b == 0:
+        return 1
+
+    # x lies in [2 ** (b - 1), 2 ** b), which spans at most one power of ten
+    n = ((b - 1) * LOG10_2_NUMERATOR >> LOG10_2_SHIFT) + 1
+    if n < len(DIGIT_COUNT_TABLE):
+        return n + (x >= DIGIT_COUNT_TABLE[n])
+    if n == (b * LOG10_2_NUMERATOR >> LOG10_2_SHIFT) + 1:
+        return n
+    # 10 ** n == 5 ** n << n, and the shift keeps the comparison exact
+    return n + ((x >> n) >= pow(5, n))
+
+
+def decimal_to_binary(mantissa: int, exponent: int, bits: int) -> int:
+    # floor(mantissa * 10 ** exponent * 2 ** bits)
+    if exponent >= 0:
+        return (mantissa * power_of_ten(exponent)) << bits
+    return (mantissa << bits) // power_of_ten(-exponent)
+
+
+def truncated_power(base: int, k: int, precision: int) -> tuple[int, int]:
+    # (m, e) with m * 2 ** e within a relative 2 * k.bit_length() * 2 ** -precision
+    # of base ** k, keeping m below 2 ** precision throughout
+    def trim(m: int, e: int) -> tuple[int, int]:
+        shift = m.bit_length() - precision
+        if shift > 0:
+            return m >> shift, e + shift
+        return m, e
+
+    m, e = 1, 0
+    b, be = base, 0
+    while k:
+        if k & 1:
+            m, e = trim(m * b, e + be)
+        k >>= 1
+        if k:
+            b, be = trim(b * b, 2 * be)
+    return m, e
+
+
+def scale_binary_to_decimal(x: int, bits: int, s: int, n: int) -> int:
+    # floor(x * 10 ** s / 2 ** bits), exact while the scaling stays short,
+    # otherwise carried at n digits plus guard bits
+    if abs(s) <= POWER_OF_TEN_CACHE_LIMIT and abs(bits) <= 4 * POWER_OF_TEN_CACHE_LIMIT:
+        if s >= 0:
+            x *= power_of_ten(s)
+        x = x >> bits if bits >= 0 else x << -bits
+        return x if s >= 0 else x // power_of_ten(-s)
+
+    precision = 4 * n + BINARY_TO_DECIMAL_GUARD_BITS
+    m, e = truncated_power(5, abs(s), precision)
+    if s >= 0:
+        e += s - bits
+    else:
+        m, e = (1 << 2 * precision) // m, -e - 2 * precision + s - bits
+
+    x *= m
+    return x << e if e >= 0 else x >> -e
+
+
+def binary_to_decimal(x: int, bits: int, n: int) -> tuple[int, int]:
+    # x / 2 ** bits truncated to n significant decimal digits
+    if x == 0:
+        return 0, 0
+
+    sign = -1 if x < 0 else 1
+    x = abs(x)
+
+    s = n - N(x) + (bits * LOG10_2_NUMERATOR >> LOG10_2_SHIFT)
+    while True:
+        q = scale_binary_to_decimal(x, bits, s, n)
+        d = N(q)
+        if q and d == n:
+            return sign * q, -s
+        s += n - d if q else n
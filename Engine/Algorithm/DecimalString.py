@@ -0,0 +1,91 @@
+from Engine.Algorithm.Decimal import N
+from Engine.Algorithm.Division import NEWTON_THRESHOLD, integer_reciprocal
+from Engine.Algorithm.Multiplication import multiply
+
+from typing import Callable, TextIO
+
+# Conversions between digit strings and integers split the digits in halves
+# at powers 10 ** (LEAF * 2 ** j), so that the work is in a few large
+# products and divisions, and only leaves of at most DECIMAL_LEAF_DIGITS
+# digits go through int() and str(), which are quadratic and refuse more
+# than sys.get_int_max_str_digits() digits
+DECIMAL_LEAF_DIGITS = 1024
+
+LEAF_POWERS: list[int] = [pow(10, DECIMAL_LEAF_DIGITS)]
+LEAF_RECIPROCALS: list[int] = []
+
+
+def leaf_power(j: int) -> int:
+    # 10 ** (DECIMAL_LEAF_DIGITS * 2 ** j)
+    while len(LEAF_POWERS) <= j:
+        LEAF_POWERS.append(multiply(LEAF_POWERS[-1], LEAF_POWERS[-1]))
+    return LEAF_POWERS[j]
+
+
+def leaf_reciprocal(j: int) -> int:
+    # floor(2 ** 2b / leaf_power(j)) for b the bit length of the power,
+    # enough to divide anything below its square. Every split at level j
+    # divides by the same power, so the Newton iteration runs once per level
+    while len(LEAF_RECIPROCALS) <= j:
+        power = leaf_power(len(LEAF_RECIPROCALS))
+        LEAF_RECIPROCALS.append(integer_reciprocal(power, 2 * power.bit_length()))
+    return LEAF_RECIPROCALS[j]
+
+
+def leaf_divmod(x: int, j: int) -> tuple[int, int]:
+    # divmod(x, leaf_power(j)) for 0 <= x < leaf_power(j) ** 2
+    power = leaf_power(j)
+    if power.bit_length() <= NEWTON_THRESHOLD:
+        return divmod(x, power)
+
+    # The estimate is short by at most two
+    q = multiply(x, leaf_reciprocal(j)) >> 2 * power.bit_length()
+    r = x - multiply(q, power)
+    while r >= power:
+        q += 1
+        r -= power
+    return q, r
+
+
+def split_level(digits: int) -> int:
+    # The largest j with DECIMAL_LEAF_DIGITS * 2 ** j < digits, for digits
+    # above DECIMAL_LEAF_DIGITS
+    return ((digits - 1) // DECIMAL_LEAF_DIGITS).bit_length() - 1
+
+
+def parse_digits(digits: str) -> int:
+    # int(digits) for a string of ASCII digits
+    if len(digits) <= DECIMAL_LEAF_DIGITS:
+        return int(digits)
+    j = split_level(len(digits))
+    k = DECIMAL_LEAF_DIGITS << j
+    high = parse_digits(digits[:-k])
+    low = parse_digits(digits[-k:])
+    return multiply(high, leaf_power(j)) + low
+
+
+def emit_digits(x: int, width: int, emit: Callable[[str], object]) -> None:
+    # Digits of x >= 0, most significant first, zero padded to width
+    digits = N(x)
+    if digits <= DECIMAL_LEAF_DIGITS:
+        emit(str(x).zfill(width))
+        return
+    j = split_level(digits)
+    k = DECIMAL_LEAF_DIGITS << j
+    high, low = leaf_divmod(x, j)
+    emit_digits(high, width - k, emit)
+    emit_digits(low, k, emit)
+
+
+def format_digits(x: int) -> str:
+    # str(x) without the digit limit
+    pieces = ["-"] if x < 0 else []
+    emit_digits(abs(x), 0, pieces.append)
+    return "".join(pieces)
+
+
+def write_digits(x: int, file: TextIO) -> None:
+    # Streams the digits of x to file, piece by piece
+    if x < 0:
+        file.write("-")
+    emit_digits(abs(x), 0, file.write)
@@ -0,0 +1,198 @@
+from Engine.Algorithm.Decimal import power_of_ten
+from Engine.Algorithm.Division import integer_division
+from Engine.Algorithm.Multiplication import multiply
+
+from math import isqrt, lgamma, log
+from typing import Callable, Iterator
+
+# A digit stream yields (k, floor(x * 10 ** k)) for growing k, doubling the
+# digits each step. The streams keep the state of their series between
+# steps, so that extending a prefix only sums the terms it adds
+DIGIT_STREAM_INITIAL_DIGITS = 16
+DIGIT_GUARD_DIGITS = 8
+
+# Each Chudnovsky term adds log10(151931373056000) ~ 14.18 digits
+CHUDNOVSKY_DIGITS_PER_TERM = 14
+CHUDNOVSKY_C3_OVER_24 = 10939058860032000
+
+
+def truncated_digits(approximation: Callable[[int], int], k: int) -> int:
+    # floor(x * 10 ** k) from approximations within 2 of x * 10 ** n, the
+    # guard digits settle the floor unless they sit next to a boundary
+    g = DIGIT_GUARD_DIGITS
+    while True:
+        a = approximation(k + g)
+        q, r = divmod(a, power_of_ten(g))
+        if 2 <= r <= power_of_ten(g) - 3:
+            return q
+        g *= 2
+
+
+def chudnovsky(a: int, b: int) -> tuple[int, int, int]:
+    # Binary splitting of the Chudnovsky series over terms [a, b)
+    if b == a + 1:
+        if a == 0:
+            p = q = 1
+        else:
+            p = (6 * a - 5) * (2 * a - 1) * (6 * a - 1)
+            q = a * a * a * CHUDNOVSKY_C3_OVER_24
+        t = p * (13591409 + 545140134 * a)
+        return p, q, -t if a & 1 else t
+
+    m = (a + b) // 2
+    p1, q1, t1 = chudnovsky(a, m)
+    p2, q2, t2 = chudnovsky(m, b)
+    return p1 * p2, q1 * q2, q2 * t1 + p1 * t2
+
+
+def chudnovsky_terms(n: int) -> int:
+    # Terms of the Chudnovsky series for pi * 10 ** n within 2
+    return n // CHUDNOVSKY_DIGITS_PER_TERM + 2
+
+
+def exponential_terms(n: int) -> int:
+    # Terms of the factorial series for e * 10 ** n within 2, until j!
+    # exceeds 10 ** (n + 1)
+    terms = 2
+    while lgamma(terms + 1) < (n + 1) * log(10):
+        terms *= 2
+    return terms
+
+
+class SquareRoot:
+    # isqrt(x * 10 ** 2k) for growing k. A longer root is refined from the
+    # previous one scaled up, which is already correct to its digits, by a
+    # Newton step whose quotient only has the new digits, rather than
+    # computed from scratch
+    __slots__ = ("x", "digits", "root")
+
+    def __init__(self, x: int):
+        self.x = x
+        self.digits = 0
+        self.root = isqrt(x)
+
+    def truncated(self, k: int) -> int:
+        if k > self.digits and self.x:
+            # At most doubling the digits keeps the Newton step within a
+            # few units of the root
+            while self.digits < k:
+                self.refine(min(k, 2 * self.digits + 1))
+        return self.root // power_of_ten(max(self.digits - k, 0))
+
+    def refine(self, k: int) -> None:
+        n = self.x * power_of_ten(2 * k)
+        y = self.root * power_of_ten(k - self.digits)
+        y += integer_division(n - multiply(y, y), y << 1)
+
+        # Newton from below lands at or just past the root
+        r = n - multiply(y, y)
+        while r < 0:
+            y -= 1
+            r += 2 * y + 1
+        while r > 2 * y:
+            r -= 2 * y + 1
+            y += 1
+        self.digits, self.root = k, y
+
+
+class ChudnovskySum:
+    # (P, Q, T) of the Chudnovsky series over the terms summed so far,
+    # extended by binary splitting of the new terms only
+    __slots__ = ("terms", "p", "q", "t", "root")
+
+    def __init__(self):
+        self.terms = 0
+        self.p = 1
+        self.q = 1
+        self.t = 0
+        self.root = SquareRoot(10005)
+
+    def extend(self, terms: int) -> None:
+        if terms <= self.terms:
+            return
+        p, q, t = chudnovsky(self.terms, terms)
+        self.t = multiply(q, self.t) + multiply(self.p, t)
+        self.p = multiply(self.p, p)
+        self.q = multiply(self.q, q)
+        self.terms = terms
+
+    def approximation(self, n: int) -> int:
+        # pi * 10 ** n within 2
+        self.extend(chudnovsky_terms(n))
+        return integer_division(multiply(426880 * self.root.truncated(n), self.q), self.t)
+
+
+def exponential_splitting(a: int, b: int) -> tuple[int, int]:
+    # (p, q) with p / q the sum of a! / j! for j in (a, b]
+    if b == a + 1:
+        return 1, b
+    m = (a + b) // 2
+    p1, q1 = exponential_splitting(a, m)
+    p2, q2 = exponential_splitting(m, b)
+    return p1 * q2 + p2, q1 * q2
+
+
+class ExponentialSum:
+    # (P, Q) with P / Q the sum of 1 / j! for j in (0, terms] and Q = terms!,
+    # extended by binary splitting of the new terms only
+    __slots__ = ("terms", "p", "q")
+
+    def __init__(self):
+        self.terms = 0
+        self.p = 0
+        self.q = 1
+
+    def extend(self, terms: int) -> None:
+        if terms <= self.terms:
+            return
+        p, q = exponential_splitting(self.terms, terms)
+        self.p = multiply(self.p, q) + p
+        self.q = multiply(self.q, q)
+        self.terms = terms
+
+    def approximation(self, n: int) -> int:
+        # e * 10 ** n within 2
+        self.extend(exponential_terms(n))
+        return power_of_ten(n) + integer_division(multiply(self.p, power_of_ten(n)), self.q)
+
+
+def pi_approximation(n: int) -> int:
+    return ChudnovskySum().approximation(n)
+
+
+def e_approximation(n: int) -> int:
+    return ExponentialSum().approximation(n)
+
+
+def truncated_pi(k: int) -> int:
+    return truncated_digits(pi_approximation, k)
+
+
+def truncated_e(k: int) -> int:
+    return truncated_digits(e_approximation, k)
+
+
+def digit_stream(truncated: Callable[[int], int],
+                 k: int = DIGIT_STREAM_INITIAL_DIGITS) -> Iterator[tuple[int, int]]:
+    while True:
+        yield k, truncated(k)
+        k *= 2
+
+
+def integer_digits(x: int) -> Iterator[tuple[int, int]]:
+    return digit_stream(lambda k: x * power_of_ten(k))
+
+
+def pi_digits() -> Iterator[tuple[int, int]]:
+    # The series and the square root carry over from one step to the next
+    series = ChudnovskySum()
+    return digit_stream(lambda k: truncated_digits(series.approximation, k))
+
+
+def e_digits() -> Iterator[tuple[int, int]]:
+    series = ExponentialSum()
+    return digit_stream(lambda k: truncated_digits(series.approximation, k))
+
+
+def square_root_digits(x: int) -> Iterator[tuple[int, int]]:
+    return digit_stream(SquareRoot(x).truncated)
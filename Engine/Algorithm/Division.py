@@ -1,101 +1,134 @@
-from Engine.Number import DEFAULT_PRECISION, Number, NUMBER_ZERO, NUMBER_ONE
+from Engine.Algorithm.Decimal import N, power_of_ten
+from Engine.Algorithm import Kernel
+from Engine.Algorithm.Kernel import INT64_DIGITS, int64_fits
+from Engine.Algorithm.Multiplication import multiply
 
-from numba import njit
+NEWTON_THRESHOLD = 65536
+NEWTON_GUARD_BITS = 8
 
 
-@njit
-def number_division(x: Number, y: Number, n: int = DEFAULT_PRECISION) -> Number:
-    if y == NUMBER_ZERO:
-        raise ZeroDivisionError
+def integer_reciprocal(d: int, k: int) -> int:
+    # floor(2 ** k / d) by Newton iteration, doubling the precision of a
+    # reciprocal computed from the leading bits of d
+    n = d.bit_length()
+    if k - n <= NEWTON_THRESHOLD:
+        return (1 << k) // d
 
-    if x == NUMBER_ZERO:
-        return NUMBER_ZERO
+    h = ((k - n) >> 1) + NEWTON_GUARD_BITS
+    shift = max(n - h - NEWTON_GUARD_BITS, 0)
+    truncated = (d >> shift) + 1
+    truncated_k = h + truncated.bit_length()
 
-    if x == y:
-        return NUMBER_ONE
+    x = integer_reciprocal(truncated, truncated_k) << (k - truncated_k - shift)
+    x += multiply(x, (1 << k) - multiply(d, x)) >> k
 
-    x = x.reduce()
-    y = y.reduce()
+    r = (1 << k) - multiply(d, x)
+    if r < 0 or r >= d:
+        x += r // d
+    return x
 
-    dividend = abs(x.mantissa)
-    divisor = abs(y.mantissa)
 
-    dividend_exponent = x.exponent
-    divisor_exponent = y.exponent
+def integer_division(x: int, y: int) -> int:
+    # floor(x / y) for x >= 0 and y > 0, the builtin division is linear
+    # when the divisor is short so Newton only pays off for long divisors
+    if y.bit_length() <= NEWTON_THRESHOLD or x.bit_length() - y.bit_length() <= NEWTON_THRESHOLD:
+        return x // y
 
-    dividend_sign = 1 if x.mantissa >= 0 else -1
-    divisor_sign = 1 if y.mantissa >= 0 else -1
-    sign = dividend_sign * divisor_sign
+    k = x.bit_length()
+    q = multiply(x, integer_reciprocal(y, k)) >> k
 
-    delta_exponent = 0
+    r = x - multiply(q, y)
+    if r < 0 or r >= y:
+        q += r // y
+    return q
 
-    quotient = []
-    dividend_history = []
 
-    i = 0
-    while dividend > 0:
-        i += 1
+def remove_factor(x: int, factor: int) -> tuple[int, int]:
+    # Returns (y, k) such that x == y * factor ** k and factor does not divide y
+    if x % factor != 0:
+        return x, 0
 
-        if N(dividend) < N(divisor):
-            dN = N(divisor) - N(dividend)
-            dividend *= pow(10, dN)
-            delta_exponent += dN
+    powers = [factor]
+    while x % (powers[-1] * powers[-1]) == 0:
+        powers.append(powers[-1] * powers[-1])
 
-        if dividend < divisor:
-            dividend *= 10
-            delta_exponent += 1
+    k = 0
+    for j in range(len(powers) - 1, -1, -1):
+        y, r = divmod(x, powers[j])
+        if r == 0:
+            x = y
+            k += 1 << j
 
-        quotient.append(dividend // divisor)
-        dividend -= quotient[-1] * divisor
+    return x, k
 
-        if dividend not in dividend_history:
-            dividend_history.append(dividend)
-        elif i >= n:
-            break
 
-    quotient = sum(
-        digit * pow(10, i)
-        for i, digit i enumerate(reversed(quotient))
-    )
+def decimal_division(x_mantissa: int, x_exponent: int, y_mantissa: int, y_exponent: int, n: int) -> tuple[int, int]:
+    # (m, e) with m * 10 ** e the quotient, exact when it terminates and
+    # truncated to n significant digits otherwise, y_mantissa is nonzero
+    if Kernel.WARMUP.ready() and n < INT64_DIGITS and int64_fits(x_mantissa) and int64_fits(y_mantissa) \
+            and int64_fits(x_exponent) and int64_fits(y_exponent):
+        fits, mantissa, exponent = Kernel.int64_decimal_division(x_mantissa, x_exponent, y_mantissa, y_exponent, n)
+        if fits:
+            return mantissa, exponent
 
-    return Number(
-        sign * quotient,
-        dividend_exponent - divisor_exponent - delta_exponent
-    )
+    return python_decimal_division(x_mantissa, x_exponent, y_mantissa, y_exponent, n)
 
 
-@njit
-def number_floor_division(x: Number, y: Number) -> Number:
-    if y == NUMBER_ZERO:
-        raise ZeroDivisionError
+def python_decimal_division(x_mantissa: int, x_exponent: int, y_mantissa: int, y_exponent: int,
+                            n: int) -> tuple[int, int]:
+    if x_mantissa == 0:
+        return 0, 0
 
-    if x == NUMBER_ZERO or abs(x) < abs(y):
-        return NUMBER_ZERO
+    dividend = abs(x_mantissa)
+    divisor = abs(y_mantissa)
 
-    if x == y:
-        return NUMBER_ONE
+    sign = -1 if (x_mantissa < 0) != (y_mantissa < 0) else 1
+    exponent = x_exponent - y_exponent
 
-    x = x.reduce()
-    y = y.reduce()
+    # The quotient is a terminating decimal exactly when the divisor, with
+    # its factors of 2 and 5 removed, divides the dividend
+    twos = (divisor & -divisor).bit_length() - 1
+    remainder_divisor, fives = remove_factor(divisor >> twos, 5)
+    quotient, remainder = divmod(dividend, remainder_divisor)
 
-    dividend = abs(x.mantissa)
-    divisor = abs(y.mantissa)
+    if remainder == 0:
+        k = max(twos, fives)
+        return sign * quotient * pow(2, k - twos) * pow(5, k - fives), exponent - k
 
-    dividend_exponent = x.exponent
-    divisor_exponent = y.exponent
+    # Otherwise the expansion is periodic and is truncated to n digits
+    s = n - N(dividend) + N(divisor)
+    if s >= 0:
+        quotient = integer_division(dividend * power_of_ten(s), divisor)
+    else:
+        quotient = integer_division(dividend, divisor * power_of_ten(-s))
 
-    dividend_sign = 1 if x.mantissa >= 0 else -1
-    divisor_sign = 1 if y.mantissa >= 0 else -1
-    sign = dividend_sign * divisor_sign
+    if quotient >= power_of_ten(n):
+        quotient //= 10
+        s -= 1
 
-    minimum_exponent = min(dividend_exponent, divisor_exponent)
+    return sign * quotient, exponent - s
 
-    dividend *= pow(10, dividend_exponent - minimum_exponent)
-    divisor *= pow(10, divisor_exponent - minimum_exponent)
 
-    quotient = dividend // divisor
+def decimal_floor_division(x_mantissa: int, x_exponent: int, y_mantissa: int, y_exponent: int) -> int:
+    # The quotient truncated towards zero, y_mantissa is nonzero
+    if Kernel.WARMUP.ready() and int64_fits(x_mantissa) and int64_fits(y_mantissa) \
+            and int64_fits(x_exponent) and int64_fits(y_exponent):
+        fits, quotient = Kernel.int64_floor_division(x_mantissa, x_exponent, y_mantissa, y_exponent)
+        if fits:
+            return quotient
 
-    return Number(
-        sign * quotient,
-        minimum_exponent
-    )
+    return python_floor_division(x_mantissa, x_exponent, y_mantissa, y_exponent)
+
+
+def python_floor_division(x_mantissa: int, x_exponent: int, y_mantissa: int, y_exponent: int) -> int:
+    dividend = abs(x_mantissa)
+    divisor = abs(y_mantissa)
+
+    sign = -1 if (x_mantissa < 0) != (y_mantissa < 0) else 1
+
+    minimum_exponent = min(x_exponent, y_exponent)
+
+    dividend *= power_of_ten(x_exponent - minimum_exponent)
+    divisor *= power_of_ten(y_exponent - minimum_exponent)
+
+    return sign * integer_division(dividend, divisor)
@@ -0,0 +1,60 @@
+# Byte level pieces of the serialization format: LEB128 varints, zigzag
+# signed varints and two's complement integers prefixed by their length.
+# Readers take the buffer and a position and return the value with the
+# position past it, and raise IndexError when the buffer ends before it
+
+
+def write_varint(buffer: bytearray, n: int) -> None:
+    # n >= 0, seven bits per byte, low bits first
+    while n > 0x7F:
+        buffer.append((n & 0x7F) | 0x80)
+        n >>= 7
+    buffer.append(n)
+
+
+def read_varint(data, position: int) -> tuple[int, int]:
+    n = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, position
+        shift += 7
+
+
+def write_signed_varint(buffer: bytearray, n: int) -> None:
+    # Zigzag, so that small negative numbers stay short
+    write_varint(buffer, (n << 1) if n >= 0 else (-n << 1) - 1)
+
+
+def read_signed_varint(data, position: int) -> tuple[int, int]:
+    n, position = read_varint(data, position)
+    return (n >> 1) if not n & 1 else -((n + 1) >> 1), position
+
+
+def integer_length(x: int) -> int:
+    # Bytes of the shortest two's complement form, none for zero
+    if x == 0:
+        return 0
+    return ((x if x > 0 else ~x).bit_length() >> 3) + 1
+
+
+def write_integer(buffer: bytearray, x: int) -> None:
+    length = integer_length(x)
+    write_varint(buffer, length)
+    buffer += x.to_bytes(length, "little", signed=True)
+
+
+def read_bytes(data, position: int, length: int) -> tuple[object, int]:
+    end = position + length
+    if end > len(data):
+        raise IndexError("truncated data")
+    return data[position:end], end
+
+
+def read_integer(data, position: int) -> tuple[int, int]:
+    length, position = read_varint(data, position)
+    data, position = read_bytes(data, position, length)
+    return int.from_bytes(data, "little", signed=True), position
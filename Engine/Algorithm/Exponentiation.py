@@ -1,43 +1,317 @@
-from typing import Optional
+import mmap
+import os
+import struct
+from functools import lru_cache
+from typing import Callable, Optional
+
+CHAIN_TABLE_PATH = os.path.join(os.path.dirname(__file__), "chains.bin")
+CHAIN_TABLE_MAGIC = b"ACHN"
+CHAIN_TABLE_VERSION = 1
+CHAIN_TABLE_HEADER = struct.Struct("<4sII")
+CHAIN_TABLE_OFFSET = struct.Struct("<I")
+CHAIN_TABLE_LIMIT = 2048
+
+
+def encode_chain(chain: tuple[int, ...]) -> bytes:
+    # A star chain is fixed by the index of the element added to the last
+    # one at every step, which takes a byte per multiplication
+    return bytes(chain.index(chain[i] - chain[i - 1]) for i in range(1, len(chain)))
+
+
+def decode_chain(encoded: bytes) -> tuple[int, ...]:
+    chain = [1]
+    for j in encoded:
+        chain.append(chain[-1] + chain[j])
+    return tuple(chain)
+
+
+class ChainTable:
+
+    def __init__(self, path: str = CHAIN_TABLE_PATH):
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, limit = CHAIN_TABLE_HEADER.unpack_from(self._map)
+        if magic != CHAIN_TABLE_MAGIC or version != CHAIN_TABLE_VERSION:
+            raise ValueError("unsupported chain table")
+        self.limit: int = limit
+
+    def _offset(self, i: int) -> int:
+        position = CHAIN_TABLE_HEADER.size + CHAIN_TABLE_OFFSET.size * i
+        return CHAIN_TABLE_OFFSET.unpack_from(self._map, position)[0]
+
+    def chain(self, n: int) -> Optional[tuple[int, ...]]:
+        if not 1 <= n <= self.limit:
+            return None
+        return decode_chain(self._map[self._offset(n - 1):self._offset(n)])
+
+    @staticmethod
+    def write(path: str, chains: list[tuple[int, ...]]) -> None:
+        # chains[i] is the chain for i + 1, offsets point past the header
+        # and the limit + 1 offsets themselves
+        encoded = [encode_chain(chain) for chain in chains]
+        offset = CHAIN_TABLE_HEADER.size + CHAIN_TABLE_OFFSET.size * (len(chains) + 1)
+        offsets = [offset]
+        for chain in encoded:
+            offset += len(chain)
+            offsets.append(offset)
+
+        with open(path, "wb") as file:
+            file.write(CHAIN_TABLE_HEADER.pack(CHAIN_TABLE_MAGIC, CHAIN_TABLE_VERSION, len(chains)))
+            for offset in offsets:
+                file.write(CHAIN_TABLE_OFFSET.pack(offset))
+            for chain in encoded:
+                file.write(chain)
 
 
 class EfficientExponentiation:
 
-    def __init__(self, step_limit: Optional[int] = None):
+    def __init__(self, step_limit: Optional[int] = None, table: Optional[ChainTable] = None):
         initial_chain: tuple[int, ...] = (1,)
         self._min_mult_chain: dict[int, tuple[int, ...]] = {1: initial_chain}
-        self._cached_chains: set[tuple[int, ...]] = {initial_chain}
-        self._step: int = 0
         self._step_limit = step_limit
+        self._table = table
+
+    @staticmethod
+    def _lower_bound(n: int) -> int:
+        # l(n) >= lambda(n) + 1 when n has two one bits, + 2 from three on
+        ones = bin(n).count("1")
+        return n.bit_length() - 1 + min(ones - 1, 2)
+
+    def _search(self, n: int, steps: int) -> Optional[tuple[int, ...]]:
+        # Depth first over star chains, each step adds an earlier element to
+        # the last one. A branch is cut as soon as doubling every remaining
+        # step cannot reach n
+        chain = [1]
+
+        def extend(remaining: int) -> bool:
+            last = chain[-1]
+            if last == n:
+                return True
+            if remaining == 0 or last << remaining < n:
+                return False
+            if remaining == 1:
+                if n - last in chain:
+                    chain.append(n)
+                    return True
+                return False
 
-    def _compute_next_step(self) -> None:
-        if self._step_limit is not None and self._step >= self._step_limit:
-            raise ValueError("step limit")
-        self._step += 1
-        new_chains = set()
-        for chain in self._cached_chains:
-            right_summand = chain[-1]
-            for left_summand in chain:
-                new_computed_val = left_summand + right_summand
-                new_computed = chain + (new_computed_val,)
-                new_chains.add(new_computed)
-                self._min_mult_chain.setdefault(new_computed_val, new_computed)
-        self._cached_chains = new_chains
-
-    def _step_until_n_computed(self, n: int) -> None:
+            for j in range(len(chain) - 1, -1, -1):
+                value = last + chain[j]
+                if value > n:
+                    continue
+                if value << (remaining - 1) < n:
+                    break
+                chain.append(value)
+                if extend(remaining - 1):
+                    return True
+                chain.pop()
+            return False
+
+        if extend(steps):
+            return tuple(chain)
+        return None
+
+    def _iterative_deepening(self, n: int) -> tuple[int, ...]:
+        steps = self._lower_bound(n)
+        while True:
+            if self._step_limit is not None and steps > self._step_limit:
+                raise ValueError("step limit")
+            chain = self._search(n, steps)
+            if chain is not None:
+                return chain
+            steps += 1
+
+    def minimal_multiplication_chain(self, n: int) -> tuple[int, ...]:
         if n <= 0:
             raise ValueError("n must be positive")
-        while n not in self._min_mult_chain:
-            self._compute_next_step()
 
-    def minimal_multiplication_chain(self, n: int) -> tuple[int, ...]:
-        self._step_until_n_computed(n)
-        return self._min_mult_chain[n]
+        chain = self._min_mult_chain.get(n)
+        if chain is None and self._table is not None:
+            chain = self._table.chain(n)
+        if chain is None:
+            chain = self._iterative_deepening(n)
+        self._min_mult_chain[n] = chain
+        return chain
 
     def minimum_multiplications(self, n: int) -> int:
         return len(self.minimal_multiplication_chain(n)) - 1
 
 
+def build_chain_table(limit: int = CHAIN_TABLE_LIMIT, path: str = CHAIN_TABLE_PATH) -> None:
+    exp = EfficientExponentiation()
+    ChainTable.write(path, [exp.minimal_multiplication_chain(n) for n in range(1, limit + 1)])
+
+
+def load_chain_table(path: str = CHAIN_TABLE_PATH) -> Optional[ChainTable]:
+    try:
+        return ChainTable(path)
+    except (OSError, ValueError):
+        return None
+
+
+ADDITION_CHAIN_SEARCH_LIMIT = 64
+SLIDING_WINDOW_THRESHOLD = 128
+
+CHAIN_TABLE = load_chain_table()
+ADDITION_CHAINS = EfficientExponentiation(table=CHAIN_TABLE)
+ADDITION_CHAIN_LIMIT = CHAIN_TABLE.limit if CHAIN_TABLE is not None else ADDITION_CHAIN_SEARCH_LIMIT
+
+
+def binary_power(x, n: int):
+    # Left to right square and multiply
+    y = x
+    for bit in bin(n)[3:]:
+        y = y * y
+        if bit == "1":
+            y = y * x
+    return y
+
+
+def sliding_window_power(x, n: int, window: Optional[int] = None):
+    if window is None:
+        window = max(1, n.bit_length().bit_length() - 4)
+
+    # Odd powers x, x ** 3, ..., x ** (2 ** window - 1)
+    x2 = x * x
+    odd_powers = [x]
+    for _ in range((1 << (window - 1)) - 1):
+        odd_powers.append(odd_powers[-1] * x2)
+
+    bits = bin(n)[2:]
+    y = None
+    i = 0
+    while i < len(bits):
+        if bits[i] == "0":
+            y = y * y
+            i += 1
+            continue
+
+        # Longest window starting here that ends in a one bit
+        j = min(i + window, len(bits))
+        while bits[j - 1] == "0":
+            j -= 1
+        value = int(bits[i:j], 2)
+
+        if y is None:
+            y = odd_powers[value >> 1]
+        else:
+            for _ in range(j - i):
+                y = y * y
+            y = y * odd_powers[value >> 1]
+        i = j
+    return y
+
+
+def addition_chain_power(x, chain: tuple[int, ...]):
+    powers = {1: x}
+    for i in range(1, len(chain)):
+        a = chain[i]
+        for b in chain[:i]:
+            if a - b in powers:
+                powers[a] = powers[b] * powers[a - b]
+                break
+    return powers[chain[-1]]
+
+
+POWER_FUNCTION_CACHE_SIZE = 256
+POWER_REGISTERS = ("x", "y", "z", "w", "v", "u")
+
+
+def chain_operands(chain: tuple[int, ...]) -> list[tuple[int, int]]:
+    # For every step i, indices (j, k) with chain[i] == chain[j] + chain[k],
+    # preferring the previous element so star steps stay star steps
+    positions = {a: i for i, a in enumerate(chain)}
+    operands = []
+    for i in range(1, len(chain)):
+        for k in range(i - 1, -1, -1):
+            j = positions.get(chain[i] - chain[k])
+            if j is not None and j < i:
+                operands.append((j, k))
+                break
+    return operands
+
+
+def generate_power_source(chain: tuple[int, ...], name: str) -> str:
+    # Straight-line code for x ** chain[-1]. A register is released after
+    # the last step reading it, and a step reuses one of its own operand
+    # registers in place when that operand dies there, as in
+    # pow_15_minimal_fewest_temp_vars
+    operands = chain_operands(chain)
+
+    last_use = {0: 0}
+    for i, (j, k) in enumerate(operands, start=1):
+        last_use[j] = last_use[k] = i
+    last_use[len(chain) - 1] = len(chain)
+
+    registers = {0: POWER_REGISTERS[0]}
+    free: list[str] = []
+    used = 1
+
+    lines = [
+        f"def {name}(x):",
+        f"    # ({' '.join(str(a) for a in chain)})",
+    ]
+    for i, (j, k) in enumerate(operands, start=1):
+        left, right = registers[j], registers[k]
+        for operand in {j, k}:
+            if last_use[operand] == i:
+                free.append(registers[operand])
+
+        if left in free:
+            target = left
+        elif right in free:
+            target = right
+        elif free:
+            target = min(free)
+        else:
+            target = POWER_REGISTERS[used] if used < len(POWER_REGISTERS) else f"r{used}"
+            used += 1
+            free.append(target)
+        free.remove(target)
+        registers[i] = target
+
+        if target == left:
+            lines.append(f"    {target} *= {right}  # x{chain[i]}")
+        elif target == right:
+            lines.append(f"    {target} *= {left}  # x{chain[i]}")
+        else:
+            lines.append(f"    {target} = {left} * {right}  # x{chain[i]}")
+
+    lines.append(f"    return {registers[len(chain) - 1]}")
+    return "\n".join(lines) + "\n"
+
+
+@lru_cache(maxsize=POWER_FUNCTION_CACHE_SIZE)
+def power_function(n: int) -> Callable:
+    # Compiled straight-line kernel for x ** n, n >= 1
+    name = f"pow_{n}"
+    source = generate_power_source(ADDITION_CHAINS.minimal_multiplication_chain(n), name)
+    namespace: dict = {}
+    exec(compile(source, f"<{name}>", "exec"), namespace)
+    return namespace[name]
+
+
+def power(x, n: int, one=None):
+    # x ** n for any x with an associative *, picking the strategy by the
+    # size of n: tabulated optimal addition chains, binary or sliding window
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if type(x) is int:
+        # Builtin pow is as fast or faster than the kernels on integers, so
+        # the mantissas of Number and the integer types never reach them.
+        # The kernels serve Complex and ComplexArray
+        return pow(x, n)
+    if n == 0:
+        if one is None:
+            raise ValueError("x ** 0 needs a multiplicative identity")
+        return one
+    if n <= ADDITION_CHAIN_LIMIT:
+        return power_function(n)(x)
+    if n.bit_length() < SLIDING_WINDOW_THRESHOLD:
+        return binary_power(x, n)
+    return sliding_window_power(x, n)
+
+
 def pow_15_naive(x):
     # x ** 15
     # (1 2 3 4 5 6 7 8 9 10 11 12 13 14 15)
@@ -80,12 +354,18 @@ def main():
     import time
     start = time.perf_counter()
     end = 300
-    exp = EfficientExponentiation(step_limit=11)
+    exp = EfficientExponentiation()
     for i in range(1, end + 1):
         print(exp.minimal_multiplication_chain(i))
     print(sum(exp.minimum_multiplications(i) for i in range(1, end + 1)))
     elapsed = time.perf_counter() - start
-    print(f"finished in {elapsed:.02f}s")
+    print(f"searched in {elapsed:.02f}s")
+
+    start = time.perf_counter()
+    exp = EfficientExponentiation(table=load_chain_table())
+    print(sum(exp.minimum_multiplications(i) for i in range(1, CHAIN_TABLE_LIMIT + 1)))
+    elapsed = time.perf_counter() - start
+    print(f"read {CHAIN_TABLE_LIMIT} chains from the table in {elapsed:.02f}s")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,44 @@
+from Engine.Algorithm.Division import remove_factor
+
+from math import gcd as lehmer_gcd
+
+
+def gcd(x: int, y: int) -> int:
+    # Common factors of two come out with shifts, and an operand left with
+    # no odd part ends the search; the odd parts go to math.gcd, which runs
+    # Lehmer's algorithm in C
+    x = abs(x)
+    y = abs(y)
+    if x == 0:
+        return y
+    if y == 0:
+        return x
+
+    x_twos = (x & -x).bit_length() - 1
+    y_twos = (y & -y).bit_length() - 1
+    twos = min(x_twos, y_twos)
+
+    x >>= x_twos
+    y >>= y_twos
+    if x == 1 or y == 1:
+        return 1 << twos
+    return lehmer_gcd(x, y) << twos
+
+
+def decimal_gcd(x: int, k: int) -> int:
+    # gcd(x, 10 ** k) without building 10 ** k, from the factors of two and
+    # five of x
+    x = abs(x)
+    if x == 0:
+        return pow(10, k)
+
+    twos = min((x & -x).bit_length() - 1, k)
+    _, fives = remove_factor(x >> twos, 5)
+    return pow(5, min(fives, k)) << twos
+
+
+def reduce_fraction(numerator: int, denominator: int) -> tuple[int, int]:
+    g = gcd(numerator, denominator)
+    if g == 1:
+        return numerator, denominator
+    return numerator // g, denominator // g
@@ -0,0 +1,42 @@
+from typing import Optional
+
+INTERNING_MINIMUM = -256
+INTERNING_MAXIMUM = 1024
+
+# Integral values in range have at most this many trailing zeros
+SMALL_POWERS_OF_TEN = (1, 10, 100, 1000)
+
+
+class InterningCache:
+
+    def __init__(self, minimum: int = INTERNING_MINIMUM, maximum: int = INTERNING_MAXIMUM):
+        self._minimum = minimum
+        self._maximum = maximum
+        self._values: list = [None] * (maximum - minimum + 1)
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def index(self, mantissa: int, exponent: int) -> Optional[int]:
+        if mantissa == 0:
+            return -self._minimum
+        if 0 <= exponent < len(SMALL_POWERS_OF_TEN):
+            value = mantissa * SMALL_POWERS_OF_TEN[exponent]
+            if self._minimum <= value <= self._maximum:
+                return value - self._minimum
+        return None
+
+    def get(self, index: int):
+        value = self._values[index]
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, index: int, value) -> None:
+        self._values[index] = value
+
+    def clear(self) -> None:
+        self._values = [None] * (self._maximum - self._minimum + 1)
+        self.hits = 0
+        self.misses = 0
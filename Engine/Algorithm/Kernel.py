@@ -0,0 +1,271 @@
+# Kernels compiled in nopython mode over int64 mantissas and exponents.
+# Each one reports whether its result fit, the callers fall back to the
+# Python integer implementation otherwise. numba is only imported, and the
+# kernels compiled, when a kernel is first needed
+
+INT64_MAXIMUM = (1 << 63) - 1
+INT64_DIGITS = 18
+INT64_POWERS_OF_TEN = tuple(pow(10, i) for i in range(INT64_DIGITS + 1))
+
+# 20! is the largest factorial below 2 ** 63
+INT64_FACTORIAL_LIMIT = 20
+
+# Importing numba and loading the kernels costs about half a second, which
+# the scalar kernels save back over roughly this many calls
+KERNEL_WARMUP_CALLS = 100_000
+
+KERNELS: list["LazyKernel"] = []
+
+
+class LazyKernel:
+    __slots__ = ("function", "dispatcher")
+
+    def __init__(self, function):
+        self.function = function
+        self.dispatcher = None
+        KERNELS.append(self)
+
+    def __call__(self, *args):
+        if self.dispatcher is None:
+            compile_kernels()
+        return self.dispatcher(*args)
+
+
+def kernel(function) -> LazyKernel:
+    return LazyKernel(function)
+
+
+class Warmup:
+    __slots__ = ("calls", "threshold", "compiled", "available")
+
+    def __init__(self, threshold: int):
+        self.calls = 0
+        self.threshold = threshold
+        self.compiled = False
+        # False once importing numba has failed, which is not retried
+        self.available = True
+
+    def ready(self) -> bool:
+        # Scalar callers ask before each kernel call and stay on Python
+        # integers until enough calls have gone by, or for good when the
+        # kernels cannot be compiled
+        if self.compiled:
+            return True
+        if not self.available:
+            return False
+        self.calls += 1
+        if self.calls < self.threshold:
+            return False
+        compile_kernels()
+        return self.compiled
+
+
+def compile_kernels() -> None:
+    # Kernels call each other through the module globals, so every one is
+    # swapped for its dispatcher before numba resolves any of them. Without
+    # numba the kernels run as the Python functions they are written as, and
+    # scalar callers stay on Python integers
+    try:
+        from numba import njit
+    except ImportError:
+        for lazy in KERNELS:
+            lazy.dispatcher = lazy.function
+        WARMUP.available = False
+        return
+
+    for lazy in KERNELS:
+        lazy.dispatcher = njit(cache=True)(lazy.function)
+        globals()[lazy.function.__name__] = lazy.dispatcher
+    WARMUP.compiled = True
+
+
+WARMUP = Warmup(KERNEL_WARMUP_CALLS)
+
+
+def int64_fits(x: int) -> bool:
+    # The minimum is excluded so that abs and negation never overflow
+    return -INT64_MAXIMUM <= x <= INT64_MAXIMUM
+
+
+@kernel
+def int64_digits(x: int) -> int:
+    n = 1
+    while n <= INT64_DIGITS and x >= INT64_POWERS_OF_TEN[n]:
+        n += 1
+    return n
+
+
+@kernel
+def int64_scale(x: int, k: int) -> tuple[bool, int]:
+    # x * 10 ** k for k >= 0
+    if k > INT64_DIGITS or abs(x) > INT64_MAXIMUM // INT64_POWERS_OF_TEN[k]:
+        return False, 0
+    return True, x * INT64_POWERS_OF_TEN[k]
+
+
+@kernel
+def int64_sign(x: int) -> int:
+    return 1 if x > 0 else (-1 if x < 0 else 0)
+
+
+@kernel
+def int64_factorial(n: int) -> int:
+    y = 1
+    for i in range(2, n + 1):
+        y *= i
+    return y
+
+
+@kernel
+def int64_decimal_division(x_mantissa: int, x_exponent: int, y_mantissa: int, y_exponent: int,
+                           n: int) -> tuple[bool, int, int]:
+    # Same quotient as Division.decimal_division
+    if x_mantissa == 0:
+        return True, 0, 0
+    if n >= INT64_DIGITS:
+        return False, 0, 0
+
+    dividend = abs(x_mantissa)
+    divisor = abs(y_mantissa)
+
+    sign = -1 if (x_mantissa < 0) != (y_mantissa < 0) else 1
+    exponent = x_exponent - y_exponent
+
+    remainder_divisor = divisor
+    twos = 0
+    while remainder_divisor % 2 == 0:
+        remainder_divisor //= 2
+        twos += 1
+    fives = 0
+    while remainder_divisor % 5 == 0:
+        remainder_divisor //= 5
+        fives += 1
+
+    if dividend % remainder_divisor == 0:
+        quotient = dividend // remainder_divisor
+        k = max(twos, fives)
+        for _ in range(k - twos):
+            if quotient > INT64_MAXIMUM // 2:
+                return False, 0, 0
+            quotient *= 2
+        for _ in range(k - fives):
+            if quotient > INT64_MAXIMUM // 5:
+                return False, 0, 0
+            quotient *= 5
+        return True, sign * quotient, exponent - k
+
+    # floor(dividend * 10 ** s / divisor) by long division, one digit per
+    # step, so the remainder times ten is the widest intermediate
+    s = n - int64_digits(dividend) + int64_digits(divisor)
+    if s >= 0:
+        if divisor > INT64_MAXIMUM // 10:
+            return False, 0, 0
+        quotient = dividend // divisor
+        remainder = dividend % divisor
+        for _ in range(s):
+            remainder *= 10
+            quotient = quotient * 10 + remainder // divisor
+            remainder %= divisor
+    else:
+        quotient = dividend // INT64_POWERS_OF_TEN[-s] // divisor
+
+    if quotient >= INT64_POWERS_OF_TEN[n]:
+        quotient //= 10
+        s -= 1
+
+    return True, sign * quotient, exponent - s
+
+
+@kernel
+def int64_floor_division(x_mantissa: int, x_exponent: int, y_mantissa: int, y_exponent: int) -> tuple[bool, int]:
+    dividend = abs(x_mantissa)
+    divisor = abs(y_mantissa)
+
+    sign = -1 if (x_mantissa < 0) != (y_mantissa < 0) else 1
+
+    minimum_exponent = min(x_exponent, y_exponent)
+
+    fits, dividend = int64_scale(dividend, x_exponent - minimum_exponent)
+    if not fits:
+        return False, 0
+    fits, divisor = int64_scale(divisor, y_exponent - minimum_exponent)
+    if not fits:
+        return False, 0
+
+    return True, sign * (dividend // divisor)
+
+
+@kernel
+def int64_canonical(mantissas: "numpy.ndarray", exponents: "numpy.ndarray") -> None:
+    # Number.__new__ normalization, in place
+    for i in range(mantissas.shape[0]):
+        m = mantissas[i]
+        if m == 0:
+            exponents[i] = 0
+            continue
+        while m % 10 == 0:
+            m //= 10
+            exponents[i] += 1
+        mantissas[i] = m
+
+
+@kernel
+def int64_aligned(x_mantissa: int, x_exponent: int, y_mantissa: int, y_exponent: int) -> tuple[bool, int, int, int]:
+    # Zeros take the exponent of the other operand so they never force a rescale
+    if x_mantissa == 0:
+        x_exponent = y_exponent
+    if y_mantissa == 0:
+        y_exponent = x_exponent
+
+    if x_exponent > y_exponent:
+        fits, x_mantissa = int64_scale(x_mantissa, x_exponent - y_exponent)
+        return fits, x_mantissa, y_mantissa, y_exponent
+    fits, y_mantissa = int64_scale(y_mantissa, y_exponent - x_exponent)
+    return fits, x_mantissa, y_mantissa, x_exponent
+
+
+@kernel
+def int64_add_array(x_mantissas: "numpy.ndarray", x_exponents: "numpy.ndarray",
+                    y_mantissas: "numpy.ndarray", y_exponents: "numpy.ndarray",
+                    mantissas: "numpy.ndarray", exponents: "numpy.ndarray") -> bool:
+    for i in range(mantissas.shape[0]):
+        fits, x, y, exponent = int64_aligned(x_mantissas[i], x_exponents[i], y_mantissas[i], y_exponents[i])
+        if not fits:
+            return False
+        s = x + y
+        # Two's complement overflow flips the sign away from both operands
+        if ((x ^ s) & (y ^ s)) < 0 or s == -INT64_MAXIMUM - 1:
+            return False
+        mantissas[i] = s
+        exponents[i] = exponent
+    return True
+
+
+@kernel
+def int64_lower_array(x_mantissas: "numpy.ndarray", x_exponents: "numpy.ndarray",
+                      y_mantissas: "numpy.ndarray", y_exponents: "numpy.ndarray",
+                      lower: "numpy.ndarray") -> bool:
+    for i in range(lower.shape[0]):
+        x_sign = int64_sign(x_mantissas[i])
+        y_sign = int64_sign(y_mantissas[i])
+        if x_sign != y_sign:
+            lower[i] = x_sign < y_sign
+            continue
+        fits, x, y, _ = int64_aligned(x_mantissas[i], x_exponents[i], y_mantissas[i], y_exponents[i])
+        if not fits:
+            return False
+        lower[i] = x < y
+    return True
+
+
+@kernel
+def int64_division_array(x_mantissas: "numpy.ndarray", x_exponents: "numpy.ndarray",
+                         y_mantissas: "numpy.ndarray", y_exponents: "numpy.ndarray", n: int,
+                         mantissas: "numpy.ndarray", exponents: "numpy.ndarray") -> bool:
+    for i in range(mantissas.shape[0]):
+        fits, m, e = int64_decimal_division(x_mantissas[i], x_exponents[i], y_mantissas[i], y_exponents[i], n)
+        if not fits:
+            return False
+        mantissas[i] = m
+        exponents[i] = e
+    return True
@@ -0,0 +1,203 @@
+# Integer multiplication backends picked by operand size. CPython's int
+# product is Karatsuba at best, gmpy2 is used when it is installed, and a
+# Schönhage-Strassen style transform takes over for huge operands. The
+# thresholds come from Engine.Benchmark.Multiplication and are in bits of the
+# shorter operand, since an unbalanced product costs little more than the
+# short operand's chunks
+from typing import Callable, Optional
+
+GMPY2_THRESHOLD_BITS = 2048
+FERMAT_THRESHOLD_BITS = 1 << 20
+
+# Products whose shorter operand is below every threshold go straight to int
+NATIVE_THRESHOLD_BITS = min(GMPY2_THRESHOLD_BITS, FERMAT_THRESHOLD_BITS)
+
+
+def native_multiply(x: int, y: int) -> int:
+    return x * y
+
+
+class Gmpy2:
+    # gmpy2 is imported on the first product large enough to want it, and
+    # only once whether or not it is installed
+    __slots__ = ("module", "loaded")
+
+    def __init__(self):
+        self.module = None
+        self.loaded = False
+
+    def load(self) -> Optional[object]:
+        if not self.loaded:
+            self.loaded = True
+            try:
+                import gmpy2
+                self.module = gmpy2
+            except ImportError:
+                self.module = None
+        return self.module
+
+
+GMPY2 = Gmpy2()
+
+
+def gmpy2_multiply(x: int, y: int) -> int:
+    gmpy2 = GMPY2.load()
+    if gmpy2 is None:
+        return x * y
+    return int(gmpy2.mpz(x) * gmpy2.mpz(y))
+
+
+def fermat_reduce(v: int, n: int, mask: int) -> int:
+    # v mod 2 ** n + 1 for 0 <= v < 2 ** 2n, since 2 ** n == -1
+    v = (v & mask) - (v >> n)
+    if v < 0:
+        v += mask + 2
+    return v
+
+
+def fermat_shift(v: int, s: int, n: int, mask: int) -> int:
+    # v * 2 ** s mod 2 ** n + 1 for 0 <= s < 2n
+    if s >= n:
+        v = fermat_reduce(v << (s - n), n, mask)
+        return mask + 2 - v if v else 0
+    return fermat_reduce(v << s, n, mask)
+
+
+def fermat_parameters(bits: int) -> tuple[int, int, int]:
+    # (k, m, n) for a product of bits bits: 2 ** k slots for pieces of m
+    # bits, m a whole number of bytes, few enough pieces that the product's
+    # convolution does not wrap, and coefficients mod 2 ** n + 1 with room
+    # for a sum of 2 ** k products of two pieces. 2 ** k divides 2n, so that
+    # 2 ** (2n / 2 ** k) is a root of unity of order 2 ** k
+    k = max((bits.bit_length() + 1) // 2, 4)
+    size = 1 << k
+    m = -(-bits // (size - 2))
+    m = -(-m // 8) * 8
+    n = 2 * m + k + 1
+    unit = size >> 1
+    n = -(-n // unit) * unit
+    return k, m, n
+
+
+def fermat_split(x: int, m: int, size: int) -> list[int]:
+    # size pieces of m bits, through bytes so that splitting is linear
+    step = m >> 3
+    data = x.to_bytes(step * size, "little")
+    return [int.from_bytes(data[i:i + step], "little") for i in range(0, step * size, step)]
+
+
+def fermat_transform(a: list[int], size: int, root: int, n: int, mask: int) -> None:
+    # In place, decimation in frequency, the output is in bit reversed order.
+    # root is the exponent of two of the root of unity
+    half = size >> 1
+    while half:
+        step = root * (size // (2 * half))
+        for start in range(0, size, 2 * half):
+            for j in range(start, start + half):
+                u = a[j]
+                v = a[j + half]
+                w = u + v
+                a[j] = w - mask - 2 if w > mask + 1 else w
+                d = u - v
+                if d < 0:
+                    d += mask + 2
+                a[j + half] = fermat_shift(d, step * (j - start), n, mask) if d and j > start else d
+        half >>= 1
+
+
+def fermat_inverse_transform(a: list[int], size: int, root: int, n: int, mask: int) -> None:
+    # In place, decimation in time from bit reversed order back to natural
+    # order, the inverse root being 2 ** (2n - root)
+    half = 1
+    while half < size:
+        step = root * (size // (2 * half))
+        for start in range(0, size, 2 * half):
+            for j in range(start, start + half):
+                u = a[j]
+                v = a[j + half]
+                if v and j > start:
+                    v = fermat_shift(v, 2 * n - step * (j - start), n, mask)
+                w = u + v
+                a[j] = w - mask - 2 if w > mask + 1 else w
+                d = u - v
+                a[j + half] = d + mask + 2 if d < 0 else d
+        half <<= 1
+
+
+def fermat_combine(coefficients: list[int], m: int) -> int:
+    # Sum of coefficients[i] * 2 ** (i m), pairing neighbours so that every
+    # addition is between operands of similar size
+    shift = m
+    while len(coefficients) > 1:
+        if len(coefficients) & 1:
+            coefficients.append(0)
+        coefficients = [
+            coefficients[i] + (coefficients[i + 1] << shift)
+            for i in range(0, len(coefficients), 2)
+        ]
+        shift <<= 1
+    return coefficients[0]
+
+
+def fermat_multiply(x: int, y: int) -> int:
+    # x * y for x, y >= 0, as a cyclic convolution of 2 ** k pieces long
+    # enough that it does not wrap, transformed mod 2 ** n + 1 where the
+    # twiddle factors are shifts. The pointwise products recurse through
+    # multiply
+    k, m, n = fermat_parameters(x.bit_length() + y.bit_length())
+    size = 1 << k
+    mask = (1 << n) - 1
+    root = 2 * n >> k
+
+    a = fermat_split(x, m, size)
+    b = fermat_split(y, m, size)
+    fermat_transform(a, size, root, n, mask)
+    fermat_transform(b, size, root, n, mask)
+    c = [fermat_reduce(multiply(u, v), n, mask) if u and v else 0 for u, v in zip(a, b)]
+    fermat_inverse_transform(c, size, root, n, mask)
+
+    # Division by 2 ** k is a shift by 2n - k, and coefficients are below
+    # 2 ** n, so they need no sign correction
+    return fermat_combine([fermat_shift(v, 2 * n - k, n, mask) if v else 0 for v in c], m)
+
+
+# (threshold in bits, backend) in order of preference, the first backend
+# whose threshold the shorter operand reaches is used. GMP has its own FFT,
+# so gmpy2 takes every size it is faster at when installed
+BACKENDS: list[tuple[int, Callable[[int, int], int]]] = [
+    (GMPY2_THRESHOLD_BITS, gmpy2_multiply),
+    (FERMAT_THRESHOLD_BITS, fermat_multiply),
+    (0, native_multiply),
+]
+
+
+def register_backend(threshold_bits: int, backend: Callable[[int, int], int]) -> None:
+    # Preferred over the backends registered before it
+    global NATIVE_THRESHOLD_BITS
+    BACKENDS.insert(0, (threshold_bits, backend))
+    NATIVE_THRESHOLD_BITS = min(NATIVE_THRESHOLD_BITS, threshold_bits)
+
+
+def backend(bits: int) -> Callable[[int, int], int]:
+    for threshold, candidate in BACKENDS:
+        if bits < threshold:
+            continue
+        if candidate is gmpy2_multiply and GMPY2.load() is None:
+            continue
+        return candidate
+    return native_multiply
+
+
+def multiply(x: int, y: int) -> int:
+    # Called for every Number product, so short operands return before
+    # anything else is looked at
+    x_bits = x.bit_length()
+    if x_bits < NATIVE_THRESHOLD_BITS:
+        return x * y
+    y_bits = y.bit_length()
+    if y_bits < NATIVE_THRESHOLD_BITS:
+        return x * y
+
+    negative = (x < 0) != (y < 0)
+    z = backend(min(x_bits, y_bits))(abs(x), abs(y))
+    return -z if negative else z
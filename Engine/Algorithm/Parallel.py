@@ -0,0 +1,255 @@
+# Splits product trees, factorials and series sums across worker processes.
+# Off unless a worker count is set, through use_parallel or the
+# ENGINE_WORKERS variable. Work only leaves the process when the operands
+# are large enough for the products to outweigh the transfers, and integers
+# travel as the length prefixed two's complement bytes of Encoding
+from Engine.Algorithm.Encoding import read_integer, read_varint, write_integer, write_varint
+from Engine.Algorithm.Multiplication import multiply
+
+import math
+import os
+from typing import Optional
+
+PARALLEL_WORKERS_VARIABLE = "ENGINE_WORKERS"
+
+# Product trees go parallel from this many bits in total, in chunks of at
+# least PARALLEL_CHUNK_BITS
+PARALLEL_PRODUCT_BITS = 1 << 22
+PARALLEL_CHUNK_BITS = 1 << 20
+
+PARALLEL_FACTORIAL_THRESHOLD = 1 << 16
+
+# Series go parallel from this many bits of precision, in blocks of at
+# least PARALLEL_BLOCK_TERMS terms
+PARALLEL_SERIES_BITS = 1 << 15
+PARALLEL_BLOCK_TERMS = 64
+
+
+class Executor:
+    # The pool is started on the first call that is large enough to use it
+    __slots__ = ("pool", "workers", "loaded")
+
+    def __init__(self):
+        self.pool = None
+        self.workers = 1
+        self.loaded = False
+
+    def load(self) -> Optional["ProcessPoolExecutor"]:
+        if not self.loaded:
+            self.loaded = True
+            workers = os.environ.get(PARALLEL_WORKERS_VARIABLE)
+            if workers:
+                self.use(int(workers))
+        return self.pool
+
+    def use(self, workers: Optional[int]) -> None:
+        # concurrent.futures is only imported once workers are asked for
+        from concurrent.futures import ProcessPoolExecutor
+        self.loaded = True
+        if self.pool is not None:
+            self.pool.shutdown()
+        self.workers = workers if workers and workers > 1 else 1
+        self.pool = ProcessPoolExecutor(self.workers, initializer=disable_parallel) if self.workers > 1 else None
+
+
+EXECUTOR = Executor()
+
+
+def use_parallel(workers: Optional[int]) -> None:
+    # None or 1 runs everything in this process
+    EXECUTOR.use(workers)
+
+
+def disable_parallel() -> None:
+    # Workers run their share serially instead of starting pools of their own
+    EXECUTOR.loaded = True
+    EXECUTOR.pool = None
+    EXECUTOR.workers = 1
+
+
+def encode_integers(values: list[int]) -> bytes:
+    buffer = bytearray()
+    write_varint(buffer, len(values))
+    for value in values:
+        write_integer(buffer, value)
+    return bytes(buffer)
+
+
+def decode_integers(data: bytes) -> list[int]:
+    count, position = read_varint(data, 0)
+    values = []
+    for _ in range(count):
+        value, position = read_integer(data, position)
+        values.append(value)
+    return values
+
+
+def encode_integer(x: int) -> bytes:
+    buffer = bytearray()
+    write_integer(buffer, x)
+    return bytes(buffer)
+
+
+def decode_integer(data: bytes) -> int:
+    return read_integer(data, 0)[0]
+
+
+def chunk_product(data: bytes) -> bytes:
+    from Engine.Algorithm.Product import product_tree
+    return encode_integer(product_tree(decode_integers(data)))
+
+
+def pair_product(x: bytes, y: bytes) -> bytes:
+    return encode_integer(multiply(decode_integer(x), decode_integer(y)))
+
+
+def swing_product(m: int) -> bytes:
+    from Engine.Algorithm.Product import primes_up_to, swing
+    return encode_integer(swing(m, primes_up_to(m)))
+
+
+def combine(pool: "ProcessPoolExecutor", partials: list[bytes]) -> int:
+    # Pairs neighbours in the workers while there is more than one pair,
+    # the last product is made here rather than sent back and forth
+    while len(partials) > 2:
+        paired = list(pool.map(pair_product, partials[0:len(partials) - 1:2], partials[1::2]))
+        if len(partials) % 2:
+            paired.append(partials[-1])
+        partials = paired
+    values = [decode_integer(x) for x in partials]
+    return multiply(values[0], values[1]) if len(values) == 2 else values[0]
+
+
+def parallel_product_tree(values: list[int]) -> Optional[int]:
+    # None when the product is too small to be worth the workers
+    pool = EXECUTOR.load()
+    if pool is None:
+        return None
+    sizes = [abs(x).bit_length() for x in values]
+    total = sum(sizes)
+    chunks = min(EXECUTOR.workers, total // PARALLEL_CHUNK_BITS)
+    if total < PARALLEL_PRODUCT_BITS or chunks < 2:
+        return None
+
+    # Contiguous chunks of about the same number of bits
+    pieces = []
+    start = 0
+    covered = 0
+    for i, size in enumerate(sizes):
+        covered += size
+        if covered * chunks >= total * (len(pieces) + 1) and len(pieces) < chunks - 1:
+            pieces.append(encode_integers(values[start:i + 1]))
+            start = i + 1
+    pieces.append(encode_integers(values[start:]))
+    return combine(pool, list(pool.map(chunk_product, pieces)))
+
+
+def parallel_factorial(n: int) -> Optional[int]:
+    # The prime swing recursion n! = ((n // 2)!) ** 2 * swing(n) needs the
+    # swings of n, n // 2, n // 4, ..., which do not depend on each other.
+    # The workers make them, largest first, and the squarings follow here
+    from Engine.Algorithm.Product import PRODUCT_LEAF_SIZE, range_product
+    if n < PARALLEL_FACTORIAL_THRESHOLD:
+        return None
+    pool = EXECUTOR.load()
+    if pool is None:
+        return None
+
+    levels = []
+    m = n
+    while m >= PRODUCT_LEAF_SIZE:
+        levels.append(m)
+        m //= 2
+    swings = list(pool.map(swing_product, levels))
+
+    y = range_product(2, m + 1)
+    for data in reversed(swings):
+        y = multiply(multiply(y, y), decode_integer(data))
+    return y
+
+
+SERIES_STEPS = {
+    # kind -> (power of the first term, powers per term, alternating)
+    "exp": (0, 1, False),
+    "sin": (1, 2, True),
+    "cos": (0, 2, True),
+}
+
+
+def fixed_power(r: int, p: int, bits: int) -> int:
+    # (r / 2 ** bits) ** p * 2 ** bits by square and multiply
+    y = 1 << bits
+    x = abs(r)
+    for bit in bin(p)[2:]:
+        y = multiply(y, y) >> bits
+        if bit == "1":
+            y = multiply(y, x) >> bits
+    return -y if r < 0 and p & 1 else y
+
+
+def series_terms(kind: str, r: int, bits: int) -> int:
+    # Estimated number of terms before they vanish at this precision, from
+    # the logarithm of each term, none for arguments too large to estimate
+    first, step, _ = SERIES_STEPS[kind]
+    if r == 0 or r.bit_length() > bits + 64:
+        return 0
+    log_x = math.log2(abs(r)) - bits
+    size = bits + log_x * first
+    p = first
+    terms = 1
+    while size > 0:
+        size += log_x * step
+        for k in range(p + 1, p + step + 1):
+            size -= math.log2(k)
+        p += step
+        terms += 1
+    return terms
+
+
+def series_block(kind: str, r_data: bytes, bits: int, index: int, count: Optional[int]) -> bytes:
+    # Sum of count terms from term index on, or of every term until they
+    # vanish for None. The first term is made directly from a power and a
+    # factorial, the others by the recurrence of the serial series
+    from Engine.Algorithm.Product import factorial
+    first, step, alternating = SERIES_STEPS[kind]
+    r = decode_integer(r_data)
+    p = first + step * index
+    term = fixed_power(r, p, bits) // factorial(p)
+    if alternating and index & 1:
+        term = -term
+    factor = r if step == 1 else multiply(r, r) >> bits
+
+    y = 0
+    while term and count != 0:
+        y += term
+        if alternating:
+            term = -(multiply(term, factor) >> bits) // ((p + 1) * (p + 2))
+        else:
+            term = (multiply(term, factor) >> bits) // (p + 1)
+        p += step
+        if count is not None:
+            count -= 1
+    return encode_integer(y)
+
+
+def parallel_series(kind: str, r: int, bits: int) -> Optional[int]:
+    # sum of the series of kind at r / 2 ** bits, times 2 ** bits, in blocks
+    # of consecutive terms, or None when there are too few terms
+    pool = EXECUTOR.load()
+    if pool is None:
+        return None
+    terms = series_terms(kind, r, bits)
+    blocks = min(EXECUTOR.workers, terms // PARALLEL_BLOCK_TERMS)
+    if blocks < 2:
+        return None
+
+    # The estimate may be a term short, so the last block runs until the
+    # terms vanish
+    r_data = encode_integer(r)
+    size = -(-terms // blocks)
+    indices = list(range(0, terms, size))
+    counts = [size] * (len(indices) - 1) + [None]
+    sums = pool.map(
+        series_block, [kind] * len(indices), [r_data] * len(indices), [bits] * len(indices), indices, counts
+    )
+    return sum(decode_integer(data) for data in sums)
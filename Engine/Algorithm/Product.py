@@ -0,0 +1,125 @@
+from Engine.Algorithm.Multiplication import multiply
+from Engine.Algorithm.Parallel import parallel_factorial, parallel_product_tree
+
+from collections import OrderedDict
+
+PRODUCT_LEAF_SIZE = 16
+PRIME_SWING_THRESHOLD = 2048
+FACTORIAL_CACHE_SIZE = 64
+
+
+def product_tree(values: list[int]) -> int:
+    # Multiplies neighbours pairwise so operands stay balanced in size
+    if not values:
+        return 1
+    if len(values) > 2:
+        y = parallel_product_tree(values)
+        if y is not None:
+            return y
+    while len(values) > 1:
+        paired = [multiply(values[i], values[i + 1]) for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
+def range_product(start: int, stop: int, step: int = 1) -> int:
+    # Product of range(start, stop, step) by binary splitting
+    n = len(range(start, stop, step))
+    if n <= PRODUCT_LEAF_SIZE:
+        y = 1
+        for i in range(start, stop, step):
+            y *= i
+        return y
+
+    middle = start + (n // 2) * step
+    return multiply(range_product(start, middle, step), range_product(middle, stop, step))
+
+
+def primes_up_to(n: int) -> list[int]:
+    if n < 2:
+        return []
+    sieve = bytearray([1]) * (n + 1)
+    sieve[0] = sieve[1] = 0
+    for p in range(2, int(n ** 0.5) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, n + 1, p)))
+    return [p for p in range(2, n + 1) if sieve[p]]
+
+
+def swing(n: int, primes: list[int]) -> int:
+    # n! / ((n // 2)! ** 2), whose prime exponents are the parities of
+    # the digits of n written in base p
+    factors = []
+    for p in primes:
+        if p > n:
+            break
+        q, e = n, 0
+        while q:
+            q //= p
+            e += q & 1
+        if e:
+            factors.append(p if e == 1 else p ** e)
+    return product_tree(factors)
+
+
+def prime_swing_factorial(n: int) -> int:
+    primes = primes_up_to(n)
+
+    def recurse(m: int) -> int:
+        if m < PRODUCT_LEAF_SIZE:
+            return range_product(2, m + 1)
+        half = recurse(m // 2)
+        return multiply(multiply(half, half), swing(m, primes))
+
+    return recurse(n)
+
+
+def binary_splitting_factorial(n: int) -> int:
+    return range_product(2, n + 1)
+
+
+class FactorialCache:
+
+    def __init__(self, size: int = FACTORIAL_CACHE_SIZE):
+        self._size = size
+        self._factorials: OrderedDict[int, int] = OrderedDict()
+
+    def _nearest_below(self, n: int) -> int:
+        return max((m for m in self._factorials if m <= n), default=-1)
+
+    def factorial(self, n: int) -> int:
+        if n < 0:
+            raise ValueError("n must be non-negative")
+
+        if n in self._factorials:
+            self._factorials.move_to_end(n)
+            return self._factorials[n]
+
+        # Series ask for (2i + 1)! right after (2i - 1)!, so extending a
+        # recent factorial is usually a handful of small multiplications
+        m = self._nearest_below(n)
+        if m >= 0 and n - m < PRIME_SWING_THRESHOLD:
+            y = multiply(self._factorials[m], range_product(m + 1, n + 1))
+        elif n >= PRIME_SWING_THRESHOLD:
+            y = parallel_factorial(n)
+            if y is None:
+                y = prime_swing_factorial(n)
+        else:
+            y = binary_splitting_factorial(n)
+
+        self._factorials[n] = y
+        if len(self._factorials) > self._size:
+            self._factorials.popitem(last=False)
+        return y
+
+    def clear(self) -> None:
+        self._factorials.clear()
+
+
+FACTORIAL_CACHE = FactorialCache()
+
+
+def factorial(n: int) -> int:
+    return FACTORIAL_CACHE.factorial(n)
@@ -0,0 +1,138 @@
+from Engine.Algorithm.Constant import ln2, pi
+from Engine.Algorithm.Decimal import N, binary_to_decimal, decimal_to_binary
+from Engine.Algorithm.Parallel import PARALLEL_SERIES_BITS, parallel_series
+
+SERIES_GUARD_BITS = 24
+
+# floor(log2(10) * 2 ** 10) + 1, an upper bound on the bits per decimal digit
+BITS_PER_DIGIT_NUMERATOR = 3402
+BITS_PER_DIGIT_SHIFT = 10
+
+
+def digits_to_bits(n: int) -> int:
+    return (n * BITS_PER_DIGIT_NUMERATOR >> BITS_PER_DIGIT_SHIFT) + 1
+
+
+def sin_series(r: int, bits: int) -> int:
+    # sin(r / 2 ** bits) * 2 ** bits, each term is the previous one times
+    # -r ** 2 / ((k + 1)(k + 2)), summed until it vanishes at this precision
+    if bits >= PARALLEL_SERIES_BITS:
+        y = parallel_series("sin", r, bits)
+        if y is not None:
+            return y
+    r2 = (r * r) >> bits
+    term = r
+    y = r
+    k = 1
+    while term:
+        term = -((term * r2) >> bits) // ((k + 1) * (k + 2))
+        y += term
+        k += 2
+    return y
+
+
+def cos_series(r: int, bits: int) -> int:
+    # cos(r / 2 ** bits) * 2 ** bits
+    if bits >= PARALLEL_SERIES_BITS:
+        y = parallel_series("cos", r, bits)
+        if y is not None:
+            return y
+    r2 = (r * r) >> bits
+    term = 1 << bits
+    y = term
+    k = 0
+    while term:
+        term = -((term * r2) >> bits) // ((k + 1) * (k + 2))
+        y += term
+        k += 2
+    return y
+
+
+def exp_series(r: int, bits: int) -> int:
+    # exp(r / 2 ** bits) * 2 ** bits
+    if bits >= PARALLEL_SERIES_BITS:
+        y = parallel_series("exp", r, bits)
+        if y is not None:
+            return y
+    term = 1 << bits
+    y = term
+    k = 1
+    while term:
+        term = ((term * r) >> bits) // k
+        y += term
+        k += 1
+    return y
+
+
+def integer_bits(mantissa: int, exponent: int) -> int:
+    # Bits needed for the integer part of mantissa * 10 ** exponent
+    return digits_to_bits(max(N(mantissa) + exponent, 0))
+
+
+def reduce_angle(mantissa: int, exponent: int, bits: int) -> int:
+    # mantissa * 10 ** exponent modulo 2 pi, in [-pi, pi] at bits of precision
+    extra = integer_bits(mantissa, exponent) + SERIES_GUARD_BITS
+    working = bits + extra
+
+    x = decimal_to_binary(mantissa, exponent, working)
+    two_pi = pi(working) << 1
+    k = (x + (two_pi >> 1)) // two_pi
+
+    return (x - k * two_pi) >> extra
+
+
+def sin_fixed_point(mantissa: int, exponent: int, bits: int) -> int:
+    r = reduce_angle(mantissa, exponent, bits)
+    half_pi = pi(bits) >> 1
+    if r > half_pi:
+        r = pi(bits) - r
+    elif r < -half_pi:
+        r = -pi(bits) - r
+    return sin_series(r, bits)
+
+
+def cos_fixed_point(mantissa: int, exponent: int, bits: int) -> int:
+    r = reduce_angle(mantissa, exponent, bits)
+    half_pi = pi(bits) >> 1
+    if r > half_pi:
+        return -cos_series(pi(bits) - r, bits)
+    elif r < -half_pi:
+        return -cos_series(pi(bits) + r, bits)
+    return cos_series(r, bits)
+
+
+def relative_precision(function, mantissa: int, exponent: int, n: int) -> tuple[int, int]:
+    # Raises the working precision until the result carries n significant
+    # digits, which matters close to the zeros of sin and cos
+    target = digits_to_bits(n) + SERIES_GUARD_BITS
+    bits = target + digits_to_bits(max(-(N(mantissa) + exponent), 0))
+    while True:
+        y = function(mantissa, exponent, bits)
+        deficit = target - abs(y).bit_length()
+        if deficit <= 0:
+            return binary_to_decimal(y, bits, n)
+        bits += deficit
+
+
+def sine(mantissa: int, exponent: int, n: int) -> tuple[int, int]:
+    if mantissa == 0:
+        return 0, 0
+    return relative_precision(sin_fixed_point, mantissa, exponent, n)
+
+
+def cosine(mantissa: int, exponent: int, n: int) -> tuple[int, int]:
+    return relative_precision(cos_fixed_point, mantissa, exponent, n)
+
+
+def exponential(mantissa: int, exponent: int, n: int) -> tuple[int, int]:
+    # exp(x) = 2 ** k * exp(r) with |r| <= ln(2) / 2
+    bits = digits_to_bits(n) + SERIES_GUARD_BITS
+    extra = integer_bits(mantissa, exponent) + SERIES_GUARD_BITS
+    working = bits + extra
+
+    x = decimal_to_binary(mantissa, exponent, working)
+    log_two = ln2(working)
+    k = (x + (log_two >> 1)) // log_two
+    r = (x - k * log_two) >> extra
+
+    return binary_to_decimal(exp_series(r, bits), bits - k, n)
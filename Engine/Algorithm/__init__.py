@@ -0,0 +1,15 @@
+import importlib
+
+# Loaded on first access through __getattr__, Kernel in turn defers numba
+# until a kernel is needed
+SUBMODULES = (
+    "Ball", "ComplexArithmetic", "Constant", "ConstantStore", "Decimal", "DecimalString", "DigitStream",
+    "Division", "Encoding", "Exponentiation", "GCD", "Interning", "Kernel", "Multiplication", "Parallel",
+    "Product", "Series"
+)
+
+
+def __getattr__(name: str):
+    if name in SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,55 @@
+import random
+import time
+
+
+def legacy_add(x, y):
+    # The pairwise add Number used before aligned_add, rescaling both operands
+    from Engine.Number import Number
+    minimun_exponent = min(x.exponent, y.exponent)
+    return Number(
+        (x.mantissa * pow(10, x.exponent - minimun_exponent)) +
+        (y.mantissa * pow(10, y.exponent - minimun_exponent)),
+        minimun_exponent
+    )
+
+
+def mixed_scale_terms(n: int) -> list:
+    from Engine.Number import Number
+    return [
+        Number(random.randrange(1, 10 ** 20), -random.randrange(0, 2000))
+        for _ in range(n)
+    ]
+
+
+def main():
+    from Engine.Number import Number, NUMBER_ZERO
+
+    random.seed(0)
+    for n in (100, 1_000, 10_000):
+        terms = mixed_scale_terms(n)
+
+        start = time.perf_counter()
+        y = NUMBER_ZERO
+        for x in terms:
+            y = legacy_add(y, x)
+        legacy = time.perf_counter() - start
+
+        start = time.perf_counter()
+        z = NUMBER_ZERO
+        for x in terms:
+            z = z.add(x)
+        pairwise = time.perf_counter() - start
+
+        start = time.perf_counter()
+        w = Number.sum(terms)
+        nary = time.perf_counter() - start
+
+        assert y == z == w
+        print(
+            f"{n} terms: legacy add {legacy:.04f}s, "
+            f"aligned add {pairwise:.04f}s, Number.sum {nary:.04f}s"
+        )
+
+
+if __name__ == '__main__':
+    main()
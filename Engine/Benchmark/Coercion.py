@@ -0,0 +1,34 @@
+import time
+
+
+def main():
+    from Engine.Number import Number
+
+    x = Number(3, -2)
+    repeat = 200_000
+
+    # The same additions without a coercion, against which the cost of
+    # upgrading the int is read
+    operands = [Number(i, 0) for i in range(repeat)]
+    start = time.perf_counter()
+    for y in operands:
+        x + y
+    same = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(repeat):
+        x + i
+    registry = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(repeat):
+        x < i
+    comparison = time.perf_counter() - start
+
+    print(f"Number + Number: {repeat / same:.0f} ops/s")
+    print(f"Number + int: {repeat / registry:.0f} ops/s")
+    print(f"Number < int: {repeat / comparison:.0f} ops/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+import random
+import time
+from contextlib import contextmanager
+
+
+@contextmanager
+def counted(cls, name: str):
+    # Counts calls to cls.name, however they are reached
+    method = getattr(cls, name)
+    calls = [0]
+
+    def wrapper(*args, **kwargs):
+        calls[0] += 1
+        return method(*args, **kwargs)
+
+    setattr(cls, name, wrapper)
+    try:
+        yield calls
+    finally:
+        setattr(cls, name, method)
+
+
+def main():
+    from Engine.Algorithm.Ball import Ball
+    from Engine.Algorithm.ComplexArithmetic import (
+        gauss_multiply, schoolbook_divide, schoolbook_multiply, smith_divide
+    )
+    from Engine.Number import Number
+    from Engine.Number.Complex import Complex
+    from Engine.Number.ComplexArray import ComplexArray
+    from Engine.Number.Irrational import Irrational
+    from Engine.Number.Real import Real
+
+    random.seed(0)
+
+    # Number components: the multiplications dominate once mantissas are long
+    for digits in (100, 10_000, 100_000):
+        operands = [Number(random.randrange(10 ** (digits - 1), 10 ** digits), 0) for _ in range(4)]
+        for name, function in (("schoolbook", schoolbook_multiply), ("Gauss", gauss_multiply)):
+            with counted(Number, "multiply") as calls:
+                start = time.perf_counter()
+                for _ in range(10):
+                    function(*operands)
+                elapsed = time.perf_counter() - start
+            print(f"{digits} digit {name} multiply: {calls[0] // 10} Number.multiply, {elapsed / 10:.06f}s")
+
+        for name, function in (("schoolbook", schoolbook_divide), ("Smith", smith_divide)):
+            with counted(Number, "multiply") as calls:
+                start = time.perf_counter()
+                function(*operands)
+                elapsed = time.perf_counter() - start
+            print(f"{digits} digit {name} divide: {calls[0]} Number.multiply, {elapsed:.06f}s")
+
+    # Real components: the count is of ball multiplications at evaluation
+    def operand(k: int) -> Real:
+        return Real.from_irrational(Irrational.square_root(k))
+
+    for n in (100, 10_000):
+        for name, function in (("schoolbook", schoolbook_multiply), ("Gauss", gauss_multiply)):
+            # Expression nodes keep the Ball method they were built with
+            with counted(Ball, "multiply") as calls:
+                start = time.perf_counter()
+                z = Complex.from_components(*function(operand(2), operand(3), operand(5), operand(7)))
+                z.real.approximate(n)
+                z.imaginary.value.approximate(n)
+                elapsed = time.perf_counter() - start
+            print(f"{n} digits of a Real {name} product: {calls[0]} Ball.multiply, {elapsed:.04f}s")
+
+    with counted(Ball, "multiply") as calls:
+        start = time.perf_counter()
+        z = Complex.from_components(operand(2), operand(3))
+        (z ** Complex.from_python_integer(15)).real.approximate(1_000)
+        elapsed = time.perf_counter() - start
+    print(f"1000 digits of z ** 15: {calls[0]} Ball.multiply, {elapsed:.04f}s")
+
+    # Batches: one array operation per component operation
+    size = 100_000
+    x = [Number(random.randrange(-10 ** 6, 10 ** 6), random.randrange(-4, 4)) for _ in range(2 * size)]
+    y = [Number(random.randrange(-10 ** 6, 10 ** 6), random.randrange(-4, 4)) or Number(1, 0) for _ in range(2 * size)]
+    xs = ComplexArray.from_numbers(x[:size], x[size:])
+    ys = ComplexArray.from_numbers(y[:size], y[size:])
+
+    start = time.perf_counter()
+    for a, b, c, d in zip(x[:size], x[size:], y[:size], y[size:]):
+        gauss_multiply(a, b, c, d)
+    loop = time.perf_counter() - start
+    start = time.perf_counter()
+    xs * ys
+    batch = time.perf_counter() - start
+    print(f"{size} products: Number loop {loop:.04f}s, ComplexArray {batch:.04f}s")
+
+    start = time.perf_counter()
+    for a, b, c, d in zip(x[:size], x[size:], y[:size], y[size:]):
+        smith_divide(a, b, c, d)
+    loop = time.perf_counter() - start
+    start = time.perf_counter()
+    xs / ys
+    batch = time.perf_counter() - start
+    print(f"{size} quotients: Number loop {loop:.04f}s, ComplexArray {batch:.04f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+import tempfile
+
+# Times pi in a fresh process, so that nothing is cached in memory
+PROBE = (
+    "import time\n"
+    "from Engine.Algorithm.Constant import pi\n"
+    "start = time.perf_counter()\n"
+    "pi({bits})\n"
+    "print(time.perf_counter() - start)\n"
+)
+
+
+def fresh_process(bits: int, path: str = "") -> float:
+    environment = dict(os.environ, ENGINE_CONSTANT_STORE=path)
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(bits=bits)], env=environment, capture_output=True, text=True, check=True
+    )
+    return float(output.stdout)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "constants.bin")
+        for k in (10_000, 30_000, 100_000):
+            bits = k * 3402 // 1024 + 1
+            computed = fresh_process(bits)
+            # The first process with a store computes and appends, the next
+            # one maps the record
+            filled = fresh_process(bits, path)
+            mapped = fresh_process(bits, path)
+            print(
+                f"pi at {k} digits: computed {computed:.04f}s, "
+                f"computed and stored {filled:.04f}s, mapped {mapped:.06f}s"
+            )
+        print(f"store size: {os.path.getsize(path)} bytes")
+
+
+if __name__ == '__main__':
+    main()
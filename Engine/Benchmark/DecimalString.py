@@ -0,0 +1,51 @@
+import os
+import random
+import sys
+import time
+
+
+def main():
+    from Engine.Algorithm.DecimalString import format_digits, parse_digits
+    from Engine.Number import Number
+
+    random.seed(0)
+    limit = sys.get_int_max_str_digits()
+    for n in (10_000, 100_000, 1_000_000):
+        digits = str(random.randrange(1, 10)) + "".join(random.choices("0123456789", k=n - 1))
+
+        start = time.perf_counter()
+        x = parse_digits(digits)
+        parse = time.perf_counter() - start
+        start = time.perf_counter()
+        format_digits(x)
+        format = time.perf_counter() - start
+
+        # The builtins, with the digit limit lifted for the comparison
+        sys.set_int_max_str_digits(0)
+        start = time.perf_counter()
+        int(digits)
+        builtin_parse = time.perf_counter() - start
+        start = time.perf_counter()
+        str(x)
+        builtin_format = time.perf_counter() - start
+        sys.set_int_max_str_digits(limit)
+
+        print(
+            f"{n} digits: parse {parse:.04f}s (int {builtin_parse:.04f}s), "
+            f"format {format:.04f}s (str {builtin_format:.04f}s)"
+        )
+
+    # Streaming never holds the digits as one string, the time is the same
+    number = Number(x, -5)
+    with open(os.devnull, "w") as file:
+        start = time.perf_counter()
+        file.write(str(number))
+        joined = time.perf_counter() - start
+        start = time.perf_counter()
+        number.write(file)
+        streamed = time.perf_counter() - start
+    print(f"writing {n} digits: {joined:.04f}s as a string, {streamed:.04f}s streamed")
+
+
+if __name__ == '__main__':
+    main()
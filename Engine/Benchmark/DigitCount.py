@@ -0,0 +1,54 @@
+import random
+import time
+import tracemalloc
+from math import floor, log
+
+
+def legacy_N(x: int) -> int:
+    # The float logarithm N used before, without its unbounded cache
+    if x == 0:
+        return 1
+    return floor(log(abs(x), 10)) + 1
+
+
+def main():
+    from Engine.Algorithm.Decimal import N
+
+    random.seed(0)
+    repeat = 1_000
+    for digits in (10, 100, 1_000, 10_000, 100_000):
+        x = random.randrange(pow(10, digits - 1), pow(10, digits))
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            legacy_N(x)
+        legacy = (time.perf_counter() - start) / repeat
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            N(x)
+        exact = (time.perf_counter() - start) / repeat
+
+        print(f"{digits} digits: log {legacy * 1e6:.02f}us, bit_length {exact * 1e6:.02f}us")
+
+    wrong = sum(legacy_N(pow(10, k) - 1) != k for k in range(1, 1_000))
+    print(f"log based N miscounts {wrong} of 10**k - 1 for k < 1000")
+
+    # N must not retain anything between calls, so memory stays flat over
+    # a long stream of distinct integers
+    tracemalloc.start()
+    for i in range(100_000):
+        N(random.getrandbits(256) + i)
+    baseline, _ = tracemalloc.get_traced_memory()
+    for i in range(1_000_000):
+        N(random.getrandbits(256) + i)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    growth = current - baseline
+    print(f"memory growth over 1000000 calls: {growth} bytes")
+    assert growth < 64 * 1024
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+import random
+import time
+
+
+def main():
+    from Engine.Algorithm.Division import integer_division
+    from Engine.Number import Number
+
+    random.seed(0)
+    for bits in (50_000, 200_000, 400_000, 1_000_000):
+        x = random.getrandbits(2 * bits)
+        y = random.getrandbits(bits) | 1
+
+        start = time.perf_counter()
+        q = x // y
+        builtin = time.perf_counter() - start
+
+        start = time.perf_counter()
+        assert integer_division(x, y) == q
+        newton = time.perf_counter() - start
+
+        print(f"{bits} bit quotient: builtin {builtin:.04f}s, newton {newton:.04f}s")
+
+    three = Number(3, 0)
+    seven = Number(7, 0)
+    for n in (1_000, 10_000, 100_000):
+        start = time.perf_counter()
+        three.divide(seven, n)
+        elapsed = time.perf_counter() - start
+        print(f"3/7 to {n} digits in {elapsed:.04f}s")
+
+
+if __name__ == '__main__':
+    main()
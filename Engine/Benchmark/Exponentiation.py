@@ -0,0 +1,81 @@
+import time
+from fractions import Fraction
+
+
+class Counted:
+    # Counts the multiplications an exponentiation strategy performs while
+    # tracking only the exponent reached, so huge exponents stay cheap
+    multiplications = 0
+
+    def __init__(self, exponent: int):
+        self.exponent = exponent
+
+    def __mul__(self, other: "Counted") -> "Counted":
+        Counted.multiplications += 1
+        return Counted(self.exponent + other.exponent)
+
+
+def naive_power(x, n: int):
+    y = x
+    for _ in range(n - 1):
+        y = y * x
+    return y
+
+
+def count(f, n: int) -> int:
+    Counted.multiplications = 0
+    assert f(Counted(1), n).exponent == n
+    return Counted.multiplications
+
+
+def main():
+    from Engine.Algorithm.Exponentiation import (
+        ADDITION_CHAINS,
+        addition_chain_power,
+        binary_power,
+        power,
+        power_function,
+        sliding_window_power,
+    )
+
+    for n in (15, 31, 63, 100, 1_000, 10_000, 10 ** 50, 2 ** 200 - 1):
+        naive = count(naive_power, n) if n <= 10_000 else n - 1
+        print(
+            f"x ** {n}: naive {naive}, "
+            f"binary {count(binary_power, n)}, "
+            f"sliding window {count(sliding_window_power, n)}, "
+            f"engine {count(power, n)} multiplications"
+        )
+
+    x = Fraction(1234567, 7654321)
+    for n in (1_000, 10_000):
+        start = time.perf_counter()
+        naive_power(x, n)
+        naive = time.perf_counter() - start
+
+        start = time.perf_counter()
+        power(x, n)
+        engine = time.perf_counter() - start
+        print(f"Fraction ** {n}: naive {naive:.04f}s, engine {engine:.04f}s")
+
+    # A hot fixed exponent, interpreted chain against the generated kernel
+    x = Fraction(3, 7)
+    repeat = 2_000
+    for n in (15, 127, 1_000):
+        chain = ADDITION_CHAINS.minimal_multiplication_chain(n)
+        kernel = power_function(n)
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            addition_chain_power(x, chain)
+        interpreted = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            kernel(x)
+        generated = time.perf_counter() - start
+        print(f"x ** {n} x{repeat}: interpreted chain {interpreted:.04f}s, generated {generated:.04f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+import math
+import time
+
+
+def naive_factorial(n: int) -> int:
+    y = 1
+    for i in range(2, n + 1):
+        y *= i
+    return y
+
+
+def main():
+    from Engine.Algorithm.Product import (
+        FactorialCache,
+        binary_splitting_factorial,
+        prime_swing_factorial,
+    )
+
+    for n in (1_000, 10_000, 50_000, 100_000):
+        expected = math.factorial(n)
+        for name, f in (
+            ("naive", naive_factorial),
+            ("binary splitting", binary_splitting_factorial),
+            ("prime swing", prime_swing_factorial),
+        ):
+            start = time.perf_counter()
+            assert f(n) == expected
+            elapsed = time.perf_counter() - start
+            print(f"{n}! {name}: {elapsed:.04f}s")
+
+    # Taylor series style access, (2i + 1)! for consecutive i
+    terms = 2_000
+    cache = FactorialCache()
+
+    start = time.perf_counter()
+    for i in range(terms):
+        naive_factorial(2 * i + 1)
+    fresh = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(terms):
+        cache.factorial(2 * i + 1)
+    incremental = time.perf_counter() - start
+
+    print(f"(2i + 1)! for i < {terms}: fresh {fresh:.04f}s, cached {incremental:.04f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+
+# Cold import budget in seconds, well above the measured cost so that only
+# a heavy import at package level trips it
+IMPORT_TIME_BUDGET = 0.1
+IMPORT_TIME_MODULES = ("Engine.Number", "Engine.Number.Operation", "Engine.Number.Real")
+
+# Only loaded once a kernel or an array is used
+DEFERRED_MODULES = ("numba", "numpy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def import_times(module: str) -> dict[str, int]:
+    # Cumulative microseconds per imported module, from python -X importtime
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main():
+    over_budget = False
+    for module in IMPORT_TIME_MODULES:
+        times = import_times(module)
+        total = times[module] / 1e6
+        deferred = [name for name in DEFERRED_MODULES if name in times]
+        slowest = sorted(
+            (name for name in times if name.startswith("Engine.") and name != module),
+            key=times.get, reverse=True
+        )[:3]
+
+        print(
+            f"import {module}: {total:.04f}s, "
+            f"slowest {', '.join(f'{name} {times[name] / 1e6:.04f}s' for name in slowest)}"
+        )
+        if deferred:
+            print(f"  eagerly imports {', '.join(deferred)}")
+        over_budget |= total > IMPORT_TIME_BUDGET or bool(deferred)
+
+    if over_budget:
+        print(f"over the {IMPORT_TIME_BUDGET}s import budget")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
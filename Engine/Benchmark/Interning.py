@@ -0,0 +1,31 @@
+import time
+
+
+def main():
+    from Engine.Number import Number
+    from Engine.Number.Natural import Natural
+    from Engine.Number.Integer import Integer
+
+    repeat = 200_000
+
+    start = time.perf_counter()
+    for i in range(repeat):
+        Number(2 * (i % 500) + 1, 0)
+    interned = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(repeat):
+        Number(2 * (i % 500) + 2049, 0)
+    fresh = time.perf_counter() - start
+
+    for i in range(repeat):
+        Natural(Number(i % 1000, 0))
+        Integer(Number(i % 1000 - 256, 0))
+
+    print(f"odd Numbers: interned {interned:.04f}s, out of range {fresh:.04f}s")
+    for cls in (Number, Natural, Integer):
+        print(f"{cls.__name__}: {cls.interned.hits} hits, {cls.interned.misses} misses")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+import time
+
+
+def main():
+    from Engine.Algorithm.Constant import CONSTANTS, pi
+    from Engine.Number.Irrational import Irrational, IRRATIONAL_E, IRRATIONAL_PI
+
+    for name, x in (("pi", IRRATIONAL_PI), ("e", IRRATIONAL_E), ("sqrt 2", Irrational.square_root(2))):
+        for k in (1_000, 10_000, 100_000):
+            start = time.perf_counter()
+            x.truncated(k)
+            extend = time.perf_counter() - start
+
+            # Shorter prefixes come from the memoized truncation
+            start = time.perf_counter()
+            x.truncated(k // 2)
+            memoized = time.perf_counter() - start
+
+            print(f"{name} {k} digits: extend {extend:.04f}s, memoized prefix {memoized:.06f}s")
+
+    # The binary Machin constant used by the series, for comparison
+    for k in (1_000, 10_000):
+        bits = k * 3402 // 1024 + 1
+        CONSTANTS.clear()
+        start = time.perf_counter()
+        pi(bits)
+        print(f"Machin pi at {k} digits: {time.perf_counter() - start:.04f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+import random
+import time
+
+
+def main():
+    import numpy as np
+
+    from Engine.Algorithm.Division import python_decimal_division
+    from Engine.Algorithm.Kernel import int64_canonical, int64_decimal_division, int64_division_array
+    from Engine.Number.NumberArray import DECIMAL_DIVISION
+
+    random.seed(0)
+    size = 200_000
+    n = 15
+    x_mantissas = [random.randrange(1, 10 ** 9) for _ in range(size)]
+    y_mantissas = [random.randrange(1, 10 ** 9) for _ in range(size)]
+    exponents = [random.randrange(-8, 8) for _ in range(size)]
+
+    # The first call imports numba and compiles, or loads the on-disk cache
+    # written by an earlier run
+    start = time.perf_counter()
+    int64_decimal_division(1, 0, 3, 0, n)
+    print(f"first kernel call: {time.perf_counter() - start:.04f}s")
+
+    start = time.perf_counter()
+    for x, y, e in zip(x_mantissas, y_mantissas, exponents):
+        python_decimal_division(x, e, y, -e, n)
+    python = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for x, y, e in zip(x_mantissas, y_mantissas, exponents):
+        int64_decimal_division(x, e, y, -e, n)
+    jit = time.perf_counter() - start
+    print(f"{size} scalar divisions: Python {python:.04f}s, JIT {jit:.04f}s")
+
+    xm = np.array(x_mantissas, dtype=np.int64)
+    ym = np.array(y_mantissas, dtype=np.int64)
+    xe = np.array(exponents, dtype=np.int64)
+    ye = -xe
+
+    start = time.perf_counter()
+    DECIMAL_DIVISION(xm.astype(object), xe.astype(object), ym.astype(object), ye.astype(object), n)
+    python = time.perf_counter() - start
+
+    mantissas = np.empty(size, dtype=np.int64)
+    exponents = np.empty(size, dtype=np.int64)
+    int64_division_array(xm[:1], xe[:1], ym[:1], ye[:1], n, mantissas[:1], exponents[:1])
+    start = time.perf_counter()
+    int64_division_array(xm, xe, ym, ye, n, mantissas, exponents)
+    jit = time.perf_counter() - start
+    print(f"{size} array divisions: Python {python:.04f}s, JIT {jit:.04f}s")
+
+    trailing = xm * 1000
+    start = time.perf_counter()
+    m, e = trailing.copy(), xe.copy()
+    index = np.flatnonzero((m % 10 == 0) & (m != 0))
+    while index.size:
+        m[index] //= 10
+        e[index] += 1
+        index = index[m[index] % 10 == 0]
+    vectorized = time.perf_counter() - start
+
+    int64_canonical(trailing[:1].copy(), xe[:1].copy())
+    start = time.perf_counter()
+    int64_canonical(trailing.copy(), xe.copy())
+    jit = time.perf_counter() - start
+    print(f"{size} normalizations: NumPy {vectorized:.04f}s, JIT {jit:.04f}s")
+
+
+if __name__ == '__main__':
+    main()
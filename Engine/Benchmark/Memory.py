@@ -0,0 +1,56 @@
+import random
+import tracemalloc
+
+
+class Boxed:
+    # The layout Natural and Integer used before: a __dict__ holding a Number
+    def __init__(self, value):
+        self.value = value
+
+
+def footprint(factory, n: int = 100_000) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    values = [factory(i) for i in range(n)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del values
+    return (after - before) / n
+
+
+def main():
+    from Engine.Number import Number
+    from Engine.Number.Natural import Natural
+    from Engine.Number.Integer import Integer
+    from Engine.Number.Rational import Rational
+    from Engine.Number.Irrational import IRRATIONAL_ZERO
+    from Engine.Number.Real import Real
+    from Engine.Number.Imaginary import Imaginary
+    from Engine.Number.Complex import Complex
+
+    random.seed(0)
+    mantissas = [random.randrange(1, 10 ** 18) * 10 + 1 for _ in range(100_000)]
+
+    factories = {
+        "Number": lambda i: Number(mantissas[i], 0),
+        "Natural (boxed)": lambda i: Boxed(Number(mantissas[i], 0)),
+        "Natural": lambda i: Natural(Number(mantissas[i], 0)),
+        "Integer": lambda i: Integer(Number(-mantissas[i], 0)),
+        "Rational": lambda i: Rational(
+            Integer(Number(mantissas[i], 0)),
+            Integer(Number(mantissas[-i], 0))
+        ),
+        "Real": lambda i: Real(
+            Rational(Integer(Number(mantissas[i], 0)), Integer(Number(1, 0))),
+            IRRATIONAL_ZERO
+        ),
+    }
+    factories["Imaginary"] = lambda i: Imaginary(factories["Real"](i))
+    factories["Complex"] = lambda i: Complex(factories["Real"](i), factories["Imaginary"](i))
+
+    for name, factory in factories.items():
+        print(f"{name}: {footprint(factory):.01f} bytes per value")
+
+
+if __name__ == '__main__':
+    main()
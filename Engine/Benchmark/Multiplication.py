@@ -0,0 +1,65 @@
+import random
+import time
+
+# Operand sizes in bits, doubling, and the number of products timed at each
+CROSSOVER_SIZES = tuple(1 << i for i in range(10, 24))
+CROSSOVER_TIME = 0.2
+
+
+def timed(backend, x: int, y: int) -> float:
+    # Best of a few runs, as many as fit in CROSSOVER_TIME
+    best = float("inf")
+    total = 0.0
+    while total < CROSSOVER_TIME:
+        start = time.perf_counter()
+        backend(x, y)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+    return best
+
+
+def crossover(results: list[tuple[int, float, float]]) -> int:
+    # The smallest size from which the backend beats int at every size
+    threshold = None
+    for bits, native, candidate in results:
+        if candidate < native:
+            if threshold is None:
+                threshold = bits
+        else:
+            threshold = None
+    return threshold
+
+
+def main():
+    from Engine.Algorithm import Multiplication
+    from Engine.Algorithm.Multiplication import fermat_multiply, gmpy2_multiply, native_multiply
+
+    random.seed(0)
+    candidates = {"fermat": fermat_multiply}
+    if Multiplication.GMPY2.load() is not None:
+        candidates["gmpy2"] = gmpy2_multiply
+    else:
+        print("gmpy2 is not installed")
+
+    results = {name: [] for name in candidates}
+    for bits in CROSSOVER_SIZES:
+        x = random.getrandbits(bits) | 1 << (bits - 1)
+        y = random.getrandbits(bits) | 1 << (bits - 1)
+        native = timed(native_multiply, x, y)
+        line = [f"{bits} bits: int {native:.06f}s"]
+        for name, backend in candidates.items():
+            elapsed = timed(backend, x, y)
+            results[name].append((bits, native, elapsed))
+            line.append(f"{name} {elapsed:.06f}s")
+        print(", ".join(line))
+
+    for name, constant in (("gmpy2", "GMPY2_THRESHOLD_BITS"), ("fermat", "FERMAT_THRESHOLD_BITS")):
+        if name in results:
+            threshold = crossover(results[name])
+            current = getattr(Multiplication, constant)
+            print(f"{constant}: measured {threshold}, configured {current}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+import random
+import time
+from math import floor, log10
+
+
+def legacy_reduce(mantissa: int, exponent: int) -> tuple[int, int]:
+    # The linear scan Number.reduce used before numbers were kept canonical
+    n = max(i for i in range(floor(log10(abs(mantissa))) + 1)
+            if abs(mantissa) % pow(10, i) == 0)
+    return abs(mantissa) // pow(10, n), exponent + n
+
+
+def random_mantissa(digits: int, zeros: int) -> int:
+    significant = random.randrange(pow(10, digits - zeros - 1), pow(10, digits - zeros))
+    while significant % 10 == 0:
+        significant += 1
+    return significant * pow(10, zeros)
+
+
+def main():
+    from Engine.Number import Number
+
+    random.seed(0)
+    repeat = 10
+    legacy_limit = 10_000
+    for digits in (1_000, 10_000, 100_000):
+        x = random_mantissa(digits, digits // 10)
+        y = random_mantissa(digits, digits // 10)
+
+        start = time.perf_counter()
+        a = Number(x, 0)
+        b = Number(y, 0)
+        construction = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            a == b
+            hash(a)
+        canonical = (time.perf_counter() - start) / repeat
+
+        if digits <= legacy_limit:
+            start = time.perf_counter()
+            for _ in range(repeat):
+                legacy_reduce(x, 0) == legacy_reduce(y, 0)
+                hash(legacy_reduce(x, 0))
+            legacy = f"{(time.perf_counter() - start) / repeat:.06f}s"
+        else:
+            legacy = "skipped"
+
+        print(
+            f"{digits} digits: construction {construction:.06f}s, "
+            f"compare+hash {canonical:.06f}s, legacy compare+hash {legacy}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+import random
+import time
+
+
+def check_mixed_magnitudes():
+    # Python integers past int64 next to small ones, which numpy alone turns
+    # into uint64 or float64
+    from Engine.Number import Number
+    from Engine.Number.NumberArray import NumberArray
+
+    for values in ([5, 2 ** 63 + 1], [-5, 2 ** 63 + 1], [2 ** 64 + 3, -1], [2 ** 63 + 10]):
+        x = NumberArray(values, 0)
+        assert [int(m) for m in x.mantissas] == values, values
+        assert NumberArray.from_numbers([Number(v, 0) for v in values]).to_numbers() == x.to_numbers()
+        assert (x + x).to_numbers() == [Number(2 * v, 0) for v in values]
+
+
+def main():
+    from Engine.Number import Number
+    from Engine.Number.NumberArray import NumberArray
+    from Engine.Number.Operation import sin
+
+    check_mixed_magnitudes()
+
+    random.seed(0)
+    size = 1_000_000
+    mantissas = [random.randrange(-10 ** 9, 10 ** 9) for _ in range(size)]
+    exponents = [random.randrange(-8, 8) for _ in range(size)]
+
+    start = time.perf_counter()
+    xs = [Number(m, e) for m, e in zip(mantissas, exponents)]
+    ys = xs[::-1]
+    objects = time.perf_counter() - start
+
+    start = time.perf_counter()
+    x = NumberArray(mantissas, exponents)
+    y = x[::-1]
+    arrays = time.perf_counter() - start
+    print(f"{size} values: Number objects {objects:.04f}s, NumberArray {arrays:.04f}s")
+
+    operations = (
+        ("add", lambda a, b: a + b),
+        ("multiply", lambda a, b: a * b),
+        ("compare", lambda a, b: a < b),
+    )
+    for name, operation in operations:
+        start = time.perf_counter()
+        [operation(a, b) for a, b in zip(xs, ys)]
+        loop = time.perf_counter() - start
+
+        start = time.perf_counter()
+        operation(x, y)
+        vectorized = time.perf_counter() - start
+        print(f"{name}: Number loop {loop:.04f}s, NumberArray {vectorized:.04f}s")
+
+    start = time.perf_counter()
+    Number.sum(xs)
+    loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    x.sum()
+    vectorized = time.perf_counter() - start
+    print(f"sum: Number.sum {loop:.04f}s, NumberArray {vectorized:.04f}s")
+
+    # The series kernels run per element either way, the array only saves
+    # the dispatch and the Number objects on both sides
+    points = 100_000
+    start = time.perf_counter()
+    [sin(a) for a in xs[:points]]
+    loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    x[:points].sin()
+    vectorized = time.perf_counter() - start
+    print(f"sin on {points} points: Number loop {loop:.04f}s, NumberArray {vectorized:.04f}s")
+
+
+if __name__ == '__main__':
+    main()
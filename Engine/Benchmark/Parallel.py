@@ -0,0 +1,51 @@
+import os
+import random
+import sys
+import time
+
+
+def main():
+    from Engine.Algorithm.Parallel import use_parallel
+    from Engine.Algorithm.Product import FACTORIAL_CACHE, factorial, product_tree
+    from Engine.Algorithm.Series import exp_series, sin_series
+
+    random.seed(0)
+    values = [random.getrandbits(1 << 16) for _ in range(256)]
+    bits = 1 << 16
+    r = random.getrandbits(bits - 2)
+    n = 1 << 19
+
+    # 1 to N workers, N the number of cores unless given on the command line
+    cores = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    baseline = None
+    for workers in range(1, cores + 1):
+        use_parallel(workers)
+
+        timings = []
+        start = time.perf_counter()
+        product_tree(values)
+        timings.append(time.perf_counter() - start)
+
+        FACTORIAL_CACHE.clear()
+        start = time.perf_counter()
+        factorial(n)
+        timings.append(time.perf_counter() - start)
+
+        for series in (exp_series, sin_series):
+            start = time.perf_counter()
+            series(r, bits)
+            timings.append(time.perf_counter() - start)
+
+        if baseline is None:
+            baseline = timings
+        print(
+            f"{workers} workers: " + ", ".join(
+                f"{name} {t:.03f}s ({b / t:.02f}x)"
+                for name, t, b in zip(("product tree", f"{n}!", "exp series", "sin series"), timings, baseline)
+            )
+        )
+    use_parallel(None)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+import random
+import time
+
+
+def workloads(values: list) -> dict[str, float]:
+    # Seconds for a running sum, a sort and a running product of values,
+    # plus an elementwise product of neighbours
+    timings = {}
+
+    start = time.perf_counter()
+    total = values[0]
+    for x in values[1:]:
+        total = total + x
+    timings["add"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sorted(values)
+    timings["compare"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for x, y in zip(values, values[1:]):
+        x * y
+    product = values[0]
+    for x in values[1:1_000]:
+        product = product * x
+    timings["multiply"] = time.perf_counter() - start
+    return timings
+
+
+def main():
+    from Engine.Number import Number
+    from Engine.Number.Binary import Binary
+    from Engine.Number.Context import local_context
+
+    random.seed(0)
+    size = 20_000
+    mantissas = [random.randrange(-10 ** 12, 10 ** 12) or 1 for _ in range(size)]
+    exponents = [random.randrange(-300, 300) for _ in range(size)]
+
+    # The same mantissas scaled by comparable powers of ten and of two
+    inputs = {
+        "radix 10": [Number(m, e) for m, e in zip(mantissas, exponents)],
+        "radix 2": [Binary(m, 10 * e // 3) for m, e in zip(mantissas, exponents)],
+    }
+
+    # Decimal inputs read into a radix 2 context, which keeps them exact
+    # through their powers of five
+    with local_context(radix=2) as context:
+        inputs["radix 2, decimal inputs"] = [context.number(x) for x in inputs["radix 10"]]
+
+    for name, values in inputs.items():
+        timings = workloads(values)
+        print(f"{name}: " + ", ".join(f"{key} {elapsed:.04f}s" for key, elapsed in timings.items()))
+
+    # Conversion at the edges
+    strings = [f"{m}e{e}" for m, e in zip(mantissas[:1_000], exponents[:1_000])]
+    for radix in (10, 2):
+        with local_context(radix=radix) as context:
+            start = time.perf_counter()
+            numbers = [context.number(string) for string in strings]
+            parsed = time.perf_counter() - start
+            start = time.perf_counter()
+            [str(x) for x in numbers]
+            printed = time.perf_counter() - start
+        print(f"radix {radix}: from_string {parsed:.04f}s, __str__ {printed:.04f}s")
+
+
+if __name__ == '__main__':
+    main()
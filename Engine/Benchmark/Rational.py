@@ -0,0 +1,61 @@
+import time
+from fractions import Fraction
+
+
+def main():
+    from Engine.Number.Rational import Rational
+
+    for n in (1_000, 4_000, 10_000):
+        terms = [Rational.from_fraction(1, k) for k in range(1, n + 1)]
+
+        # Lazy: reduced only when the size doubles since the last reduction
+        start = time.perf_counter()
+        lazy = Rational.from_python_integer(0)
+        for term in terms:
+            lazy = lazy + term
+        lazy.reduce()
+        lazy_time = time.perf_counter() - start
+
+        # Eager: reduced after every addition, as fractions.Fraction does
+        start = time.perf_counter()
+        eager = Rational.from_python_integer(0)
+        for term in terms:
+            eager = (eager + term).reduce()
+        eager_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reference = Fraction(0)
+        for k in range(1, n + 1):
+            reference += Fraction(1, k)
+        fraction_time = time.perf_counter() - start
+
+        assert lazy == eager
+        assert lazy.denominator.mantissa * pow(10, lazy.denominator.exponent) == reference.denominator
+        print(
+            f"H({n}): lazy {lazy_time:.04f}s, eager {eager_time:.04f}s, "
+            f"Fraction {fraction_time:.04f}s, {reference.denominator.bit_length()} bit denominator"
+        )
+
+    # Telescoping 1 / (k (k + 1)) sums to n / (n + 1), so reduction pays
+    # off far more than for the harmonic numbers
+    n = 4_000
+    terms = [Rational.from_fraction(1, k * (k + 1)) for k in range(1, n + 1)]
+    start = time.perf_counter()
+    lazy = Rational.from_python_integer(0)
+    for term in terms:
+        lazy = lazy + term
+    lazy.reduce()
+    lazy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    eager = Rational.from_python_integer(0)
+    for term in terms:
+        eager = (eager + term).reduce()
+    eager_time = time.perf_counter() - start
+
+    assert lazy == Rational.from_fraction(n, n + 1)
+    print(f"telescoping {n}: lazy {lazy_time:.04f}s, eager {eager_time:.04f}s")
+
+
+if __name__ == '__main__':
+    main()
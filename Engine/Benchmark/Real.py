@@ -0,0 +1,31 @@
+import time
+
+
+def main():
+    from Engine.Number import Number
+    from Engine.Number.Irrational import Irrational, IRRATIONAL_E, IRRATIONAL_PI
+    from Engine.Number.Real import Real
+
+    def expression() -> Real:
+        # Fresh leaves each time so that no memoized digits are shared
+        pi = Real.from_irrational(Irrational(IRRATIONAL_PI.generator))
+        e = Real.from_irrational(Irrational(IRRATIONAL_E.generator))
+        root = Real.from_irrational(Irrational.square_root(2))
+        return (pi + e) * root / Real.from_python_integer(7) - e ** Real.from_python_integer(3)
+
+    for n in (15, 100, 1_000, 10_000):
+        start = time.perf_counter()
+        expression().approximate(n)
+        print(f"{n} digits on demand: {time.perf_counter() - start:.04f}s")
+
+    # Cancellation forces refinement past the requested digits
+    for k in (20, 200, 2_000):
+        x = Real.from_irrational(Irrational(IRRATIONAL_PI.generator))
+        y = (x + Real.from_number(Number(1, -k))) - x
+        start = time.perf_counter()
+        y.approximate(15)
+        print(f"15 digits of (pi + 1e-{k}) - pi: {time.perf_counter() - start:.04f}s")
+
+
+if __name__ == '__main__':
+    main()
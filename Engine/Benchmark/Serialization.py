@@ -0,0 +1,57 @@
+import pickle
+import random
+import time
+
+
+def timed(function, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    from Engine.Number import Number
+    from Engine.Number.Serialization import dumps, dumps_array, loads, loads_array
+
+    random.seed(0)
+    numbers = [Number(random.randrange(-10 ** 18, 10 ** 18), random.randrange(-30, 30)) for _ in range(100_000)]
+
+    # One buffer for the whole list against the decimal strings and pickle
+    as_strings = [str(x) for x in numbers]
+    encoded = dumps_array(numbers)
+    pickled = pickle.dumps(numbers)
+    strings = "\n".join(as_strings).encode()
+    print(f"{len(numbers)} numbers: {len(encoded)} bytes, pickle {len(pickled)} bytes, strings {len(strings)} bytes")
+    print(
+        f"dump {timed(lambda: dumps_array(numbers)):.04f}s, "
+        f"pickle {timed(lambda: pickle.dumps(numbers)):.04f}s, "
+        f"str {timed(lambda: [str(x) for x in numbers]):.04f}s"
+    )
+    print(
+        f"load {timed(lambda: loads_array(encoded)):.04f}s, "
+        f"unpickle {timed(lambda: pickle.loads(pickled)):.04f}s, "
+        f"from_string {timed(lambda: [Number.from_string(s) for s in as_strings]):.04f}s"
+    )
+
+    # Single values pay the header
+    x = numbers[0]
+    print(f"one number: {len(dumps(x))} bytes, pickle {len(pickle.dumps(x))} bytes, string {len(str(x))} bytes")
+
+    # Arrays write raw int64 columns
+    try:
+        from Engine.Number.NumberArray import NumberArray
+    except ImportError:
+        return
+    array = NumberArray.from_numbers(numbers)
+    encoded = dumps(array)
+    print(
+        f"array of {len(array)}: {len(encoded)} bytes, "
+        f"dump {timed(lambda: dumps(array)):.04f}s, load {timed(lambda: loads(encoded)):.04f}s"
+    )
+
+
+if __name__ == '__main__':
+    main()
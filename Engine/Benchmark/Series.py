@@ -0,0 +1,57 @@
+import math
+import time
+
+
+def legacy_sin(x: int, bits: int, terms: int) -> int:
+    # Term by term evaluation as before, recomputing (-1) ** i, (2i + 1)!
+    # and x ** (2i + 1) for every term, in the same fixed point
+    y = 0
+    for i in range(terms):
+        y += (-1) ** i * (x ** (2 * i + 1) >> (2 * i * bits)) // math.factorial(2 * i + 1)
+    return y
+
+
+def main():
+    from Engine.Algorithm.Series import digits_to_bits, sin_series
+    from Engine.Number import Number
+    from Engine.Number.Operation import sin, cos, exp
+
+    x = Number(7, -1)
+    for n in (15, 100, 1_000, 5_000):
+        timings = []
+        for f in (sin, cos, exp):
+            start = time.perf_counter()
+            f(x, n)
+            timings.append(time.perf_counter() - start)
+        print(
+            f"{n} digits: sin {timings[0]:.04f}s, "
+            f"cos {timings[1]:.04f}s, exp {timings[2]:.04f}s"
+        )
+
+    for n in (100, 300, 1_000):
+        bits = digits_to_bits(n)
+        r = (7 << bits) // 10
+
+        start = time.perf_counter()
+        y = sin_series(r, bits)
+        recurrence = time.perf_counter() - start
+
+        terms = 0
+        while math.factorial(2 * terms + 1) < (1 << bits):
+            terms += 1
+        start = time.perf_counter()
+        z = legacy_sin(r, bits, terms + 1)
+        legacy = time.perf_counter() - start
+
+        assert abs(y - z) < (1 << 16)
+        print(f"{n} digit series: recurrence {recurrence:.04f}s, legacy {legacy:.04f}s")
+
+    for x in (Number(1, 3), Number(1, 20), Number(-123456789, -3)):
+        start = time.perf_counter()
+        sin(x, 50)
+        elapsed = time.perf_counter() - start
+        print(f"sin({x}) with argument reduction: {elapsed:.04f}s")
+
+
+if __name__ == '__main__':
+    main()
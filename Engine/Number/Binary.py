@@ -0,0 +1,269 @@
+from Engine.Algorithm.Decimal import power_of_five, strip_trailing_bits
+from Engine.Algorithm.Division import remove_factor
+from Engine.Algorithm.Multiplication import multiply
+from Engine.Algorithm.Series import digits_to_bits
+from Engine.Number import Skeleton, Number
+
+from typing import Optional
+
+
+def canonical(mantissa: int, exponent: int, fives: int) -> tuple[int, int, int]:
+    # An odd mantissa, no positive power of five, and no factor of five in
+    # the mantissa while a negative one is tracked, which makes the triple
+    # unique for every value
+    if mantissa == 0:
+        return 0, 0, 0
+    mantissa, k = strip_trailing_bits(mantissa)
+    exponent += k
+    if fives < 0:
+        mantissa, k = remove_factor(mantissa, 5)
+        fives += k
+    if fives > 0:
+        mantissa *= power_of_five(fives)
+        fives = 0
+    return mantissa, exponent, fives
+
+
+def scale(mantissa: int, exponent: int, fives: int, minimum_exponent: int, minimum_fives: int) -> int:
+    # mantissa * 2 ** exponent * 5 ** fives over 2 ** minimum_exponent * 5 ** minimum_fives
+    if fives != minimum_fives:
+        mantissa *= power_of_five(fives - minimum_fives)
+    return mantissa << (exponent - minimum_exponent)
+
+
+class Binary(Skeleton):
+    # mantissa * 2 ** exponent * 5 ** fives. Scaling is a shift as long as
+    # values come from binary sources and fives stays zero, while decimal
+    # inputs stay exact through the negative power of five they carry.
+    # Decimal digits are only produced by from_string and __str__
+    __slots__ = ("__mantissa", "__exponent", "__fives")
+
+    __mantissa: int
+    __exponent: int
+    __fives: int
+
+    def __new__(cls, mantissa: int, exponent: int, fives: int = 0):
+        return cls.from_canonical(*canonical(mantissa, exponent, fives))
+
+    @classmethod
+    def from_canonical(cls, mantissa: int, exponent: int, fives: int = 0) -> "Binary":
+        # Skips normalization, the caller guarantees the canonical form
+        self = object.__new__(cls)
+        self.__mantissa = mantissa
+        self.__exponent = exponent
+        self.__fives = fives
+        return self
+
+    def __hash__(self):
+        return hash(("Binary", self.mantissa, self.exponent, self.fives))
+
+    def __str__(self) -> str:
+        return f"{self.to_number()}"
+
+    @classmethod
+    def from_string(cls, string: str) -> "Binary":
+        return cls.from_number(Number.from_string(string))
+
+    @classmethod
+    def from_python_integer(cls, python_integer: int) -> "Binary":
+        return cls(python_integer, 0)
+
+    @classmethod
+    def from_number(cls, number: Number) -> "Binary":
+        # m * 10 ** e == m * 2 ** e * 5 ** e
+        return cls(number.mantissa, number.exponent, number.exponent)
+
+    @classmethod
+    def from_natural(cls, natural: "Natural") -> "Binary":
+        return cls(natural.mantissa, natural.exponent, natural.exponent)
+
+    @classmethod
+    def from_integer(cls, integer: "Integer") -> "Binary":
+        return cls(integer.mantissa, integer.exponent, integer.exponent)
+
+    @classmethod
+    def from_binary(cls, binary: "Binary") -> "Binary":
+        return binary
+
+    @property
+    def mantissa(self) -> int:
+        return self.__mantissa
+
+    @property
+    def exponent(self) -> int:
+        return self.__exponent
+
+    @property
+    def fives(self) -> int:
+        return self.__fives
+
+    @property
+    def real(self) -> "Binary":
+        return self
+
+    @property
+    def imaginary(self):
+        return None
+
+    @property
+    def is_integer(self) -> bool:
+        return self.exponent >= 0 and self.fives == 0
+
+    @property
+    def is_fractional(self) -> bool:
+        return not self.is_integer
+
+    def to_number(self) -> Number:
+        # Exact, 2 ** -k == 5 ** k * 10 ** -k and 5 ** -k == 2 ** k * 10 ** -k
+        m, e, f = self.mantissa, self.exponent, self.fives
+        if e >= f:
+            return Number(m << (e - f), f)
+        return Number(m * power_of_five(f - e), e)
+
+    def fraction(self) -> tuple[int, int]:
+        # (p, q) with p / q the value and q a positive power of two and five
+        m, e, f = self.mantissa, self.exponent, self.fives
+        q = power_of_five(-f)
+        if e >= 0:
+            return m << e, q
+        return m, q << -e
+
+    def reduce(self) -> "Binary":
+        return self
+
+    def equal(self, other: "Binary") -> bool:
+        # Both sides are canonical, so equal values have equal fields
+        return self.mantissa == other.mantissa and self.exponent == other.exponent \
+            and self.fives == other.fives
+
+    def lower(self, other: "Binary") -> bool:
+        x_sign = (self.mantissa > 0) - (self.mantissa < 0)
+        y_sign = (other.mantissa > 0) - (other.mantissa < 0)
+
+        if x_sign != y_sign:
+            return x_sign < y_sign
+
+        if self.fives == other.fives:
+            # Comparing bit lengths first settles most pairs without a shift
+            x_length = self.mantissa.bit_length() + self.exponent
+            y_length = other.mantissa.bit_length() + other.exponent
+            if x_length != y_length:
+                return (x_length < y_length) == (x_sign > 0)
+
+        exponent = min(self.exponent, other.exponent)
+        fives = min(self.fives, other.fives)
+        return scale(self.mantissa, self.exponent, self.fives, exponent, fives) \
+            < scale(other.mantissa, other.exponent, other.fives, exponent, fives)
+
+    def greater(self, other: "Binary") -> bool:
+        return other.lower(self)
+
+    def lower_equal(self, other: "Binary") -> bool:
+        return not other.lower(self)
+
+    def greater_equal(self, other: "Binary") -> bool:
+        return not self.lower(other)
+
+    def absolute(self) -> "Binary":
+        return Binary.from_canonical(abs(self.mantissa), self.exponent, self.fives)
+
+    def negate(self) -> "Binary":
+        return Binary.from_canonical(-self.mantissa, self.exponent, self.fives)
+
+    def add(self, other: "Binary") -> "Binary":
+        if self.mantissa == 0:
+            return other
+        if other.mantissa == 0:
+            return self
+        exponent = min(self.exponent, other.exponent)
+        fives = min(self.fives, other.fives)
+        return Binary(
+            scale(self.mantissa, self.exponent, self.fives, exponent, fives)
+            + scale(other.mantissa, other.exponent, other.fives, exponent, fives),
+            exponent,
+            fives
+        )
+
+    def subtract(self, other: "Binary") -> "Binary":
+        return self.add(other.negate())
+
+    def multiply(self, other: "Binary") -> "Binary":
+        # Odd times odd is odd, and a factor of five can only appear when
+        # one side tracks fives and the other does not
+        if (self.fives == 0) == (other.fives == 0):
+            if self.mantissa == 0 or other.mantissa == 0:
+                return BINARY_ZERO
+            return Binary.from_canonical(
+                multiply(self.mantissa, other.mantissa),
+                self.exponent + other.exponent,
+                self.fives + other.fives
+            )
+        return Binary(
+            multiply(self.mantissa, other.mantissa),
+            self.exponent + other.exponent,
+            self.fives + other.fives
+        )
+
+    def power(self, other: "Binary") -> "Binary":
+        assert other.is_integer and other.mantissa >= 0
+        n = other.mantissa << other.exponent
+        if n == 0:
+            return BINARY_ONE
+        return Binary.from_canonical(pow(self.mantissa, n), self.exponent * n, self.fives * n)
+
+    def invert(self, n: Optional[int] = None) -> "Binary":
+        return BINARY_ONE.divide(self, n)
+
+    def divide(self, other: "Binary", n: Optional[int] = None) -> "Binary":
+        # Exact when the quotient has a finite binary expansion times a
+        # power of five, otherwise truncated to n decimal digits worth of
+        # bits, n defaulting to the precision of the current context
+        if other.mantissa == 0:
+            raise ZeroDivisionError
+
+        exponent = self.exponent - other.exponent
+        fives = self.fives - other.fives
+        x, y = abs(self.mantissa), abs(other.mantissa)
+        q, r = divmod(x, y)
+        if r and y % 5 == 0:
+            y, k = remove_factor(y, 5)
+            fives -= k
+            q, r = divmod(x, y)
+        if r:
+            if n is None:
+                from Engine.Number.Context import current_context
+                n = current_context().precision
+            # At least digits_to_bits(n) + 1 bits of quotient
+            s = digits_to_bits(n) - x.bit_length() + y.bit_length() + 1
+            if s > 0:
+                q = (x << s) // y
+                exponent -= s
+        if (self.mantissa < 0) != (other.mantissa < 0):
+            q = -q
+        return Binary(q, exponent, fives)
+
+    def floor_divide(self, other: "Binary") -> "Binary":
+        if other.mantissa == 0:
+            raise ZeroDivisionError
+
+        # Truncated towards zero like Number.floor_divide, so that // means
+        # the same in either radix
+        xp, xq = self.fraction()
+        yp, yq = other.fraction()
+        q = multiply(abs(xp), yq) // multiply(xq, abs(yp))
+        return Binary(-q if (xp < 0) != (yp < 0) else q, 0)
+
+    def modulus(self, other: "Binary") -> "Binary":
+        assert self.is_integer and self >= BINARY_ZERO
+        assert other.is_integer and other >= BINARY_ZERO
+
+        if other.mantissa == 0:
+            raise ZeroDivisionError
+
+        return self - (other * self.floor_divide(other))
+
+
+BINARY_ZERO = Binary(0, 0)
+BINARY_ONE = Binary(1, 0)
+
+Skeleton.register_coercion(Binary, "from_binary")
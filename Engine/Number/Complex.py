@@ -1,9 +1,13 @@
+from Engine.Algorithm.ComplexArithmetic import gauss_multiply, gauss_square, smith_divide
+from Engine.Algorithm.Exponentiation import power
 from Engine.Number import Skeleton
 from Engine.Number.Real import Real, REAL_ZERO, REAL_ONE
 from Engine.Number.Imaginary import Imaginary, IMAGINARY_ZERO, IMAGINARY_ONE
 
 
 class Complex(Skeleton):
+    __slots__ = ("__real", "__imaginary")
+
     __real: Real
     __imaginary: Imaginary
 
@@ -11,11 +15,15 @@ class Complex(Skeleton):
         self.__real = real
         self.__imaginary = imaginary
 
-    def __hash__(self):
-        return hash(("Complex", self.real, self.imaginary))
+    # Unhashable like the Real components it is compared by
+    __hash__ = None
 
     def __str__(self):
-        pass
+        return f"{self.real} + {self.imaginary}"
+
+    @classmethod
+    def from_components(cls, real: Real, imaginary: Real) -> "Complex":
+        return cls(real, Imaginary(imaginary))
 
     @classmethod
     def from_string(cls, string):
@@ -53,6 +61,10 @@ class Complex(Skeleton):
     def from_imaginary(cls, imaginary):
         return cls(REAL_ZERO, imaginary)
 
+    @classmethod
+    def from_complex(cls, complex: "Complex") -> "Complex":
+        return complex
+
     @property
     def real(self):
         return self.__real
@@ -61,7 +73,50 @@ class Complex(Skeleton):
     def imaginary(self):
         return self.__imaginary
 
+    @property
+    def components(self) -> tuple[Real, Real]:
+        return self.__real, self.__imaginary.value
+
+    def equal(self, other: "Complex") -> bool:
+        return self.real.equal(other.real) and self.imaginary.equal(other.imaginary)
+
+    def conjugate(self) -> "Complex":
+        return Complex(self.real, self.imaginary.negate())
+
+    def norm(self) -> Real:
+        # |self| ** 2
+        a, b = self.components
+        return a.multiply(a).add(b.multiply(b))
+
+    def negate(self) -> "Complex":
+        return Complex(self.real.negate(), self.imaginary.negate())
+
+    def add(self, other: "Complex") -> "Complex":
+        return Complex(self.real.add(other.real), self.imaginary.add(other.imaginary))
+
+    def subtract(self, other: "Complex") -> "Complex":
+        return Complex(self.real.subtract(other.real), self.imaginary.subtract(other.imaginary))
+
+    def multiply(self, other: "Complex") -> "Complex":
+        # Squares, as in the chains of power, take two multiplications
+        if other is self:
+            return Complex.from_components(*gauss_square(*self.components))
+        return Complex.from_components(*gauss_multiply(*self.components, *other.components))
+
+    def divide(self, other: "Complex") -> "Complex":
+        return Complex.from_components(*smith_divide(*self.components, *other.components))
+
+    def power(self, other: "Complex") -> "Complex":
+        # Integral real exponents only
+        assert other.imaginary is IMAGINARY_ZERO or other.imaginary.value.compare(REAL_ZERO) == 0
+        n = other.real.to_python_integer()
+        if n < 0:
+            return COMPLEX_ONE.divide(power(self, -n, COMPLEX_ONE))
+        return power(self, n, COMPLEX_ONE)
+
 
 COMPLEX_ZERO = Complex(REAL_ZERO, IMAGINARY_ZERO)
 COMPLEX_ONE = Complex(REAL_ONE, IMAGINARY_ZERO)
 COMPLEX_I = Complex(REAL_ZERO, IMAGINARY_ONE)
+
+Skeleton.register_coercion(Complex, "from_complex")
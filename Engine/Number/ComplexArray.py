@@ -0,0 +1,153 @@
+from Engine.Algorithm.ComplexArithmetic import (
+    gauss_multiply, gauss_square, smith_divide_imaginary_major, smith_divide_real_major
+)
+from Engine.Algorithm.Exponentiation import power
+from Engine.Number import DEFAULT_PRECISION, Number
+from Engine.Number.NumberArray import NumberArray
+
+import numpy as np
+from typing import Iterable
+
+
+def merge(mask: np.ndarray, x: "NumberArray", y: "NumberArray") -> "NumberArray":
+    # Elements of x where mask holds and of y elsewhere, x and y covering
+    # the two parts in order
+    dtype = object if object in (x.mantissas.dtype, y.mantissas.dtype) else np.int64
+    mantissas = np.empty(len(mask), dtype=dtype)
+    exponents = np.empty(len(mask), dtype=np.int64)
+    mantissas[mask], exponents[mask] = x.mantissas, x.exponents
+    mantissas[~mask], exponents[~mask] = y.mantissas, y.exponents
+    return NumberArray.from_canonical(mantissas, exponents)
+
+
+class ComplexArray:
+    # Complex values as a NumberArray of real parts and one of imaginary
+    # parts, so every component operation runs over the whole batch
+    __slots__ = ("__real", "__imaginary")
+
+    __real: NumberArray
+    __imaginary: NumberArray
+
+    def __init__(self, real: NumberArray, imaginary: NumberArray):
+        assert len(real) == len(imaginary)
+        self.__real = real
+        self.__imaginary = imaginary
+
+    @classmethod
+    def from_numbers(cls, real: Iterable["Number"], imaginary: Iterable["Number"]) -> "ComplexArray":
+        return cls(NumberArray.from_numbers(real), NumberArray.from_numbers(imaginary))
+
+    @classmethod
+    def from_complexes(cls, complexes: Iterable["Complex"], n: int = DEFAULT_PRECISION) -> "ComplexArray":
+        # Each component approximated to n significant digits
+        complexes = list(complexes)
+        return cls.from_numbers(
+            [x.real.approximate(n) for x in complexes],
+            [x.imaginary.value.approximate(n) for x in complexes]
+        )
+
+    @classmethod
+    def ones(cls, size: int) -> "ComplexArray":
+        return cls(NumberArray([1] * size, 0), NumberArray([0] * size, 0))
+
+    @property
+    def real(self) -> NumberArray:
+        return self.__real
+
+    @property
+    def imaginary(self) -> NumberArray:
+        return self.__imaginary
+
+    def __len__(self) -> int:
+        return len(self.real)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return self.real[index], self.imaginary[index]
+        return ComplexArray(self.real[index], self.imaginary[index])
+
+    def __iter__(self):
+        return zip(self.real, self.imaginary)
+
+    def __str__(self) -> str:
+        return "[" + ", ".join(f"{a} + {b}i" for a, b in self) + "]"
+
+    def to_complexes(self) -> list["Complex"]:
+        from Engine.Number.Complex import Complex
+        from Engine.Number.Real import Real
+
+        return [Complex.from_components(Real.from_number(a), Real.from_number(b)) for a, b in self]
+
+    __hash__ = None
+
+    def __neg__(self):
+        return self.negate()
+
+    def __add__(self, other):
+        return self.add(other)
+
+    def __sub__(self, other):
+        return self.subtract(other)
+
+    def __mul__(self, other):
+        return self.multiply(other)
+
+    def __truediv__(self, other):
+        return self.divide(other)
+
+    def __pow__(self, other):
+        return self.power(other)
+
+    def equal(self, other: "ComplexArray") -> np.ndarray:
+        return self.real.equal(other.real) & self.imaginary.equal(other.imaginary)
+
+    def conjugate(self) -> "ComplexArray":
+        return ComplexArray(self.real, self.imaginary.negate())
+
+    def norm(self) -> NumberArray:
+        return self.real * self.real + self.imaginary * self.imaginary
+
+    def negate(self) -> "ComplexArray":
+        return ComplexArray(self.real.negate(), self.imaginary.negate())
+
+    def add(self, other: "ComplexArray") -> "ComplexArray":
+        return ComplexArray(self.real.add(other.real), self.imaginary.add(other.imaginary))
+
+    def subtract(self, other: "ComplexArray") -> "ComplexArray":
+        return ComplexArray(self.real.subtract(other.real), self.imaginary.subtract(other.imaginary))
+
+    def multiply(self, other: "ComplexArray") -> "ComplexArray":
+        if other is self:
+            return ComplexArray(*gauss_square(self.real, self.imaginary))
+        return ComplexArray(*gauss_multiply(self.real, self.imaginary, other.real, other.imaginary))
+
+    def divide(self, other: "ComplexArray", n: int = DEFAULT_PRECISION) -> "ComplexArray":
+        # Smith's division, each element takes the branch its divisor needs.
+        # Quotients are truncated to n digits at every component division
+        c, d = other.real, other.imaginary
+        if ((c.mantissas == 0) & (d.mantissas == 0)).any():
+            raise ZeroDivisionError
+
+        def divide(x: NumberArray, y: NumberArray) -> NumberArray:
+            return x.divide(y, n)
+
+        mask = c.absolute().greater_equal(d.absolute())
+        if mask.all():
+            return ComplexArray(*smith_divide_real_major(self.real, self.imaginary, c, d, divide))
+        if not mask.any():
+            return ComplexArray(*smith_divide_imaginary_major(self.real, self.imaginary, c, d, divide))
+
+        x = self[mask]
+        y = self[~mask]
+        real_major = smith_divide_real_major(x.real, x.imaginary, c[mask], d[mask], divide)
+        imaginary_major = smith_divide_imaginary_major(y.real, y.imaginary, c[~mask], d[~mask], divide)
+        return ComplexArray(
+            merge(mask, real_major[0], imaginary_major[0]),
+            merge(mask, real_major[1], imaginary_major[1])
+        )
+
+    def power(self, n: int) -> "ComplexArray":
+        # Elementwise, through the same addition chains as scalars
+        if n < 0:
+            return ComplexArray.ones(len(self)).divide(self.power(-n))
+        return power(self, n, ComplexArray.ones(len(self)))
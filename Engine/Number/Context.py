@@ -0,0 +1,52 @@
+from Engine.Number import DEFAULT_PRECISION, Number
+
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+# Radix of the numbers a context builds, the decimal Number or the Binary
+# mantissa * 2 ** exponent form
+RADICES = (10, 2)
+
+
+class Context:
+    __slots__ = ("radix", "precision")
+
+    def __init__(self, radix: int = 10, precision: int = DEFAULT_PRECISION):
+        if radix not in RADICES:
+            raise ValueError(f"unsupported radix {radix}")
+        self.radix = radix
+        self.precision = precision
+
+    @property
+    def number_type(self) -> type:
+        if self.radix == 2:
+            from Engine.Number.Binary import Binary
+            return Binary
+        return Number
+
+    def number(self, value) -> "Number":
+        # value as a number of this context's radix, strings are the only
+        # inputs that go through decimal digits
+        return self.number_type.upgrade(value)
+
+
+CONTEXTS: list[Context] = [Context()]
+
+
+def current_context() -> Context:
+    return CONTEXTS[-1]
+
+
+@contextmanager
+def local_context(radix: Optional[int] = None, precision: Optional[int] = None) -> Iterator[Context]:
+    # A context inheriting the current one's settings, active for the block
+    current = current_context()
+    context = Context(
+        current.radix if radix is None else radix,
+        current.precision if precision is None else precision
+    )
+    CONTEXTS.append(context)
+    try:
+        yield context
+    finally:
+        CONTEXTS.remove(context)
@@ -3,6 +3,9 @@ from Engine.Number.Real import Real, REAL_ZERO, REAL_ONE
 
 
 class Imaginary(Skeleton):
+    # value * i
+    __slots__ = ("__value",)
+
     __value: Real
 
     def __init__(self, value: Real):
@@ -11,9 +14,16 @@ class Imaginary(Skeleton):
     def __hash__(self):
         return hash(("Imaginary", self.value))
 
+    def __str__(self):
+        return f"{self.value}i"
+
+    @classmethod
+    def from_imaginary(cls, imaginary: "Imaginary") -> "Imaginary":
+        return imaginary
+
     @property
-    def value(self):
-        pass
+    def value(self) -> Real:
+        return self.__value
 
     @property
     def real(self):
@@ -23,7 +33,21 @@ class Imaginary(Skeleton):
     def imaginary(self):
         return self
 
+    def equal(self, other: "Imaginary") -> bool:
+        return self.value.equal(other.value)
+
+    def negate(self) -> "Imaginary":
+        return Imaginary(self.value.negate())
+
+    def add(self, other: "Imaginary") -> "Imaginary":
+        return Imaginary(self.value.add(other.value))
+
+    def subtract(self, other: "Imaginary") -> "Imaginary":
+        return Imaginary(self.value.subtract(other.value))
+
 
 IMAGINARY_ZERO = Imaginary(REAL_ZERO)
 IMAGINARY_ONE = Imaginary(REAL_ONE)
 I = IMAGINARY_ONE
+
+Skeleton.register_coercion(Imaginary, "from_imaginary")
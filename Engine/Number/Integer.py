@@ -2,18 +2,25 @@ from Engine.Number import Skeleton, Number, NUMBER_ZERO, NUMBER_ONE
 from Engine.Number.Natural import Natural
 
 
-class Integer(Skeleton):
-    __value: Number
-
-    def __init__(self, value: Number):
-        assert self.__is_valid_value(value)
-        self.__value = value
+class Integer(Number):
+    # A validated view over Number: no state of its own, only the invariant
+    __slots__ = ()
+
+    def __new__(cls, value: Number):
+        index = cls.interned.index(value.mantissa, value.exponent)
+        if index is not None:
+            self = cls.interned.get(index)
+            if self is not None:
+                return self
+
+        assert cls.__is_valid_value(value)
+        self = cls.from_canonical(value.mantissa, value.exponent)
+        if index is not None:
+            cls.interned.put(index, self)
+        return self
 
     def __hash__(self):
-        return hash(("Integer", self.value))
-
-    def __str__(self):
-        return f"{self.value}"
+        return hash(("Integer", self.mantissa, self.exponent))
 
     @classmethod
     def __is_valid_value(cls, value: Number) -> bool:
@@ -33,11 +40,11 @@ class Integer(Skeleton):
 
     @classmethod
     def from_natural(cls, natural: Natural) -> "Integer":
-        return cls(natural.value)
+        return cls(natural)
 
     @property
     def value(self) -> Number:
-        return self.__value
+        return Number.from_canonical(self.mantissa, self.exponent)
 
     @property
     def real(self) -> "Integer":
@@ -55,67 +62,54 @@ class Integer(Skeleton):
     def is_fractional(self) -> bool:
         return False
 
-    def equal(self, other: "Integer") -> bool:
-        return self.value == other.value
-
-    def lower(self, other: "Integer") -> bool:
-        return self.value < other.value
-
-    def greater(self, other: "Integer") -> bool:
-        return self.value > other.value
-
-    def lower_equal(self, other: "Integer") -> bool:
-        return self.value <= other.value
-
-    def greater_equal(self, other: "Integer") -> bool:
-        return self.value >= other.value
-
     def absolute(self) -> "Integer":
         return Integer(
-            abs(self.value)
+            Number.absolute(self)
         )
 
     def add(self, other: "Integer") -> "Integer":
-        return Natural(
-            self.value + other.value
+        return Integer(
+            Number.add(self, other)
         )
 
-    def negate(self): "Integer":
+    def negate(self) -> "Integer":
         return Integer(
-            -self.value
+            Number.negate(self)
         )
 
     def subtract(self, other: "Integer") -> "Integer":
-        return Natural(
-            self.value - other.value
+        return Integer(
+            Number.subtract(self, other)
         )
 
     def multiply(self, other: "Integer") -> "Integer":
-        return Natural(
-            self.value * other.value
+        return Integer(
+            Number.multiply(self, other)
         )
 
     def power(self, other: "Integer") -> "Integer":
-        assert other >= 0
-        return Natural(
-            self.value ** other.value
+        assert other.mantissa >= 0
+        return Integer(
+            Number.power(self, other)
         )
 
     def divide(self, other: "Integer") -> "Integer":
         return Integer(
-            self.value / other.value
+            Number.divide(self, other)
         )
 
     def floor_divide(self, other: "Integer") -> "Integer":
         return Integer(
-            self.value // other.value
+            Number.floor_divide(self, other)
         )
 
     def modulus(self, other: "Integer") -> "Integer":
         return Integer(
-            self.value % other.value
+            Number.modulus(self, other)
         )
 
 
 INTEGER_ZERO = Integer(NUMBER_ZERO)
 INTEGER_ONE = Integer(NUMBER_ONE)
+
+Skeleton.register_coercion(Integer, "from_integer")
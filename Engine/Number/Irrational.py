@@ -1,22 +1,70 @@
-from Engine.Number import Skeleton
+from Engine.Algorithm.Decimal import power_of_ten
+from Engine.Algorithm.DigitStream import e_digits, integer_digits, pi_digits, square_root_digits
+from Engine.Number import DEFAULT_PRECISION, Skeleton, Number
+
+from typing import Callable, Iterator, Optional
+
+# A key names how an irrational was built, as a constructor name and Python
+# integer arguments, so that it can be rebuilt in another process
+IrrationalKey = tuple
 
 
 class Irrational(Skeleton):
-    # __generator: Function
+    # A lazily evaluated decimal expansion: generator() starts a stream of
+    # (k, floor(x * 10 ** k)) for growing k, and the longest truncation seen
+    # so far is kept so that shorter prefixes never touch the stream again
+    __slots__ = ("__generator", "__key", "__stream", "__known", "__truncation")
 
-    def __init__(self, generator):
+    __generator: Callable[[], Iterator[tuple[int, int]]]
+    __key: Optional[IrrationalKey]
+    __stream: Optional[Iterator[tuple[int, int]]]
+    __known: int
+    __truncation: int
+
+    def __init__(self, generator: Callable[[], Iterator[tuple[int, int]]], key: Optional[IrrationalKey] = None):
         self.__generator = generator
+        self.__key = key
+        self.__stream = None
+        self.__known = -1
+        self.__truncation = 0
 
     def __hash__(self):
-        return hash("Irrational", self.generator)
+        return hash(("Irrational", self.generator))
+
+    def __str__(self):
+        return f"{self.integer}.{self.digits(DEFAULT_PRECISION)}..."
 
-    # def __str__(self):
-    #     return f"{self.compute()}..."
+    @classmethod
+    def from_irrational(cls, irrational: "Irrational") -> "Irrational":
+        return irrational
+
+    @classmethod
+    def square_root(cls, x: int) -> "Irrational":
+        assert x >= 0
+        return cls(lambda: square_root_digits(x), ("square_root", x))
+
+    @classmethod
+    def from_key(cls, key: IrrationalKey) -> "Irrational":
+        # The module constants are returned as themselves, so that their
+        # digits are shared and identity checks against them hold
+        for constant in (IRRATIONAL_ZERO, IRRATIONAL_ONE, IRRATIONAL_PI, IRRATIONAL_E):
+            if constant.key == key:
+                return constant
+        name, *arguments = key
+        if name == "integer":
+            return cls(lambda: integer_digits(arguments[0]), key)
+        if name == "square_root":
+            return cls.square_root(*arguments)
+        raise ValueError(f"unknown irrational {name!r}")
 
     @property
-    def generator(self):
+    def generator(self) -> Callable[[], Iterator[tuple[int, int]]]:
         return self.__generator
 
+    @property
+    def key(self) -> Optional[IrrationalKey]:
+        return self.__key
+
     @property
     def real(self):
         return self
@@ -25,6 +73,37 @@ class Irrational(Skeleton):
     def imaginary(self):
         return None
 
+    @property
+    def precision(self) -> int:
+        # Fractional digits produced so far
+        return max(self.__known, 0)
+
+    @property
+    def integer(self) -> int:
+        return self.truncated(0)
+
+    def truncated(self, k: int) -> int:
+        # floor(x * 10 ** k)
+        if self.__stream is None:
+            self.__stream = self.__generator()
+        while self.__known < k:
+            self.__known, self.__truncation = next(self.__stream)
+        return self.__truncation // power_of_ten(self.__known - k)
+
+    def digits(self, k: int) -> str:
+        # The first k fractional digits
+        if k == 0:
+            return ""
+        return f"{self.truncated(k) % power_of_ten(k):0{k}d}"
+
+    def approximate(self, k: int) -> Number:
+        # Truncated to k fractional digits
+        return Number(self.truncated(k), -k)
+
+
+IRRATIONAL_ZERO = Irrational(lambda: integer_digits(0), ("integer", 0))
+IRRATIONAL_ONE = Irrational(lambda: integer_digits(1), ("integer", 1))
+IRRATIONAL_PI = Irrational(pi_digits, ("pi",))
+IRRATIONAL_E = Irrational(e_digits, ("e",))
 
-IRRATIONAL_ZERO = Irrational(lambda: 0)
-IRRATIONAL_ONE = Irrational(lambda: 1)
+Skeleton.register_coercion(Irrational, "from_irrational")
@@ -1,23 +1,29 @@
-from Engine.Algorithm import natural_modulus
 from Engine.Number import Skeleton, Number, NUMBER_ZERO, NUMBER_ONE
 
 
-class Natural(Skeleton):
-    __value: Number
+class Natural(Number):
+    # A validated view over Number: no state of its own, only the invariant
+    __slots__ = ()
 
-    def __init__(self, value: Number):
-        assert self.__is_valid_value(value)
-        self.__value = value
+    def __new__(cls, value: Number):
+        index = cls.interned.index(value.mantissa, value.exponent)
+        if index is not None:
+            self = cls.interned.get(index)
+            if self is not None:
+                return self
 
-    def __hash__(self):
-        return hash(("Natural", self.value))
+        assert cls.__is_valid_value(value)
+        self = cls.from_canonical(value.mantissa, value.exponent)
+        if index is not None:
+            cls.interned.put(index, self)
+        return self
 
-    def __str__(self) -> str:
-        return f"{value}"
+    def __hash__(self):
+        return hash(("Natural", self.mantissa, self.exponent))
 
     @classmethod
     def __is_valid_value(cls, value: Number) -> bool:
-        return value.is_integer and value >= NUMBER_ZERO
+        return value.is_integer and value.mantissa >= 0
 
     @classmethod
     def from_string(cls, string: str) -> "Natural":
@@ -33,7 +39,7 @@ class Natural(Skeleton):
 
     @property
     def value(self) -> "Number":
-        return self.__value
+        return Number.from_canonical(self.mantissa, self.exponent)
 
     @property
     def real(self) -> "Natural":
@@ -51,60 +57,46 @@ class Natural(Skeleton):
     def is_fractional(self) -> bool:
         return False
 
-    def equal(self, other: "Natural") -> bool:
-        return self.value == other.value
-
-    def lower(self, other: "Natural") -> bool:
-        return self.value < other.value
-
-    def greater(self, other: "Natural") -> bool:
-        return self.value > other.value
-
-    def lower_equal(self, other: "Natural") -> bool:
-        return self.value <= other.value
-
-    def greater_equal(self, other: "Natural") -> bool:
-        return self.value >= other.value
-
     def absolute(self) -> "Natural":
         return self
 
     def add(self, other: "Natural") -> "Natural":
         return Natural(
-            self.value + other.value
+            Number.add(self, other)
         )
 
     def subtract(self, other: "Natural") -> "Natural":
         return Natural(
-            self.value - other.value
+            Number.subtract(self, other)
         )
 
     def multiply(self, other: "Natural") -> "Natural":
         return Natural(
-            self.value * other.value
+            Number.multiply(self, other)
         )
 
-    # TODO: Implement Efficient Exponentiation
     def power(self, other: "Natural") -> "Natural":
         return Natural(
-            self.value ** other.value
+            Number.power(self, other)
         )
 
     def divide(self, other: "Natural") -> "Natural":
         return Natural(
-            self.value / other.value
+            Number.divide(self, other)
         )
 
     def floor_divide(self, other: "Natural") -> "Natural":
         return Natural(
-            self.value // other.value
+            Number.floor_divide(self, other)
         )
 
     def modulus(self, other: "Natural") -> "Natural":
         return Natural(
-            self.value % other.value
+            Number.modulus(self, other)
         )
 
 
 NATURAL_ZERO = Natural(NUMBER_ZERO)
 NATURAL_ONE = Natural(NUMBER_ONE)
+
+Skeleton.register_coercion(Natural, "from_natural")
@@ -0,0 +1,389 @@
+from Engine.Algorithm.Decimal import aligned_sum, power_of_ten, strip_trailing_zeros
+from Engine.Algorithm.Division import decimal_division
+from Engine.Algorithm.Encoding import read_bytes, read_integer, read_varint, write_integer, write_varint
+from Engine.Algorithm import Kernel
+from Engine.Algorithm.Kernel import INT64_DIGITS, INT64_MAXIMUM, INT64_POWERS_OF_TEN
+from Engine.Algorithm.Product import product_tree
+from Engine.Algorithm.Series import cosine, exponential, sine
+from Engine.Number import DEFAULT_PRECISION, Number
+from Engine.Number.Serialization import (
+    TAG_NUMBER_ARRAY, dumps, loads, register_serialization
+)
+
+import numpy as np
+from typing import Iterable, Optional
+
+INT64_POWERS_OF_TEN_ARRAY = np.array(INT64_POWERS_OF_TEN, dtype=np.int64)
+
+# Products estimated below 2 ** 62 in float64 cannot overflow int64
+INT64_PRODUCT_BOUND = float(1 << 62)
+
+# Layouts of serialized mantissas
+ARRAY_INT64 = 0
+ARRAY_OBJECT = 1
+
+# Elementwise kernels over object arrays, they run in a C loop over Python
+# integers and never build Number objects
+STRIP_TRAILING_ZEROS = np.frompyfunc(strip_trailing_zeros, 1, 2)
+POWER_OF_TEN = np.frompyfunc(power_of_ten, 1, 1)
+DECIMAL_DIVISION = np.frompyfunc(decimal_division, 5, 2)
+SINE = np.frompyfunc(sine, 3, 2)
+COSINE = np.frompyfunc(cosine, 3, 2)
+EXPONENTIAL = np.frompyfunc(exponential, 3, 2)
+
+
+def narrow(mantissas: np.ndarray) -> np.ndarray:
+    # Object mantissas move back to int64 once every value fits, the minimum
+    # is excluded so that negation and abs never overflow
+    if mantissas.dtype == object:
+        if mantissas.size == 0 or (mantissas.min() >= -INT64_MAXIMUM and mantissas.max() <= INT64_MAXIMUM):
+            return mantissas.astype(np.int64)
+        return mantissas
+    if mantissas.size and mantissas.min() < -INT64_MAXIMUM:
+        return mantissas.astype(object)
+    return mantissas
+
+
+def mantissa_array(values) -> np.ndarray:
+    # int64 when every value fits, Python integers in an object array otherwise
+    mantissas = np.atleast_1d(np.asarray(values))
+    kind = mantissas.dtype.kind
+    if kind not in "iuO":
+        if isinstance(values, np.ndarray):
+            raise TypeError(f"mantissas must be integers, not {mantissas.dtype}")
+        # numpy picks uint64 or float64 for Python integers past int64 mixed
+        # with others, which loses digits, so they are taken as objects
+        mantissas = np.atleast_1d(np.array(values, dtype=object))
+    elif kind == "u" or mantissas.dtype.itemsize > 8:
+        mantissas = mantissas.astype(object)
+    elif kind == "i":
+        mantissas = mantissas.astype(np.int64)
+    return narrow(mantissas)
+
+
+def widen(mantissas: np.ndarray) -> np.ndarray:
+    return mantissas if mantissas.dtype == object else mantissas.astype(object)
+
+
+def canonical(mantissas: np.ndarray, exponents: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # The normalization Number.__new__ applies, for every element at once
+    exponents = np.where(mantissas == 0, 0, exponents).astype(np.int64)
+    if mantissas.dtype == object:
+        mantissas, zeros = STRIP_TRAILING_ZEROS(mantissas)
+        return narrow(mantissas.astype(object)), exponents + zeros.astype(np.int64)
+
+    mantissas = mantissas.copy()
+    Kernel.int64_canonical(mantissas, exponents)
+    return mantissas, exponents
+
+
+def scale(mantissas: np.ndarray, shifts: np.ndarray) -> np.ndarray:
+    # mantissas * 10 ** shifts for shifts >= 0
+    if mantissas.dtype != object and (shifts.size == 0 or shifts.max() <= INT64_DIGITS):
+        powers = INT64_POWERS_OF_TEN_ARRAY[shifts]
+        if (np.abs(mantissas) <= INT64_MAXIMUM // powers).all():
+            return mantissas * powers
+    return widen(mantissas) * POWER_OF_TEN(shifts.astype(object))
+
+
+def aligned(x_mantissas: np.ndarray, x_exponents: np.ndarray,
+            y_mantissas: np.ndarray, y_exponents: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Zeros take the exponent of the other operand so they never force a rescale
+    x_exponents, y_exponents = (
+        np.where(x_mantissas == 0, y_exponents, x_exponents),
+        np.where(y_mantissas == 0, x_exponents, y_exponents)
+    )
+    exponents = np.minimum(x_exponents, y_exponents)
+    return (
+        scale(x_mantissas, x_exponents - exponents),
+        scale(y_mantissas, y_exponents - exponents),
+        exponents
+    )
+
+
+def int64_operands(x: "NumberArray", y: "NumberArray") -> Optional[list[np.ndarray]]:
+    # Broadcast fields for the compiled kernels, None when a side holds
+    # mantissas beyond int64
+    if x.mantissas.dtype == object or y.mantissas.dtype == object:
+        return None
+    shape = np.broadcast_shapes(x.mantissas.shape, y.mantissas.shape)
+    return [np.broadcast_to(a, shape) for a in (x.mantissas, x.exponents, y.mantissas, y.exponents)]
+
+
+def add(x_mantissas: np.ndarray, y_mantissas: np.ndarray) -> np.ndarray:
+    if x_mantissas.dtype != object and y_mantissas.dtype != object:
+        s = x_mantissas + y_mantissas
+        # Two's complement overflow flips the sign away from both operands
+        if not (((x_mantissas ^ s) & (y_mantissas ^ s)) < 0).any():
+            return s
+    return widen(x_mantissas) + widen(y_mantissas)
+
+
+def multiply(x_mantissas: np.ndarray, y_mantissas: np.ndarray) -> np.ndarray:
+    if x_mantissas.dtype != object and y_mantissas.dtype != object:
+        estimate = np.abs(x_mantissas.astype(np.float64)) * np.abs(y_mantissas.astype(np.float64))
+        if (estimate < INT64_PRODUCT_BOUND).all():
+            return x_mantissas * y_mantissas
+    return widen(x_mantissas) * widen(y_mantissas)
+
+
+class NumberArray:
+    __slots__ = ("__mantissas", "__exponents")
+
+    __mantissas: np.ndarray
+    __exponents: np.ndarray
+
+    def __new__(cls, mantissas, exponents):
+        mantissas, exponents = np.broadcast_arrays(
+            mantissa_array(mantissas),
+            np.atleast_1d(np.asarray(exponents, dtype=np.int64))
+        )
+        return cls.from_canonical(*canonical(mantissas, exponents))
+
+    @classmethod
+    def from_canonical(cls, mantissas: np.ndarray, exponents: np.ndarray) -> "NumberArray":
+        # Skips normalization, the caller guarantees the canonical form
+        self = object.__new__(cls)
+        self.__mantissas = mantissas
+        self.__exponents = exponents
+        return self
+
+    @classmethod
+    def from_numbers(cls, numbers: Iterable["Number"]) -> "NumberArray":
+        numbers = [x if isinstance(x, Number) else Number.upgrade(x) for x in numbers]
+        return cls.from_canonical(
+            mantissa_array([x.mantissa for x in numbers]),
+            np.array([x.exponent for x in numbers], dtype=np.int64)
+        )
+
+    @classmethod
+    def from_python_integers(cls, python_integers: Iterable[int]) -> "NumberArray":
+        return cls(list(python_integers), 0)
+
+    @classmethod
+    def from_number(cls, number: "Number") -> "NumberArray":
+        # A single element that broadcasts against arrays of any length
+        return cls.from_canonical(
+            mantissa_array([number.mantissa]),
+            np.array([number.exponent], dtype=np.int64)
+        )
+
+    @classmethod
+    def upgrade(cls, other) -> "NumberArray":
+        if isinstance(other, NumberArray):
+            return other
+        if not isinstance(other, Number):
+            other = Number.upgrade(other)
+        return cls.from_number(other)
+
+    @property
+    def mantissas(self) -> np.ndarray:
+        return self.__mantissas
+
+    @property
+    def exponents(self) -> np.ndarray:
+        return self.__exponents
+
+    def __len__(self) -> int:
+        return len(self.mantissas)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Number.from_canonical(int(self.mantissas[index]), int(self.exponents[index]))
+        return NumberArray.from_canonical(self.mantissas[index], self.exponents[index])
+
+    def __iter__(self):
+        for mantissa, exponent in zip(self.mantissas.tolist(), self.exponents.tolist()):
+            yield Number.from_canonical(mantissa, exponent)
+
+    def __str__(self) -> str:
+        return "[" + ", ".join(f"{m}e{e}" for m, e in zip(self.mantissas.tolist(), self.exponents.tolist())) + "]"
+
+    def to_numbers(self) -> list["Number"]:
+        return list(self)
+
+    def write(self, buffer: bytearray) -> None:
+        # The count, the exponents as raw little endian int64, then the
+        # mantissas the same way when they fit, or one integer each
+        write_varint(buffer, len(self))
+        buffer += self.exponents.astype("<i8").tobytes()
+        if self.mantissas.dtype == object:
+            buffer.append(ARRAY_OBJECT)
+            for mantissa in self.mantissas.tolist():
+                write_integer(buffer, mantissa)
+        else:
+            buffer.append(ARRAY_INT64)
+            buffer += self.mantissas.astype("<i8").tobytes()
+
+    @classmethod
+    def read(cls, data, position: int) -> tuple["NumberArray", int]:
+        count, position = read_varint(data, position)
+        column, position = read_bytes(data, position, 8 * count)
+        exponents = np.frombuffer(column, dtype="<i8").astype(np.int64)
+        layout = data[position]
+        position += 1
+        if layout == ARRAY_INT64:
+            column, position = read_bytes(data, position, 8 * count)
+            mantissas = np.frombuffer(column, dtype="<i8").astype(np.int64)
+            return cls.from_canonical(mantissas, exponents), position
+
+        mantissas = np.empty(count, dtype=object)
+        for i in range(count):
+            mantissas[i], position = read_integer(data, position)
+        return cls.from_canonical(mantissas, exponents), position
+
+    def __reduce__(self):
+        return loads, (dumps(self),)
+
+    def __eq__(self, other):
+        return self.equal(NumberArray.upgrade(other))
+
+    def __ne__(self, other):
+        return ~self.equal(NumberArray.upgrade(other))
+
+    def __lt__(self, other):
+        return self.lower(NumberArray.upgrade(other))
+
+    def __gt__(self, other):
+        return self.greater(NumberArray.upgrade(other))
+
+    def __le__(self, other):
+        return self.lower_equal(NumberArray.upgrade(other))
+
+    def __ge__(self, other):
+        return self.greater_equal(NumberArray.upgrade(other))
+
+    __hash__ = None
+
+    def __abs__(self):
+        return self.absolute()
+
+    def __neg__(self):
+        return self.negate()
+
+    def __add__(self, other):
+        return self.add(NumberArray.upgrade(other))
+
+    def __radd__(self, other):
+        return NumberArray.upgrade(other).add(self)
+
+    def __sub__(self, other):
+        return self.subtract(NumberArray.upgrade(other))
+
+    def __rsub__(self, other):
+        return NumberArray.upgrade(other).subtract(self)
+
+    def __mul__(self, other):
+        return self.multiply(NumberArray.upgrade(other))
+
+    def __rmul__(self, other):
+        return NumberArray.upgrade(other).multiply(self)
+
+    def __truediv__(self, other):
+        return self.divide(NumberArray.upgrade(other))
+
+    def __rtruediv__(self, other):
+        return NumberArray.upgrade(other).divide(self)
+
+    def equal(self, other: "NumberArray") -> np.ndarray:
+        # Both sides are canonical, so equal values have equal fields
+        return (self.mantissas == other.mantissas) & (self.exponents == other.exponents)
+
+    def lower(self, other: "NumberArray") -> np.ndarray:
+        operands = int64_operands(self, other)
+        if operands is not None:
+            lower = np.empty(len(operands[0]), dtype=np.bool_)
+            if Kernel.int64_lower_array(*operands, lower):
+                return lower
+
+        x, y, _ = aligned(self.mantissas, self.exponents, other.mantissas, other.exponents)
+        return np.asarray(x < y, dtype=bool)
+
+    def greater(self, other: "NumberArray") -> np.ndarray:
+        return other.lower(self)
+
+    def lower_equal(self, other: "NumberArray") -> np.ndarray:
+        return ~other.lower(self)
+
+    def greater_equal(self, other: "NumberArray") -> np.ndarray:
+        return ~self.lower(other)
+
+    def absolute(self) -> "NumberArray":
+        return NumberArray.from_canonical(np.abs(self.mantissas), self.exponents)
+
+    def negate(self) -> "NumberArray":
+        return NumberArray.from_canonical(-self.mantissas, self.exponents)
+
+    def add(self, other: "NumberArray") -> "NumberArray":
+        operands = int64_operands(self, other)
+        if operands is not None:
+            mantissas = np.empty(len(operands[0]), dtype=np.int64)
+            exponents = np.empty(len(operands[0]), dtype=np.int64)
+            if Kernel.int64_add_array(*operands, mantissas, exponents):
+                return NumberArray(mantissas, exponents)
+
+        x, y, exponents = aligned(self.mantissas, self.exponents, other.mantissas, other.exponents)
+        return NumberArray(add(x, y), exponents)
+
+    def subtract(self, other: "NumberArray") -> "NumberArray":
+        return self.add(other.negate())
+
+    def multiply(self, other: "NumberArray") -> "NumberArray":
+        return NumberArray(
+            multiply(self.mantissas, other.mantissas),
+            self.exponents + other.exponents
+        )
+
+    def divide(self, other: "NumberArray", n: int = DEFAULT_PRECISION) -> "NumberArray":
+        if (other.mantissas == 0).any():
+            raise ZeroDivisionError
+
+        operands = int64_operands(self, other)
+        if operands is not None:
+            mantissas = np.empty(len(operands[0]), dtype=np.int64)
+            exponents = np.empty(len(operands[0]), dtype=np.int64)
+            if Kernel.int64_division_array(*operands, n, mantissas, exponents):
+                return NumberArray(mantissas, exponents)
+
+        mantissas, exponents = DECIMAL_DIVISION(
+            widen(self.mantissas), self.exponents.astype(object),
+            widen(other.mantissas), other.exponents.astype(object),
+            n
+        )
+        return NumberArray(mantissas.astype(object), exponents.astype(np.int64))
+
+    def sum(self) -> "Number":
+        # Mantissas sharing an exponent are summed in one object reduction
+        # per exponent, then the partial sums are aligned once
+        if len(self) == 0:
+            return Number(0, 0)
+
+        order = np.argsort(self.exponents, kind="stable")
+        exponents = self.exponents[order]
+        starts = np.flatnonzero(np.concatenate(([True], exponents[1:] != exponents[:-1])))
+        totals = np.add.reduceat(widen(self.mantissas[order]), starts)
+        return Number(
+            *aligned_sum(list(zip(totals.tolist(), exponents[starts].tolist())))
+        )
+
+    def product(self) -> "Number":
+        return Number(
+            product_tree(self.mantissas.tolist()),
+            sum(self.exponents.tolist())
+        )
+
+    def map(self, function: np.ufunc, n: int) -> "NumberArray":
+        mantissas, exponents = function(widen(self.mantissas), self.exponents.astype(object), n)
+        return NumberArray(mantissas.astype(object), exponents.astype(np.int64))
+
+    def sin(self, n: int = DEFAULT_PRECISION) -> "NumberArray":
+        return self.map(SINE, n)
+
+    def cos(self, n: int = DEFAULT_PRECISION) -> "NumberArray":
+        return self.map(COSINE, n)
+
+    def exp(self, n: int = DEFAULT_PRECISION) -> "NumberArray":
+        return self.map(EXPONENTIAL, n)
+
+
+register_serialization(NumberArray, TAG_NUMBER_ARRAY, lambda buffer, array: array.write(buffer), NumberArray.read)
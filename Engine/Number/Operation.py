@@ -0,0 +1,33 @@
+from Engine.Algorithm.Decimal import power_of_ten
+from Engine.Algorithm import Kernel
+from Engine.Algorithm.Kernel import INT64_FACTORIAL_LIMIT
+from Engine.Algorithm.Product import factorial as integer_factorial
+from Engine.Algorithm.Series import cosine, exponential, sine
+from Engine.Number import DEFAULT_PRECISION
+
+
+def factorial(x: "Number") -> "Number":
+    from Engine.Number import Number
+    assert x.is_integer and x.mantissa >= 0
+    n = x.mantissa * power_of_ten(x.exponent)
+    if n <= INT64_FACTORIAL_LIMIT and Kernel.WARMUP.ready():
+        return Number(Kernel.int64_factorial(n), 0)
+    return Number(
+        integer_factorial(n),
+        0
+    )
+
+
+def sin(x: "Number", n: int = DEFAULT_PRECISION) -> "Number":
+    from Engine.Number import Number
+    return Number(*sine(x.mantissa, x.exponent, n))
+
+
+def cos(x: "Number", n: int = DEFAULT_PRECISION) -> "Number":
+    from Engine.Number import Number
+    return Number(*cosine(x.mantissa, x.exponent, n))
+
+
+def exp(x: "Number", n: int = DEFAULT_PRECISION) -> "Number":
+    from Engine.Number import Number
+    return Number(*exponential(x.mantissa, x.exponent, n))
@@ -1,51 +1,113 @@
-from Engine.Number import Skeleton, Number
+from Engine.Algorithm.Decimal import power_of_ten
+from Engine.Algorithm.Division import decimal_division
+from Engine.Algorithm.Exponentiation import power
+from Engine.Algorithm.GCD import decimal_gcd, gcd
+from Engine.Number import DEFAULT_PRECISION, Skeleton, Number
 from Engine.Number.Natural import Natural
 from Engine.Number.Integer import Integer, INTEGER_ZERO, INTEGER_ONE
 
+# Results are left unreduced until the numerator or denominator outgrows
+# twice its size at the last reduction, and never below this many bits
+RATIONAL_REDUCTION_BITS = 1024
+
+
+def integer_value(integer: Integer) -> int:
+    return integer.mantissa * power_of_ten(integer.exponent)
+
 
 class Rational(Skeleton):
-    __numerator: Integer
-    __denominator: Integer
+    # Numerator and denominator are kept as Python integers with a positive
+    # denominator, and are only reduced on demand
+    __slots__ = ("__numerator", "__denominator", "__reduced", "__bound")
+
+    __numerator: int
+    __denominator: int
+    __reduced: bool
+    __bound: int
 
     def __init__(self, numerator: Integer, denominator: Integer):
         assert denominator != INTEGER_ZERO
+        self.__assign(integer_value(numerator), integer_value(denominator), False, RATIONAL_REDUCTION_BITS)
+        self.reduce()
+
+    @classmethod
+    def from_fraction(cls, numerator: int, denominator: int, bound: int = RATIONAL_REDUCTION_BITS) -> "Rational":
+        # Trusted constructor over Python integers, the denominator is nonzero
+        self = object.__new__(cls)
+        self.__assign(numerator, denominator, False, bound)
+        if max(self.__numerator.bit_length(), self.__denominator.bit_length()) > bound:
+            self.reduce()
+        return self
+
+    @classmethod
+    def from_canonical(cls, numerator: int, denominator: int) -> "Rational":
+        # Skips reduction, the caller guarantees a reduced fraction
+        self = object.__new__(cls)
+        self.__assign(numerator, denominator, True, RATIONAL_REDUCTION_BITS)
+        return self
+
+    def __assign(self, numerator: int, denominator: int, reduced: bool, bound: int) -> None:
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
         self.__numerator = numerator
         self.__denominator = denominator
+        self.__reduced = reduced or denominator == 1
+        self.__bound = bound
 
     def __hash__(self):
-        return hash(("Rational", self.numerator, self.denominator))
+        self.reduce()
+        return hash(("Rational", self.__numerator, self.__denominator))
 
     def __str__(self) -> str:
         return f"{self.numerator}/{self.denominator}"
 
-        @classmethod
     @classmethod
     def from_string(cls, string: str) -> "Rational":
-        return cls(Integer.from_string(string), INTEGER_ONE)
+        if "/" in string:
+            numerator, denominator = [Number.from_string(_) for _ in string.split("/")]
+            if not (numerator.is_integer and denominator.is_integer):
+                raise ValueError(f"invalid rational {string!r}")
+            numerator, denominator = integer_value(numerator), integer_value(denominator)
+            if denominator == 0:
+                raise ZeroDivisionError
+            return cls.from_fraction(numerator, denominator).reduce()
+        return cls.from_number(Number.from_string(string))
 
     @classmethod
-    def from_python_integer(cls, python_integer: int) "Rational":
-        return cls(Integer.from_python_integer(python_integer), INTEGER_ONE)
+    def from_python_integer(cls, python_integer: int) -> "Rational":
+        return cls.from_canonical(python_integer, 1)
 
     @classmethod
     def from_number(cls, number: Number) -> "Rational":
-        return cls(Integer.from_number(number), INTEGER_ONE)
+        if number.exponent >= 0:
+            return cls.from_canonical(number.mantissa * power_of_ten(number.exponent), 1)
+
+        # The denominator is a power of ten, so the gcd only needs the
+        # factors of two and five of the mantissa
+        g = decimal_gcd(number.mantissa, -number.exponent)
+        return cls.from_canonical(number.mantissa // g, power_of_ten(-number.exponent) // g)
 
     @classmethod
     def from_natural(cls, natural: Natural) -> "Rational":
-        return cls(Integer.from_natural(natural), INTEGER_ONE)
+        return cls.from_canonical(integer_value(natural), 1)
 
     @classmethod
     def from_integer(cls, integer: Integer) -> "Rational":
-        return cls(integer, INTEGER_ONE)
+        return cls.from_canonical(integer_value(integer), 1)
+
+    @classmethod
+    def from_rational(cls, rational: "Rational") -> "Rational":
+        return rational
 
     @property
     def numerator(self) -> "Integer":
-        return self.__numerator
+        self.reduce()
+        return Integer(Number(self.__numerator, 0))
 
     @property
     def denominator(self) -> "Integer":
-        return self.__denominator
+        self.reduce()
+        return Integer(Number(self.__denominator, 0))
 
     @property
     def real(self) -> "Rational":
@@ -55,60 +117,117 @@ class Rational(Skeleton):
     def imaginary(self):
         return None
 
-    def reduce(self) -> "Rational":
-        pass
-
-    def equal(self, other: "Rational") -> bool:
-        return self.value == other.value
-
-    def lower(self, other: "Integer") -> bool:
-        return self.value < other.value
-
-    def greater(self, other: "Integer") -> bool:
-        return self.value > other.value
-
-    def lower_equal(self, other: "Integer") -> bool:
-        return self.value <= other.value
-
-    def greater_equal(self, other: "Integer") -> bool:
-        return self.value >= other.value
+    @property
+    def is_reduced(self) -> bool:
+        return self.__reduced
 
-    def absolute(self) -> "Integer":
-        return Integer(
-            abs(self.value)
-        )
+    def reduce(self) -> "Rational":
+        # In place, the value does not change
+        if not self.__reduced:
+            g = gcd(self.__numerator, self.__denominator)
+            if g != 1:
+                self.__numerator //= g
+                self.__denominator //= g
+            self.__reduced = True
+            self.__bound = max(
+                RATIONAL_REDUCTION_BITS,
+                2 * max(self.__numerator.bit_length(), self.__denominator.bit_length())
+            )
+        return self
 
-    def add(self, other: "Integer") -> "Integer":
-        return Natural(
-            self.value + other.value
+    def to_number(self, n: int = DEFAULT_PRECISION) -> Number:
+        return Number(
+            *decimal_division(self.__numerator, 0, self.__denominator, 0, n)
         )
 
-    def negate(self): "Integer":
-        return Integer(
-            -self.value
-        )
+    def __cross(self, other: "Rational") -> tuple[int, int]:
+        # Both sides over the same positive denominator, without dividing
+        if self.__denominator == other.__denominator:
+            return self.__numerator, other.__numerator
+        return self.__numerator * other.__denominator, other.__numerator * self.__denominator
 
-    def subtract(self, other: "Integer") -> "Integer":
-        return Natural(
-            self.value - other.value
+    def equal(self, other: "Rational") -> bool:
+        if self.__reduced and other.__reduced:
+            return self.__numerator == other.__numerator and self.__denominator == other.__denominator
+        x, y = self.__cross(other)
+        return x == y
+
+    def lower(self, other: "Rational") -> bool:
+        x, y = self.__cross(other)
+        return x < y
+
+    def greater(self, other: "Rational") -> bool:
+        x, y = self.__cross(other)
+        return x > y
+
+    def lower_equal(self, other: "Rational") -> bool:
+        x, y = self.__cross(other)
+        return x <= y
+
+    def greater_equal(self, other: "Rational") -> bool:
+        x, y = self.__cross(other)
+        return x >= y
+
+    def absolute(self) -> "Rational":
+        if self.__numerator >= 0:
+            return self
+        return self.negate()
+
+    def negate(self) -> "Rational":
+        if self.__reduced:
+            return Rational.from_canonical(-self.__numerator, self.__denominator)
+        return Rational.from_fraction(-self.__numerator, self.__denominator, self.__bound)
+
+    def add(self, other: "Rational") -> "Rational":
+        bound = max(self.__bound, other.__bound)
+        if self.__denominator == other.__denominator:
+            return Rational.from_fraction(self.__numerator + other.__numerator, self.__denominator, bound)
+        return Rational.from_fraction(
+            self.__numerator * other.__denominator + other.__numerator * self.__denominator,
+            self.__denominator * other.__denominator,
+            bound
         )
 
-    def multiply(self, other: "Integer") -> "Integer":
-        return Natural(
-            self.value * other.value
-        )
+    def subtract(self, other: "Rational") -> "Rational":
+        return self.add(other.negate())
 
-    def power(self, other: "Integer") -> "Integer":
-        assert other >= 0
-        return Natural(
-            self.value ** other.value
+    def multiply(self, other: "Rational") -> "Rational":
+        return Rational.from_fraction(
+            self.__numerator * other.__numerator,
+            self.__denominator * other.__denominator,
+            max(self.__bound, other.__bound)
         )
 
-    def divide(self, other: "Integer") -> "Integer":
-        return Natural(
-            self.value / other.value
+    def power(self, other: "Rational") -> "Rational":
+        # Powers of a reduced fraction stay reduced
+        other.reduce()
+        assert other.__denominator == 1
+        self.reduce()
+        n = other.__numerator
+        if n >= 0:
+            return Rational.from_canonical(power(self.__numerator, n), power(self.__denominator, n))
+        if self.__numerator == 0:
+            raise ZeroDivisionError
+        return Rational.from_canonical(power(self.__denominator, -n), power(self.__numerator, -n))
+
+    def invert(self) -> "Rational":
+        if self.__numerator == 0:
+            raise ZeroDivisionError
+        if self.__reduced:
+            return Rational.from_canonical(self.__denominator, self.__numerator)
+        return Rational.from_fraction(self.__denominator, self.__numerator, self.__bound)
+
+    def divide(self, other: "Rational") -> "Rational":
+        if other.__numerator == 0:
+            raise ZeroDivisionError
+        return Rational.from_fraction(
+            self.__numerator * other.__denominator,
+            self.__denominator * other.__numerator,
+            max(self.__bound, other.__bound)
         )
 
 
 RATIONAL_ZERO = Rational(INTEGER_ZERO, INTEGER_ONE)
 RATIONAL_ONE = Rational(INTEGER_ONE, INTEGER_ONE)
+
+Skeleton.register_coercion(Rational, "from_rational")
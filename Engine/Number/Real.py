@@ -1,22 +1,54 @@
-from Engine.Number import Skeleton
-from Engine.Number.Rational import Rational, RATIONAL_ZERO, RATIONAL_ONE
+from Engine.Algorithm.Ball import Ball, InsufficientPrecision
+from Engine.Algorithm.Decimal import N, power_of_ten
+from Engine.Number import DEFAULT_PRECISION, Skeleton, Number
+from Engine.Number.Rational import Rational, RATIONAL_ZERO, RATIONAL_ONE, integer_value
 from Engine.Number.Irrational import Irrational, IRRATIONAL_ZERO
 
+from typing import Callable, Optional
+
+REAL_GUARD_DIGITS = 8
+
+# Balls that still straddle zero at this many fractional digits are taken
+# to be zero
+REAL_PRECISION_LIMIT = 4096
+
 
 class Real(Skeleton):
-    __rational: Rational
-    __irrational: Irrational
+    # Either a leaf, rational + irrational, or a lazy expression node whose
+    # value is operation applied to the balls of its operands. Nothing is
+    # evaluated until a precision is asked for
+    __slots__ = ("__rational", "__irrational", "__operation", "__operands", "__ball")
+
+    __rational: Optional[Rational]
+    __irrational: Optional[Irrational]
+    __operation: Optional[Callable]
+    __operands: tuple
+    __ball: Optional[Ball]
 
     def __init__(self, rational: Rational = None, irrational: Irrational = None):
-        assert rational != irrational != None
+        assert rational is not None or irrational is not None
         self.__rational = rational
         self.__irrational = irrational
+        self.__operation = None
+        self.__operands = ()
+        self.__ball = None
+
+    @classmethod
+    def from_expression(cls, operation: Callable, *operands) -> "Real":
+        self = object.__new__(cls)
+        self.__rational = None
+        self.__irrational = None
+        self.__operation = operation
+        self.__operands = operands
+        self.__ball = None
+        return self
 
-    def __hash__(self):
-        return hash(("Real", self.rational, self.irrational))
+    # Equality is decided on values to some precision, which no hash can
+    # follow, and hashing the expression would recurse through it
+    __hash__ = None
 
-    # def __str__(self):
-    #     return f"{self.compute()}"
+    def __str__(self):
+        return f"{self.approximate()}"
 
     @classmethod
     def from_string(cls, string):
@@ -46,6 +78,10 @@ class Real(Skeleton):
     def from_irrational(cls, irrational):
         return cls(RATIONAL_ZERO, irrational)
 
+    @classmethod
+    def from_real(cls, real):
+        return real
+
     @property
     def rational(self):
         return self.__rational
@@ -62,6 +98,152 @@ class Real(Skeleton):
     def imaginary(self):
         return None
 
+    @property
+    def operation(self) -> Optional[Callable]:
+        return self.__operation
+
+    @property
+    def operands(self) -> tuple:
+        return self.__operands
+
+    @property
+    def is_expression(self) -> bool:
+        return self.__operation is not None
+
+    def cached_ball(self, precision: int) -> Optional[Ball]:
+        # The last ball is kept, and serves any precision up to its own
+        if self.__ball is not None and self.__ball.precision >= precision:
+            return self.__ball.round(precision)
+        return None
+
+    def leaf_ball(self, precision: int) -> Ball:
+        ball = Ball(0, 0, precision)
+        if self.__rational is not None:
+            ball = ball.add(Ball.from_fraction(
+                integer_value(self.__rational.numerator),
+                integer_value(self.__rational.denominator),
+                precision
+            ))
+        if self.__irrational is not None and self.__irrational is not IRRATIONAL_ZERO:
+            ball = ball.add(Ball(self.__irrational.truncated(precision), 1, precision))
+        return ball
+
+    def ball(self, precision: int) -> Ball:
+        # Post-order over the expression DAG with an explicit stack, so that
+        # long chains such as a sum built in a loop stay off the call stack.
+        # Every node evaluated keeps its ball, shared operands are evaluated
+        # once
+        balls: dict[int, Ball] = {}
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in balls:
+                continue
+            ball = node.cached_ball(precision)
+            if ball is None and node.__operation is None:
+                ball = node.__ball = node.leaf_ball(precision)
+            if ball is not None:
+                balls[id(node)] = ball
+                continue
+
+            if not expanded:
+                stack.append((node, True))
+                stack.extend((x, False) for x in node.__operands if isinstance(x, Real) and id(x) not in balls)
+                continue
+            ball = node.__ball = node.__operation(
+                *[balls[id(x)] if isinstance(x, Real) else x for x in node.__operands]
+            )
+            balls[id(node)] = ball
+        return balls[id(self)]
+
+    def refine(self, n: int) -> Ball:
+        # Starts at n fractional digits plus guard digits and raises the
+        # precision until the radius is below the n-th significant digit
+        precision = n + REAL_GUARD_DIGITS
+        while True:
+            try:
+                ball = self.ball(precision)
+                if ball.radius * power_of_ten(n) < abs(ball.midpoint):
+                    return ball
+                if ball.midpoint:
+                    target = n + REAL_GUARD_DIGITS + precision - N(ball.midpoint)
+                else:
+                    target = 0
+            except InsufficientPrecision:
+                if precision >= REAL_PRECISION_LIMIT:
+                    raise ZeroDivisionError
+                target = 0
+
+            if precision >= REAL_PRECISION_LIMIT:
+                return ball
+            precision = min(max(2 * precision, target), REAL_PRECISION_LIMIT)
+
+    def approximate(self, n: int = DEFAULT_PRECISION) -> Number:
+        # Truncated to n significant digits
+        ball = self.refine(n)
+        midpoint = abs(ball.midpoint)
+        sign = -1 if ball.midpoint < 0 else 1
+        excess = max(N(midpoint) - n, 0)
+        return Number(
+            sign * (midpoint // power_of_ten(excess)),
+            excess - ball.precision
+        )
+
+    def compare(self, other: "Real") -> int:
+        # Sign of self - other, zero when the difference cannot be told
+        # apart from zero at REAL_PRECISION_LIMIT
+        ball = self.subtract(other).refine(1)
+        if ball.contains_zero:
+            return 0
+        return 1 if ball.midpoint > 0 else -1
+
+    def equal(self, other: "Real") -> bool:
+        return self.compare(other) == 0
+
+    def lower(self, other: "Real") -> bool:
+        return self.compare(other) < 0
+
+    def greater(self, other: "Real") -> bool:
+        return self.compare(other) > 0
+
+    def lower_equal(self, other: "Real") -> bool:
+        return self.compare(other) <= 0
+
+    def greater_equal(self, other: "Real") -> bool:
+        return self.compare(other) >= 0
+
+    def absolute(self) -> "Real":
+        return Real.from_expression(Ball.absolute, self)
+
+    def negate(self) -> "Real":
+        return Real.from_expression(Ball.negate, self)
+
+    def add(self, other: "Real") -> "Real":
+        return Real.from_expression(Ball.add, self, other)
+
+    def subtract(self, other: "Real") -> "Real":
+        return Real.from_expression(Ball.subtract, self, other)
+
+    def multiply(self, other: "Real") -> "Real":
+        return Real.from_expression(Ball.multiply, self, other)
+
+    def divide(self, other: "Real") -> "Real":
+        return Real.from_expression(Ball.divide, self, other)
+
+    def to_python_integer(self) -> int:
+        # Exact, for rational leaves with an integral value
+        assert self.__operation is None
+        assert self.__irrational is None or self.__irrational is IRRATIONAL_ZERO
+        rational = self.__rational if self.__rational is not None else RATIONAL_ZERO
+        assert rational.denominator == RATIONAL_ONE.denominator
+        return integer_value(rational.numerator)
+
+    def power(self, other: "Real") -> "Real":
+        # Integral exponents only
+        return Real.from_expression(Ball.power, self, other.to_python_integer())
+
 
 REAL_ZERO = Real(RATIONAL_ZERO)
 REAL_ONE = Real(RATIONAL_ONE)
+
+Skeleton.register_coercion(Real, "from_real")
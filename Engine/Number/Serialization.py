@@ -0,0 +1,334 @@
+from Engine.Algorithm.Encoding import (
+    read_bytes, read_integer, read_signed_varint, read_varint, write_integer, write_signed_varint, write_varint
+)
+
+from typing import Callable, Iterable
+
+# A payload is the header followed by one tagged value, or by a count and
+# that many tagged values for arrays. Numbers are a zigzag varint exponent
+# and a length prefixed two's complement mantissa, and every other type of
+# the tower is a tag followed by the values it is made of
+SERIALIZATION_MAGIC = b"EN"
+SERIALIZATION_VERSION = 1
+
+TAG_INT = 0
+TAG_NUMBER = 1
+TAG_NATURAL = 2
+TAG_INTEGER = 3
+TAG_RATIONAL = 4
+TAG_IRRATIONAL = 5
+TAG_REAL = 6
+TAG_REAL_EXPRESSION = 7
+TAG_IMAGINARY = 8
+TAG_COMPLEX = 9
+TAG_BINARY = 10
+TAG_NUMBER_ARRAY = 11
+
+# Operations of Real expression nodes, by their Ball method
+REAL_OPERATIONS = ("absolute", "negate", "add", "subtract", "multiply", "divide", "power")
+
+# Entry codes of a Real expression, operations are numbered from
+# EXPRESSION_OPERATION on in the order of REAL_OPERATIONS
+EXPRESSION_VALUE = 0
+EXPRESSION_REFERENCE = 1
+EXPRESSION_OPERATION = 2
+
+Writer = Callable[[bytearray, object], None]
+Reader = Callable[[object, int], tuple[object, int]]
+
+WRITERS: dict[type, Writer] = {}
+READERS: dict[int, Reader] = {}
+TOWER_LOADED = False
+
+
+class SerializationError(ValueError):
+    pass
+
+
+def register_serialization(cls: type, tag: int, writer: Writer, reader: Reader) -> None:
+    # writer appends the value without its tag, reader reads it back from a
+    # position just past the tag
+    def tagged(buffer: bytearray, value) -> None:
+        buffer.append(tag)
+        writer(buffer, value)
+
+    WRITERS[cls] = tagged
+    READERS[tag] = reader
+
+
+def write_value(buffer: bytearray, value) -> None:
+    writer = WRITERS.get(type(value))
+    if writer is None:
+        if not TOWER_LOADED:
+            load_tower()
+            return write_value(buffer, value)
+        raise SerializationError(f"cannot serialize {type(value).__name__}")
+    writer(buffer, value)
+
+
+def read_value(data, position: int) -> tuple[object, int]:
+    reader = READERS.get(data[position])
+    if reader is None:
+        if not TOWER_LOADED:
+            load_tower()
+            return read_value(data, position)
+        raise SerializationError(f"unknown tag {data[position]}")
+    return reader(data, position + 1)
+
+
+def read_values(data, position: int, count: int) -> tuple[list, int]:
+    values = []
+    for _ in range(count):
+        value, position = read_value(data, position)
+        values.append(value)
+    return values, position
+
+
+def write_number(buffer: bytearray, number) -> None:
+    write_signed_varint(buffer, number.exponent)
+    write_integer(buffer, number.mantissa)
+
+
+def read_number(data, position: int) -> tuple[tuple[int, int], int]:
+    exponent, position = read_signed_varint(data, position)
+    mantissa, position = read_integer(data, position)
+    return (mantissa, exponent), position
+
+
+def load_tower() -> None:
+    # Registers every type of the tower at the first use, the modules are
+    # not imported before a value has to be written or read
+    global TOWER_LOADED
+    TOWER_LOADED = True
+
+    from Engine.Algorithm.Ball import Ball
+    from Engine.Number import Number
+    from Engine.Number.Binary import Binary
+    from Engine.Number.Complex import Complex
+    from Engine.Number.Imaginary import Imaginary
+    from Engine.Number.Integer import Integer
+    from Engine.Number.Irrational import Irrational, IRRATIONAL_ZERO
+    from Engine.Number.Natural import Natural
+    from Engine.Number.Rational import Rational, RATIONAL_ZERO, integer_value
+    from Engine.Number.Real import Real
+
+    register_serialization(int, TAG_INT, write_integer, read_integer)
+
+    for cls, tag in ((Number, TAG_NUMBER), (Natural, TAG_NATURAL), (Integer, TAG_INTEGER)):
+        def read(data, position: int, cls=cls) -> tuple[Number, int]:
+            (mantissa, exponent), position = read_number(data, position)
+            number = Number(mantissa, exponent)
+            return (number if cls is Number else cls(number)), position
+
+        register_serialization(cls, tag, write_number, read)
+
+    def write_rational(buffer: bytearray, rational: Rational) -> None:
+        write_integer(buffer, integer_value(rational.numerator))
+        write_integer(buffer, integer_value(rational.denominator))
+
+    def read_rational(data, position: int) -> tuple[Rational, int]:
+        numerator, position = read_integer(data, position)
+        denominator, position = read_integer(data, position)
+        return Rational.from_canonical(numerator, denominator), position
+
+    register_serialization(Rational, TAG_RATIONAL, write_rational, read_rational)
+
+    def write_irrational(buffer: bytearray, irrational: Irrational) -> None:
+        # Only irrationals that know how they were built can be rebuilt
+        if irrational.key is None:
+            raise SerializationError("irrational without a key")
+        name, *arguments = irrational.key
+        encoded = name.encode()
+        write_varint(buffer, len(encoded))
+        buffer += encoded
+        write_varint(buffer, len(arguments))
+        for argument in arguments:
+            write_integer(buffer, argument)
+
+    def read_irrational(data, position: int) -> tuple[Irrational, int]:
+        length, position = read_varint(data, position)
+        name, position = read_bytes(data, position, length)
+        name = bytes(name).decode()
+        count, position = read_varint(data, position)
+        arguments = []
+        for _ in range(count):
+            argument, position = read_integer(data, position)
+            arguments.append(argument)
+        return Irrational.from_key((name, *arguments)), position
+
+    register_serialization(Irrational, TAG_IRRATIONAL, write_irrational, read_irrational)
+
+    def write_real(buffer: bytearray, real: Real) -> None:
+        # Leaves and expression nodes share the type but not the tag, so
+        # this writer puts its own tag. The cached ball of a node is not kept
+        if real.is_expression:
+            buffer.append(TAG_REAL_EXPRESSION)
+            write_real_expression(buffer, real)
+            return
+        buffer.append(TAG_REAL)
+        write_value(buffer, real.rational if real.rational is not None else RATIONAL_ZERO)
+        write_value(buffer, real.irrational if real.irrational is not None else IRRATIONAL_ZERO)
+
+    def write_real_expression(buffer: bytearray, real: Real) -> None:
+        # The nodes in post-order with an explicit stack, so that long
+        # chains such as a sum built in a loop stay off the call stack. Each
+        # entry is a value, a reference to an earlier entry for a node met
+        # before, or an operation on the entries left by its operands
+        entries = bytearray()
+        count = 0
+        indices: dict[int, int] = {}
+        stack = [(real, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if isinstance(node, Real) and id(node) in indices:
+                write_varint(entries, EXPRESSION_REFERENCE)
+                write_varint(entries, indices[id(node)])
+            elif not isinstance(node, Real) or not node.is_expression:
+                write_varint(entries, EXPRESSION_VALUE)
+                write_value(entries, node)
+            elif not expanded:
+                stack.append((node, True))
+                stack.extend((x, False) for x in reversed(node.operands))
+                continue
+            else:
+                name = node.operation.__name__
+                if name not in REAL_OPERATIONS or getattr(Ball, name) is not node.operation:
+                    raise SerializationError(f"unknown operation {name!r}")
+                write_varint(entries, EXPRESSION_OPERATION + REAL_OPERATIONS.index(name))
+                write_varint(entries, len(node.operands))
+            if isinstance(node, Real):
+                indices.setdefault(id(node), count)
+            count += 1
+        write_varint(buffer, count)
+        buffer += entries
+
+    def read_real(data, position: int) -> tuple[Real, int]:
+        rational, position = read_value(data, position)
+        irrational, position = read_value(data, position)
+        return Real(rational, irrational), position
+
+    def read_real_expression(data, position: int) -> tuple[Real, int]:
+        count, position = read_varint(data, position)
+        entries = []
+        stack = []
+        for _ in range(count):
+            code, position = read_varint(data, position)
+            if code == EXPRESSION_VALUE:
+                value, position = read_value(data, position)
+            elif code == EXPRESSION_REFERENCE:
+                index, position = read_varint(data, position)
+                if index >= len(entries):
+                    raise SerializationError("reference to a later entry")
+                value = entries[index]
+            else:
+                if code - EXPRESSION_OPERATION >= len(REAL_OPERATIONS):
+                    raise SerializationError(f"unknown operation {code - EXPRESSION_OPERATION}")
+                operands, position = read_varint(data, position)
+                if operands > len(stack):
+                    raise SerializationError("missing operands")
+                value = Real.from_expression(
+                    getattr(Ball, REAL_OPERATIONS[code - EXPRESSION_OPERATION]), *stack[len(stack) - operands:]
+                )
+                del stack[len(stack) - operands:]
+            entries.append(value)
+            stack.append(value)
+        if len(stack) != 1:
+            raise SerializationError("malformed expression")
+        return stack[0], position
+
+    WRITERS[Real] = write_real
+    READERS[TAG_REAL] = read_real
+    READERS[TAG_REAL_EXPRESSION] = read_real_expression
+
+    def read_imaginary(data, position: int) -> tuple[Imaginary, int]:
+        value, position = read_value(data, position)
+        return Imaginary(value), position
+
+    register_serialization(
+        Imaginary, TAG_IMAGINARY, lambda buffer, imaginary: write_value(buffer, imaginary.value), read_imaginary
+    )
+
+    def write_complex(buffer: bytearray, complex: Complex) -> None:
+        write_value(buffer, complex.real)
+        write_value(buffer, complex.imaginary)
+
+    def read_complex(data, position: int) -> tuple[Complex, int]:
+        (real, imaginary), position = read_values(data, position, 2)
+        return Complex(real, imaginary), position
+
+    register_serialization(Complex, TAG_COMPLEX, write_complex, read_complex)
+
+    def write_binary(buffer: bytearray, binary: Binary) -> None:
+        write_signed_varint(buffer, binary.exponent)
+        write_signed_varint(buffer, binary.fives)
+        write_integer(buffer, binary.mantissa)
+
+    def read_binary(data, position: int) -> tuple[Binary, int]:
+        exponent, position = read_signed_varint(data, position)
+        fives, position = read_signed_varint(data, position)
+        mantissa, position = read_integer(data, position)
+        return Binary.from_canonical(mantissa, exponent, fives), position
+
+    register_serialization(Binary, TAG_BINARY, write_binary, read_binary)
+
+    def read_number_array(data, position: int):
+        # NumberArray needs numpy, and registers its own writer when imported
+        from Engine.Number.NumberArray import NumberArray
+        return NumberArray.read(data, position)
+
+    READERS.setdefault(TAG_NUMBER_ARRAY, read_number_array)
+
+
+def write_header(buffer: bytearray) -> None:
+    buffer += SERIALIZATION_MAGIC
+    write_varint(buffer, SERIALIZATION_VERSION)
+
+
+def read_header(data) -> int:
+    if bytes(data[:len(SERIALIZATION_MAGIC)]) != SERIALIZATION_MAGIC:
+        raise SerializationError("not a serialized number")
+    version, position = read_varint(data, len(SERIALIZATION_MAGIC))
+    if version != SERIALIZATION_VERSION:
+        raise SerializationError(f"unsupported serialization version {version}")
+    return position
+
+
+def dumps(value) -> bytes:
+    buffer = bytearray()
+    write_header(buffer)
+    write_value(buffer, value)
+    return bytes(buffer)
+
+
+def loads(data) -> object:
+    data = memoryview(data)
+    try:
+        value, position = read_value(data, read_header(data))
+    except IndexError:
+        raise SerializationError("truncated") from None
+    if position != len(data):
+        raise SerializationError("trailing bytes")
+    return value
+
+
+def dumps_array(values: Iterable) -> bytes:
+    # Any mix of values in one buffer
+    values = list(values)
+    buffer = bytearray()
+    write_header(buffer)
+    write_varint(buffer, len(values))
+    for value in values:
+        write_value(buffer, value)
+    return bytes(buffer)
+
+
+def loads_array(data) -> list:
+    data = memoryview(data)
+    try:
+        count, position = read_varint(data, read_header(data))
+        values, position = read_values(data, position, count)
+    except IndexError:
+        raise SerializationError("truncated") from None
+    if position != len(data):
+        raise SerializationError("trailing bytes")
+    return values
@@ -1,13 +1,34 @@
-from Engine.Algorithm.Division import number_division, number_floor_division
-from Engine.Number.Operation import N
-
+from Engine.Algorithm.Decimal import aligned_add, aligned_sum, power_of_ten, strip_trailing_zeros
+from Engine.Algorithm.DecimalString import format_digits, parse_digits, write_digits
+from Engine.Algorithm.Division import decimal_division, decimal_floor_division
+from Engine.Algorithm.Exponentiation import power
+from Engine.Algorithm.Multiplication import multiply
+from Engine.Algorithm.Interning import InterningCache
+
+import importlib
 from abc import ABC, abstractmethod, abstractproperty, abstractclassmethod
+from typing import Callable, Iterable, TextIO
 
 DEFAULT_PRECISION = 15
-DEFAULT_PRECISION_TAYLOR_POLYNOMIAL = 5
+
+# Loaded on first access through __getattr__, so importing the package only
+# pays for Number itself
+SUBMODULES = (
+    "Binary", "Complex", "ComplexArray", "Context", "Imaginary", "Integer", "Irrational",
+    "Natural", "NumberArray", "Operation", "Rational", "Real", "Serialization"
+)
+
+COERCIONS: dict[type, str] = {}
+COERCION_TABLES: dict[type, dict[type, Callable]] = {}
+
+
+class CoercionError(TypeError):
+    pass
 
 
 class Skeleton(ABC):
+    __slots__ = ()
+
     def __eq__(self, other):
         if type(other) is not type(self):
             other = self.upgrade(other)
@@ -79,30 +100,40 @@ class Skeleton(ABC):
             other = self.upgrade(other)
         return self.modulus(other)
 
+    @staticmethod
+    def register_coercion(source: type, constructor: str) -> None:
+        # Operands of type source are upgraded by the classmethod named
+        # constructor on the target type, when the target defines one
+        COERCIONS[source] = constructor
+        COERCION_TABLES.clear()
+
+    @classmethod
+    def coercion_table(cls) -> dict[type, Callable]:
+        table = COERCION_TABLES.get(cls)
+        if table is None:
+            table = {
+                source: getattr(cls, constructor)
+                for source, constructor in COERCIONS.items()
+                if hasattr(cls, constructor)
+            }
+            table[cls] = lambda x: x
+            COERCION_TABLES[cls] = table
+        return table
+
     @classmethod
     def upgrade(cls, other):
-        from Engine.Number.Natural import Natural
-        from Engine.Number.Integer import Integer
-        from Engine.Number.Rational import Rational
-        from Engine.Number.Irrational import Irrational
-        from Engine.Number.Real import Real
-        from Engine.Number.Imaginary import Imaginary
-        wrapper = {
-            cls: lambda x: x,
-            str: cls.from_string,
-            int: cls.from_python_integer,
-            Number: cls.from_number,
-            Natural: cls.from_natural,
-            Integer: cls.from_integer,
-            Rational: cls.from_rational,
-            Irrational: cls.from_irrational,
-            Real: cls.from_real,
-            Imaginary: cls.from_imaginary
-        }
-        try:
-            return wrapper[type(other)](other)
-        except:
-            raise Exception
+        coercion = cls.coercion_table().get(type(other))
+        if coercion is None:
+            raise CoercionError(
+                f"cannot upgrade {type(other).__name__} to {cls.__name__}"
+            )
+        return coercion(other)
+
+    def __reduce__(self):
+        # Pickles through the binary serialization, which keeps constants
+        # such as pi identical after loading
+        from Engine.Number.Serialization import dumps, loads
+        return loads, (dumps(self),)
 
     @abstractproperty
     def real(self):
@@ -114,36 +145,80 @@ class Skeleton(ABC):
 
 
 class Number(Skeleton):
+    __slots__ = ("__mantissa", "__exponent")
+
     __mantissa: int
     __exponent: int
 
-    def __init__(self, mantissa: int, exponent: int):
+    interned: InterningCache = InterningCache()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.interned = InterningCache()
+
+    def __new__(cls, mantissa: int, exponent: int):
+        index = cls.interned.index(mantissa, exponent)
+        if index is not None:
+            self = cls.interned.get(index)
+            if self is not None:
+                return self
+
+        # Numbers are kept in canonical form: no trailing zeros in the
+        # mantissa and a zero exponent for zero
+        if mantissa == 0:
+            exponent = 0
+        else:
+            mantissa, zeros = strip_trailing_zeros(mantissa)
+            exponent += zeros
+
+        self = cls.from_canonical(mantissa, exponent)
+        if index is not None:
+            cls.interned.put(index, self)
+        return self
+
+    @classmethod
+    def from_canonical(cls, mantissa: int, exponent: int) -> "Number":
+        # Skips normalization, the caller guarantees the canonical form
+        self = object.__new__(cls)
         self.__mantissa = mantissa
         self.__exponent = exponent
+        return self
 
     def __hash__(self):
-        x = self.reduce()
-        return hash(("Number", x.mantissa, x.exponent))
+        return hash(("Number", self.mantissa, self.exponent))
 
     def __str__(self) -> str:
-        return f"{self.mantissa}e{self.exponent}"
+        return f"{format_digits(self.mantissa)}e{self.exponent}"
+
+    def write(self, file: TextIO) -> None:
+        # As __str__, streamed to file without building the digit string
+        write_digits(self.mantissa, file)
+        file.write(f"e{self.exponent}")
 
     @classmethod
     def from_string(cls, string: str) -> "Number":
-        if "e" in string:
-            mantissa, exponent = [int(_) for _ in string.split("e")]
-            return cls(
-                mantissa,
-                exponent
-            )
-        elif "." in string:
-            _, fractional = [int(_) for _ in string.split(".")]
-            return cls(
-                int(string.replace(".", "")),
-                -N(fractional)
-            )
-        else:
-            raise Exception
+        # [sign] digits [. digits] [e [sign] digits], any size
+        significand, e, exponent = string.strip().lower().partition("e")
+        if e and not exponent.lstrip("+-")[-1:].isdigit():
+            raise ValueError(f"invalid number {string!r}")
+        exponent = int(exponent) if e else 0
+
+        sign = 1
+        if significand[:1] in ("+", "-"):
+            sign = -1 if significand[0] == "-" else 1
+            significand = significand[1:]
+        integer, point, fractional = significand.partition(".")
+        digits = integer + fractional
+        if not digits or not (digits.isascii() and digits.isdigit()):
+            raise ValueError(f"invalid number {string!r}")
+
+        # Trailing zeros are moved to the exponent before parsing, so the
+        # mantissa is already canonical
+        stripped = digits.rstrip("0")
+        exponent += len(digits) - len(stripped) - len(fractional)
+        if not stripped:
+            return NUMBER_ZERO
+        return cls(sign * parse_digits(stripped), exponent)
 
     @classmethod
     def from_python_integer(cls, python_integer: int) -> "Number":
@@ -152,6 +227,25 @@ class Number(Skeleton):
             0
         )
 
+    @classmethod
+    def from_number(cls, number: "Number") -> "Number":
+        return Number(number.mantissa, number.exponent)
+
+    @classmethod
+    def from_natural(cls, natural: "Natural") -> "Number":
+        return Number(natural.mantissa, natural.exponent)
+
+    @classmethod
+    def from_integer(cls, integer: "Integer") -> "Number":
+        return Number(integer.mantissa, integer.exponent)
+
+    @classmethod
+    def sum(cls, numbers: Iterable["Number"]) -> "Number":
+        numbers = [x if isinstance(x, Number) else cls.upgrade(x) for x in numbers]
+        return Number(
+            *aligned_sum([(x.mantissa, x.exponent) for x in numbers])
+        )
+
     @property
     def mantissa(self) -> int:
         return self.__mantissa
@@ -170,40 +264,32 @@ class Number(Skeleton):
 
     @property
     def is_integer(self) -> bool:
-        x = self.reduce()
-        return x.exponent >= 0
+        return self.exponent >= 0
 
     @property
     def is_fractional(self) -> bool:
         return not self.is_integer
 
-    # TODO: See if there is a more efficient way to do this
     def reduce(self) -> "Number":
-        n = max(i for i in range(N(self.mantissa))
-                if abs(self.mantissa) % pow(10, i) == 0)
-
-        mantissa = abs(self.mantissa) // pow(10, n)
-        exponent = self.exponent + n
-
-        return Number(
-            mantissa,
-            exponent
-        )
+        return self
 
     def equal(self, other: "Number") -> bool:
-        x = self.reduce()
-        y = other.reduce()
-
-        return x.mantissa == y.mantissa and x.exponent == y.exponent
+        return self.mantissa == other.mantissa and self.exponent == other.exponent
 
     def lower(self, other: "Number") -> bool:
-        x = self.reduce()
-        y = other.reduce()
+        x_sign = (self.mantissa > 0) - (self.mantissa < 0)
+        y_sign = (other.mantissa > 0) - (other.mantissa < 0)
+
+        if x_sign != y_sign:
+            return x_sign < y_sign
 
-        minimum_exponent = min(x.exponent, y.exponent)
+        if self.exponent == other.exponent:
+            return self.mantissa < other.mantissa
 
-        x_mantissa = x.mantissa * pow(10, x.exponent - minimum_exponent)
-        y_mantissa = y.mantissa * pow(10, y.exponent - minimum_exponent)
+        minimum_exponent = min(self.exponent, other.exponent)
+
+        x_mantissa = self.mantissa * power_of_ten(self.exponent - minimum_exponent)
+        y_mantissa = other.mantissa * power_of_ten(other.exponent - minimum_exponent)
 
         return x_mantissa < y_mantissa
 
@@ -223,11 +309,8 @@ class Number(Skeleton):
         )
 
     def add(self, other: "Number") -> "Number":
-        minimun_exponent = min(self.exponent, other.exponent)
         return Number(
-            (self.mantissa * pow(10, self.exponent - minimun_exponent)) +
-            (other.mantissa * pow(10, other.exponent - minimun_exponent)),
-            minimun_exponent
+            *aligned_add(self.mantissa, self.exponent, other.mantissa, other.exponent)
         )
 
     def negate(self) -> "Number":
@@ -237,39 +320,48 @@ class Number(Skeleton):
         )
 
     def subtract(self, other: "Number") -> "Number":
-        return self.add(other.negate())
+        return Number(
+            *aligned_add(self.mantissa, self.exponent, -other.mantissa, other.exponent)
+        )
 
     def multiply(self, other: "Number") -> "Number":
         return Number(
-            self.mantissa * other.mantissa,
+            multiply(self.mantissa, other.mantissa),
             self.exponent + other.exponent
         )
 
-    # TODO: Implement efficient exponentiation
     def power(self, other: "Number") -> "Number":
         assert other.is_integer and other >= NUMBER_ZERO
+        n = other.mantissa * power_of_ten(other.exponent)
         return Number(
-            self.mantissa ** other.mantissa,
-            self.exponent * other.mantissa
+            power(self.mantissa, n),
+            self.exponent * n
         )
 
     def invert(self, n: int = DEFAULT_PRECISION) -> "Number":
         if self == NUMBER_ZERO:
             raise ZeroDivisionError
 
-        return number_division(NUMBER_ONE, self)
+        return Number(
+            *decimal_division(1, 0, self.mantissa, self.exponent, n)
+        )
 
-    def divide(self, other: "Number") -> "Number":
+    def divide(self, other: "Number", n: int = DEFAULT_PRECISION) -> "Number":
         if other == NUMBER_ZERO:
             raise ZeroDivisionError
 
-        return number_division(self, other)
+        return Number(
+            *decimal_division(self.mantissa, self.exponent, other.mantissa, other.exponent, n)
+        )
 
     def floor_divide(self, other: "Number") -> "Number":
         if other == NUMBER_ZERO:
             raise ZeroDivisionError
 
-        return number_floor_division(self, other)
+        return Number(
+            decimal_floor_division(self.mantissa, self.exponent, other.mantissa, other.exponent),
+            0
+        )
 
     def modulus(self, other: "Number") -> "Number":
         assert self.is_integer and self >= NUMBER_ZERO
@@ -283,3 +375,13 @@ class Number(Skeleton):
 
 NUMBER_ZERO = Number(0, 0)
 NUMBER_ONE = Number(1, 0)
+
+Skeleton.register_coercion(str, "from_string")
+Skeleton.register_coercion(int, "from_python_integer")
+Skeleton.register_coercion(Number, "from_number")
+
+
+def __getattr__(name: str):
+    if name in SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,9 @@
+import importlib
+
+SUBMODULES = ("Algorithm", "Benchmark", "Number")
+
+
+def __getattr__(name: str):
+    if name in SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,7 @@
-from Engine.Number.Number import Numeric, NUMERIC_ZERO, NUMERIC_ONE, Complex
+from Engine.Number import NUMBER_ONE
 from Engine.Number.Operation import factorial, sin, cos
 
-x = NUMERIC_ONE
-print(factorial(1))
+x = NUMBER_ONE
+print(factorial(x))
 print(sin(x))
 print(cos(x))